@@ -0,0 +1,495 @@
+""" Benchmarks of the create, search and render paths of codenotes
+
+Seeds synthetic databases with the number of tasks and notes of each size, and times the same code the commands run.
+The results are written as JSON, so they can be compared between commits::
+
+    python benchmarks/run.py --sizes 1000,100000 --output before.json
+    git checkout other-branch
+    python benchmarks/run.py --sizes 1000,100000 --compare before.json
+
+The seeded databases are kept in the data directory and reused while the schema version doesn't change. Every size
+is benchmarked on a copy of them, because creating tasks writes to the database.
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from datetime import date, timedelta
+from itertools import islice
+from typing import Any, Callable, Final, Iterator, Optional
+from unittest import mock
+
+ROOT_DIR: Final[str] = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import codenotes  # noqa: E402
+import codenotes.cli  # noqa: E402
+import codenotes.db.utilities.notes as notes  # noqa: E402
+import codenotes.db.utilities.notes_categories as notes_categories  # noqa: E402
+import codenotes.db.utilities.tasks as tasks  # noqa: E402
+import codenotes.db.utilities.tasks_categories as tasks_categories  # noqa: E402
+from codenotes import parse_args  # noqa: E402
+from codenotes.cli.category import SearchCategory  # noqa: E402
+from codenotes.cli.notes import SearchNote  # noqa: E402
+from codenotes.cli.tasks import CreateTask, SearchTask  # noqa: E402
+from codenotes.db import connection  # noqa: E402
+from codenotes.db.migrations import SCHEMA_VERSION  # noqa: E402
+from codenotes.db.repository import TaskRepository, _select_annotations  # noqa: E402
+from rich.console import Console  # noqa: E402
+
+DEFAULT_SIZES: Final[str] = "1000,100000,1000000"
+DEFAULT_DATA_DIR: Final[str] = os.path.join(tempfile.gettempdir(), "codenotes-benchmarks")
+
+SEED: Final[int] = 2021
+BATCH_SIZE: Final[int] = 10000
+DAYS: Final[int] = 365  # Creation dates are spread over the last year
+
+WORDS: Final[tuple[str, ...]] = (
+    "lorem", "ipsum", "dolor", "sit", "amet", "consectetur", "adipiscing", "elit", "sed", "do", "eiusmod", "tempor",
+    "incididunt", "labore", "dolore", "magna", "aliqua", "enim", "minim", "veniam", "quis", "nostrud", "ullamco",
+    "laboris", "nisi", "aliquip", "commodo", "consequat", "duis", "aute", "irure", "reprehenderit", "voluptate",
+    "velit", "esse", "cillum", "fugiat", "nulla", "pariatur", "excepteur", "sint", "occaecat", "cupidatat",
+)
+RARE_WORD: Final[str] = "benchmark"  # Appears in 1% of the annotations, used by the text searches
+INFIX_TEXT: Final[str] = RARE_WORD[2:-2]  # Middle of the rare word, only found by the infix and GLOB searches
+CREATE_BATCH: Final[int] = 100  # Tasks saved by each CreateTask
+
+
+def categories_count(size: int) -> int:
+    """Returns the number of categories of each type of annotation seeded for a size"""
+    return max(10, size // 1000)
+
+
+def sentence(rng: random.Random, words: int) -> str:
+    """Returns a random text of the words passed, with the rare word 1% of the times"""
+    text = " ".join(rng.choices(WORDS, k=words))
+    if rng.random() < 0.01:
+        text = f"{text} {RARE_WORD}"
+    return text
+
+
+def task_rows(rng: random.Random, size: int, categories: int) -> Iterator[tuple[Any, ...]]:
+    """Generates the values of the tasks seeded"""
+    today = date.today()
+
+    for _ in range(size):
+        yield (
+            sentence(rng, rng.randint(3, 12)),
+            rng.randint(0, 2),
+            today - timedelta(days=rng.randrange(DAYS)),
+            rng.randint(1, categories),
+        )
+
+
+def note_rows(rng: random.Random, size: int, categories: int) -> Iterator[tuple[Any, ...]]:
+    """Generates the values of the notes seeded, a tenth of them written in markdown"""
+    today = date.today()
+
+    for _ in range(size):
+        markdown = rng.random() < 0.1
+        content = "\n\n".join(sentence(rng, rng.randint(10, 40)) for _ in range(rng.randint(1, 4)))
+
+        yield (
+            sentence(rng, rng.randint(2, 4))[:30],
+            f"# Note\n\n- {content}" if markdown else content,
+            rng.randint(1, categories),
+            int(markdown),
+            today - timedelta(days=rng.randrange(DAYS)),
+        )
+
+
+def seed_database(path: str, size: int) -> None:
+    """Creates a database with the number of tasks and notes of the size
+
+    Parameters
+    ----------
+    path: str
+        Path of the database created
+
+    size: int
+        Number of tasks, and of notes, stored
+    """
+    rng = random.Random(SEED)
+    categories = categories_count(size)
+    db = connection.SQLiteConnection(path)
+
+    for table in (tasks_categories, notes_categories):
+        # The first category is the default one, created by the migrations
+        db.exec_many(
+            f"INSERT INTO {table.TABLE_NAME} ({table.COLUMN_NAME}) VALUES (?)",
+            ((f"Category {number}",) for number in range(2, categories + 1)),
+        )
+
+    statements = (
+        (
+            f"INSERT INTO {tasks.TABLE_NAME} ({tasks.COLUMN_CONTENT}, {tasks.COLUMN_STATUS}, "
+            f"{tasks.COLUMN_CREATION}, {tasks.COLUMN_CATEGORY}) VALUES (?,?,?,?)",
+            task_rows(rng, size, categories),
+        ),
+        (
+            f"INSERT INTO {notes.TABLE_NAME} ({notes.COLUMN_TITLE}, {notes.COLUMN_CONTENT}, "
+            f"{notes.COLUMN_CATEGORY}, {notes.COLUMN_README}, {notes.COLUMN_CREATION}) VALUES (?,?,?,?,?)",
+            note_rows(rng, size, categories),
+        ),
+    )
+
+    for sql, rows in statements:
+        while batch := list(islice(rows, BATCH_SIZE)):
+            db.exec_many(sql, batch)
+            db.commit()
+
+    db.exec_sql("ANALYZE")
+    db.commit()
+    db.close()
+
+
+def prepare_database(data_dir: str, size: int) -> str:
+    """Returns a copy of the seeded database of the size, seeding it the first time
+
+    Parameters
+    ----------
+    data_dir: str
+        Directory where the seeded databases are kept
+
+    size: int
+        Number of tasks and notes of the database
+
+    Returns
+    -------
+    path: str
+        Path of the copy, that can be modified by the benchmarks
+    """
+    os.makedirs(data_dir, exist_ok=True)
+    seeded_path = os.path.join(data_dir, f"seed-{size}-v{SCHEMA_VERSION}.db")
+
+    if not os.path.exists(seeded_path):
+        print(f"Seeding {size} tasks and notes...", file=sys.stderr)
+        temporary_path = f"{seeded_path}.tmp"
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+
+        seed_database(temporary_path, size)
+        os.replace(temporary_path, seeded_path)
+
+    work_path = os.path.join(data_dir, f"work-{size}.db")
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(work_path + suffix):
+            os.remove(work_path + suffix)
+
+    shutil.copyfile(seeded_path, work_path)
+    return work_path
+
+
+def measure(function: Callable[[], Any], rounds: int, warmup: int = 1) -> dict[str, Any]:
+    """Times a function
+
+    Parameters
+    ----------
+    function: Callable[[], Any]
+        Function timed
+
+    rounds: int
+        Number of times the function is timed
+
+    warmup: int
+        Number of times the function is executed before timing it
+
+    Returns
+    -------
+    stats: dict[str, Any]
+        Rounds, and min, median, mean and max time in seconds
+    """
+    for _ in range(warmup):
+        function()
+
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+
+    return {
+        "rounds": rounds,
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.fmean(times),
+        "max": max(times),
+    }
+
+
+def consume(cursor: Iterator[Any]) -> int:
+    """Reads all the rows of a cursor, and returns how many were read"""
+    return sum(1 for _ in cursor)
+
+
+def search_task(arguments: list[str]) -> SearchTask:
+    """Returns a SearchTask of the arguments, without displaying the tasks found"""
+    with redirect_stdout(io.StringIO()):
+        search = SearchTask(parse_args(["task", "search", *arguments, "--limit", "0", "--format", "jsonl"]))
+    search.limit = None
+    return search
+
+
+def scan_tasks(text: str) -> Callable[[], Any]:
+    """Returns a function that searches tasks by infix without the trigram index, as in the databases created with
+    SQLite older than 3.34"""
+    select = _select_annotations(tasks, tasks_categories, TaskRepository.COLUMNS, text=text, match="infix")
+
+    return lambda: consume(connection.get_connection().exec_sql(select.sql(), select.values()))
+
+
+def search_category(arguments: list[str]) -> SearchCategory:
+    """Returns a SearchCategory of the arguments, without displaying the categories found"""
+    with redirect_stdout(io.StringIO()):
+        search = SearchCategory(parse_args(["category", "search", *arguments, "--format", "jsonl"]))
+    return search
+
+
+def create_tasks(category: str) -> Callable[[], Any]:
+    """Returns a function that creates a batch of tasks in a category, as task create does"""
+    text = ";".join(f"Benchmark task {number}" for number in range(CREATE_BATCH)).split()
+    args = parse_args(["task", "create", *text, "--category", category])
+
+    return lambda: CreateTask(args)
+
+
+def render_notes(arguments: list[str], render_cache: bool = True) -> Callable[[], Any]:
+    """Returns a function that searches and displays notes, as note search does. Without the render cache, the
+    markdown notes are parsed every time"""
+    args = parse_args(["note", "search", *arguments])
+
+    if render_cache:
+        return lambda: SearchNote(args)
+
+    def render() -> None:
+        with mock.patch.dict(os.environ, {"CODENOTES_RENDER_CACHE_SIZE": "0"}):
+            SearchNote(args)
+
+    return render
+
+
+def run_cli(arguments: list[str], database_path: str) -> Callable[[], Any]:
+    """Returns a function that runs codenotes in a new interpreter"""
+    environment = {**os.environ, "CODENOTES_DB": database_path, "PYTHONPATH": ROOT_DIR}
+    command = [sys.executable, "-m", "codenotes", *arguments]
+
+    return lambda: subprocess.run(
+        command, env=environment, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True
+    )
+
+
+def benchmark_cases(size: int, category: str, limit: list[str], rounds: int) -> Iterator[dict[str, Any]]:
+    """Runs the benchmarks of the code of the commands, with the shared connection open
+
+    Parameters
+    ----------
+    size: int
+        Number of tasks and notes of the database
+
+    category: str
+        Name of the category used by the searches by category
+
+    limit: list[str]
+        Arguments that limit the notes displayed by the rendering benchmarks
+
+    rounds: int
+        Number of times each benchmark is timed
+
+    Returns
+    -------
+    results: Iterator[dict[str, Any]]
+        Result of each benchmark
+    """
+    cases: list[tuple[str, Callable[[], Any]]] = [
+        ("CreateTask.save", create_tasks(category)),
+        ("SearchTask.sql_query[ever]", lambda search=search_task(["--ever"]): consume(search.sql_query())),
+        ("SearchTask.sql_query[month]", lambda search=search_task(["--month"]): consume(search.sql_query())),
+        (
+            "SearchTask.sql_query[category]",
+            lambda search=search_task(["--ever", "--category", category]): consume(search.sql_query()),
+        ),
+        ("SearchTask.sql_query[text]", lambda search=search_task([RARE_WORD, "--ever"]): consume(search.sql_query())),
+        (
+            "SearchTask.sql_query[infix]",
+            lambda search=search_task([INFIX_TEXT, "--match", "infix", "--ever"]): consume(search.sql_query()),
+        ),
+        ("SearchTask.sql_query[infix-scan]", scan_tasks(INFIX_TEXT)),
+        (
+            "SearchTask.sql_query[glob]",
+            lambda search=search_task([f"*{INFIX_TEXT}*", "--match", "glob", "--ever"]): consume(search.sql_query()),
+        ),
+        ("SearchNote.search[ever]", render_notes(["--ever", *limit])),
+        ("SearchNote.search[uncached]", render_notes(["--ever", *limit], render_cache=False)),
+        ("SearchNote.search[text]", render_notes([RARE_WORD, "--ever", *limit])),
+        ("SearchNote.search[sort]", render_notes(["--ever", "--sort", "date", "--desc", *limit])),
+        ("SearchNote.search[infix]", render_notes([INFIX_TEXT, "--match", "infix", "--ever", "--compact", *limit])),
+        ("SearchCategory.sql_query[all]", lambda search=search_category(["--all"]): search.sql_query()),
+        ("SearchCategory.sql_query[text]", lambda search=search_category(["1", "--all"]): search.sql_query()),
+    ]
+
+    for name, function in cases:
+        print(f"  {name}", file=sys.stderr)
+        yield {"benchmark": name, "size": size, **measure(function, rounds)}
+
+
+def benchmark_size(size: int, database_path: str, rounds: int, render_limit: int) -> Iterator[dict[str, Any]]:
+    """Runs the benchmarks on a seeded database
+
+    Parameters
+    ----------
+    size: int
+        Number of tasks and notes of the database
+
+    database_path: str
+        Path of the database
+
+    rounds: int
+        Number of times each benchmark is timed
+
+    render_limit: int
+        Max number of notes displayed by the rendering benchmarks
+
+    Returns
+    -------
+    results: Iterator[dict[str, Any]]
+        Result of each benchmark
+    """
+    connection.set_database_path(database_path)
+    limit = ["--limit", str(render_limit)]
+    category = f"Category {categories_count(size) // 2}"
+
+    # The cases are built with the connection open, because building them reads the database: opened outside, the
+    # connection wouldn't be closed and the next size would be measured on this database
+    with connection.shared_connection() as db:
+        for table in (tasks, notes):
+            rows_count = db.exec_sql(f"SELECT count(*) FROM {table.TABLE_NAME}").fetchone()[0]
+            assert rows_count == size, f"{database_path} has {rows_count} rows in {table.TABLE_NAME}, not {size}"
+
+        yield from benchmark_cases(size, category, limit, rounds)
+
+    cli_cases = [
+        ("cli.startup[version]", run_cli(["--version"], database_path)),
+        ("cli.startup[task search]", run_cli(["task", "search", "--today"], database_path)),
+    ]
+    for name, function in cli_cases:
+        print(f"  {name}", file=sys.stderr)
+        yield {"benchmark": name, "size": size, **measure(function, rounds)}
+
+
+def compare(results: list[dict[str, Any]], baseline_path: str, threshold: float) -> list[dict[str, Any]]:
+    """Adds to the results the median of the baseline and its change
+
+    Parameters
+    ----------
+    results: list[dict[str, Any]]
+        Results of the benchmarks
+
+    baseline_path: str
+        Path of the JSON written by a previous run
+
+    threshold: float
+        Change of the median (0.1 is 10% slower) from which a benchmark is reported as a regression
+
+    Returns
+    -------
+    regressions: list[dict[str, Any]]
+        Results slower than the baseline by more than the threshold
+    """
+    with open(baseline_path, "r", encoding="utf-8") as baseline_file:
+        baseline = {(result["benchmark"], result["size"]): result for result in json.load(baseline_file)["results"]}
+
+    regressions = []
+    for result in results:
+        previous = baseline.get((result["benchmark"], result["size"]))
+
+        if previous is not None:
+            result["baseline_median"] = previous["median"]
+            result["change"] = result["median"] / previous["median"] - 1
+
+            if result["change"] > threshold:
+                regressions.append(result)
+
+    return regressions
+
+
+def git_commit() -> Optional[str]:
+    """Returns the commit of the repository benchmarked, if it's available"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=ROOT_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def parse_benchmark_args(args: Optional[list[str]] = None) -> argparse.Namespace:
+    """Parses the arguments of the benchmark runner"""
+    parser = argparse.ArgumentParser(description="Benchmarks of codenotes, with the results written as JSON")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="Number of tasks and notes seeded, separated by commas")
+    parser.add_argument("--rounds", type=int, default=5, help="Times each benchmark is timed")
+    parser.add_argument("--render-limit", type=int, default=1000, help="Max notes displayed by the render benchmarks")
+    parser.add_argument("--data-dir", default=DEFAULT_DATA_DIR, help="Directory where the seeded databases are kept")
+    parser.add_argument("--output", "-o", help="File where the results are written (Default standard output)")
+    parser.add_argument("--compare", help="Results of a previous run, compared with the ones of this run")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Slowdown reported as regression (Default 0.1)")
+
+    return parser.parse_args(args)
+
+
+def main(args: Optional[list[str]] = None) -> int:
+    args = parse_benchmark_args(args)
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    # The notes rendered are cached in the data directory, filled by the warmup of each benchmark
+    os.environ["XDG_CACHE_HOME"] = os.path.join(args.data_dir, "cache")
+
+    # Everything displayed is rendered as in a terminal, but discarded
+    devnull = open(os.devnull, "w", encoding="utf-8")
+    codenotes.cli._console = Console(file=devnull, width=120, force_terminal=True, color_system="truecolor")
+
+    results = []
+    for size in sizes:
+        print(f"Size {size}", file=sys.stderr)
+        database_path = prepare_database(args.data_dir, size)
+        results.extend(benchmark_size(size, database_path, args.rounds, args.render_limit))
+
+    regressions = compare(results, args.compare, args.threshold) if args.compare else []
+
+    report = {
+        "codenotes": codenotes.__version__,
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump(report, output_file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+    for result in regressions:
+        print(
+            f"Regression: {result['benchmark']} ({result['size']}) is {result['change']:.0%} slower",
+            file=sys.stderr,
+        )
+
+    devnull.close()
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
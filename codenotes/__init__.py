@@ -1,16 +1,42 @@
 import argparse
-import logging
 import sys
-from typing import Optional
-
-import codenotes.util.help as help_text
-from codenotes.cli import PrintFormatted
-from codenotes.cli.category import CreateCategory, SearchCategory
-from codenotes.cli.notes import CreateNote, SearchNote
-from codenotes.cli.tasks import CreateTask, SearchTask
+from importlib import import_module
+from typing import Final, Optional
 
 __version__ = "1.0a2"
 
+# Module and class in charge of each action of the annotations. The modules (and rich) are imported only when the
+# action is dispatched, so commands like --version don't pay for them
+COMMANDS: Final[dict[tuple[str, Optional[str]], tuple[str, str]]] = {
+    ("task", "create"): ("codenotes.cli.tasks", "CreateTask"),
+    ("task", "search"): ("codenotes.cli.tasks", "SearchTask"),
+    ("task", "import"): ("codenotes.cli.tasks", "ImportTask"),
+    ("note", "create"): ("codenotes.cli.notes", "CreateNote"),
+    ("note", "search"): ("codenotes.cli.notes", "SearchNote"),
+    ("note", "import"): ("codenotes.cli.notes", "ImportNote"),
+    ("note", "show"): ("codenotes.cli.notes", "ShowNote"),
+    ("category", "create"): ("codenotes.cli.category", "CreateCategory"),
+    ("category", "search"): ("codenotes.cli.category", "SearchCategory"),
+    ("stats", None): ("codenotes.cli.stats", "Stats"),
+    ("backup", None): ("codenotes.cli.backup", "Backup"),
+    ("export", None): ("codenotes.cli.backup", "Export"),
+    ("restore", None): ("codenotes.cli.backup", "Restore"),
+    ("serve", None): ("codenotes.cli.serve", "Serve"),
+}
+
+# Keys of --sort of the searches of each annotation, besides category (see SORT_COLUMNS of codenotes.db.utilities)
+TASK_SORT_KEYS: Final[tuple[str, ...]] = ("category", "date", "status")
+NOTE_SORT_KEYS: Final[tuple[str, ...]] = ("category", "date", "title")
+
+# Ways the text of the searches is matched (see MATCHES of codenotes.db.repository)
+TEXT_MATCHES: Final[tuple[str, ...]] = ("words", "infix", "glob")
+
+# Periods in which the annotations are counted by stats (see PERIODS of codenotes.db.repository)
+STATS_PERIODS: Final[tuple[str, ...]] = ("day", "week", "month")
+
+# Formats in which the results of the searches can be written (see codenotes.util.formats.write_rows)
+OUTPUT_FORMATS: Final[tuple[str, ...]] = ("json", "jsonl", "csv", "tsv")
+
 
 def parse_args(sys_args: list) -> argparse.Namespace:
     """Function incharge to declare the Argumen Parser and add arguments to it
@@ -29,6 +55,10 @@ def parse_args(sys_args: list) -> argparse.Namespace:
     parser = argparse.ArgumentParser(prog="codenotes")
     parser.add_argument("--version", "-v", action="version", version=__version__)
     parser.add_argument("--log", action="store_true")
+
+    database = parser.add_mutually_exclusive_group()
+    database.add_argument("--db", type=str, action="store")
+    database.add_argument("--store", type=str, action="store")
     subparsers = parser.add_subparsers(dest="subargs")  # Types of annotation
 
     # === Task ===
@@ -54,6 +84,20 @@ def parse_args(sys_args: list) -> argparse.Namespace:
     task_search_group.add_argument("--month", "-m", action="store_true")
     task_search_group.add_argument("--ever", "-e", action="store_true")
 
+    task_search.add_argument("--limit", "-l", type=int, action="store")
+    task_search.add_argument("--offset", "-o", type=int, action="store")
+    task_search.add_argument("--after", "-a", type=int, action="store")
+    task_search.add_argument("--sort", type=str, choices=TASK_SORT_KEYS, default="category", action="store")
+    task_search.add_argument("--desc", action="store_true")
+    task_search.add_argument("--match", type=str, choices=TEXT_MATCHES, default="words", action="store")
+    task_search.add_argument("--format", "-f", type=str, choices=OUTPUT_FORMATS, action="store")
+
+    # === Import Task ===
+    task_import = task_actions.add_parser("import")
+    task_import.add_argument("file", type=str, nargs="?", action="store")
+    task_import.add_argument("--format", "-f", type=str, choices=["lines", "csv", "jsonl"], action="store")
+    task_import.add_argument("--category", "-c", type=str, nargs="*", action="store")
+
     # === Note ===
 
     note = subparsers.add_parser("note")
@@ -78,6 +122,25 @@ def parse_args(sys_args: list) -> argparse.Namespace:
     note_search_group.add_argument("--month", "-m", action="store_true")
     note_search_group.add_argument("--ever", "-e", action="store_true")
 
+    note_search.add_argument("--limit", "-l", type=int, action="store")
+    note_search.add_argument("--offset", "-o", type=int, action="store")
+    note_search.add_argument("--after", "-a", type=int, action="store")
+    note_search.add_argument("--sort", type=str, choices=NOTE_SORT_KEYS, default="category", action="store")
+    note_search.add_argument("--desc", action="store_true")
+    note_search.add_argument("--match", type=str, choices=TEXT_MATCHES, default="words", action="store")
+    note_search.add_argument("--format", "-f", type=str, choices=OUTPUT_FORMATS, action="store")
+    note_search.add_argument("--compact", action="store_true")  # Only titles, see note show
+
+    # === Import Note ===
+    note_import = note_actions.add_parser("import")
+    note_import.add_argument("directory", type=str, action="store")
+    note_import.add_argument("--category", "-c", type=str, nargs="*", action="store")
+    note_import.add_argument("--workers", "-w", type=int, action="store")
+
+    # === Show Note ===
+    note_show = note_actions.add_parser("show")
+    note_show.add_argument("id", type=int, action="store")
+
     # === Category ===
 
     category = subparsers.add_parser("category")
@@ -96,17 +159,47 @@ def parse_args(sys_args: list) -> argparse.Namespace:
     category_search = category_actions.add_parser("search")
     category_search.add_argument("text", type=str, nargs="*", action="store")
 
+    category_search.add_argument("--format", "-f", type=str, choices=OUTPUT_FORMATS, action="store")
+
     category_search_annotation = category_search.add_mutually_exclusive_group()
     category_search_annotation.add_argument("--note", "-n", action="store_true")
     category_search_annotation.add_argument("--task", "-t", action="store_true")
     category_search_annotation.add_argument("--all", "-a", action="store_true")
 
+    # === Stats ===
+    stats = subparsers.add_parser("stats")
+    stats.add_argument("--by", "-b", type=str, choices=STATS_PERIODS, default="month", action="store")
+    stats.add_argument("--format", "-f", type=str, choices=OUTPUT_FORMATS, action="store")
+
+    stats_annotation = stats.add_mutually_exclusive_group()
+    stats_annotation.add_argument("--note", "-n", action="store_true")
+    stats_annotation.add_argument("--task", "-t", action="store_true")
+
+    # === Backup ===
+    backup = subparsers.add_parser("backup")
+    backup.add_argument("path", type=str, action="store")
+    backup.add_argument("--pages", "-p", type=int, action="store")
+    backup.add_argument("--force", action="store_true")
+
+    export = subparsers.add_parser("export")
+    export.add_argument("path", type=str, action="store")  # - writes to the standard output
+
+    restore = subparsers.add_parser("restore")
+    restore.add_argument("path", type=str, action="store")  # - reads from the standard input
+    restore.add_argument("--force", action="store_true")
+
+    # === Serve ===
+    serve = subparsers.add_parser("serve")
+    serve.add_argument("--socket", type=str, action="store")
+
     parser.error = print_usage
 
     return parser.parse_args(sys_args)
 
 
 def enable_logging() -> None:
+    import logging
+
     logging.basicConfig(
         filename="codenotes.log",
         format="%(asctime)s-%(name)s-%(levelname)s:%(message)s",
@@ -123,41 +216,65 @@ def print_usage(error_message: Optional[str] = None) -> None:
     error_message: Optional[str]
         Error message through
     """
+    import codenotes.util.help as help_text
+    from codenotes.cli import PrintFormatted
+
     if error_message is not None:
         PrintFormatted.custom_print(f"[red]{error_message}[/red]")
 
     PrintFormatted.print_help(help_text.CLI_USAGE_TEXT)
 
 
+def run_command(args: argparse.Namespace, module_name: str, class_name: str) -> None:
+    """Imports the class in charge of the action and runs it with the database selected
+
+    Parameters
+    ----------
+    args: Namespace
+        Arguments capture by argparse
+
+    module_name: str
+        Module where the class is
+
+    class_name: str
+        Name of the class in charge of the action
+    """
+    from codenotes.config import database_path
+    from codenotes.db.connection import set_database_path, shared_connection
+    from codenotes.exceptions import InvalidConfigError
+
+    try:
+        if args.db is not None or args.store is not None:
+            set_database_path(database_path(args.db, args.store))
+
+        with shared_connection():  # Every class of the command uses the same connection
+            getattr(import_module(module_name), class_name).set_args(args)
+
+    except InvalidConfigError as error:
+        from codenotes.cli import PrintFormatted
+
+        PrintFormatted.custom_print(f"[red]❌ {error}[/red]")
+
+
 def main():
     """Main function"""
+    from codenotes.daemon import run_client
+
+    if run_client(sys.argv[1:]):  # The daemon ran the command
+        return
+
     args = parse_args(sys.argv[1:])
     if len(sys.argv) > 1:
 
         if args.log:
             enable_logging()
 
-        if args.subargs == "task":
-            if args.action == "create":
-                CreateTask.set_args(args)
-            elif args.action == "search":
-                SearchTask.set_args(args)
-            else:
-                print_usage()
-
-        elif args.subargs == "note":
-            if args.action == "create":
-                CreateNote.set_args(args)
-            elif args.action == "search":
-                SearchNote.set_args(args)
-            else:
-                print_usage()
-
-        elif args.subargs == "category":
-            if args.action == "create":
-                CreateCategory.set_args(args)
-            if args.action == "search":
-                SearchCategory.set_args(args)
+        command = COMMANDS.get((args.subargs, getattr(args, "action", None)))
+
+        if command is not None:
+            run_command(args, *command)
+        else:
+            print_usage()
 
     else:
         print_usage()
@@ -1,10 +1,12 @@
 from abc import ABC, abstractmethod
 
 from argparse import Namespace
-from typing import Union
+from typing import Iterator, Union
 
-Query = list[tuple]
-QueriesList = list[list[tuple]]
+from codenotes.db.entities import Category, Note, NoteSummary, Task
+
+Query = Union[Iterator[Task], Iterator[Note], Iterator[NoteSummary]]
+QueriesList = list[list[Category]]
 
 
 class CreateABC(ABC):
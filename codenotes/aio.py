@@ -0,0 +1,555 @@
+""" Module with the asynchronous API of codenotes, to use it from asyncio applications
+
+Example::
+
+    async with Codenotes() as codenotes:
+        task = await codenotes.create_task("Write the docs", category="Docs")
+        found = await codenotes.search_tasks("docs")
+
+The work with the database is done in a bounded pool of threads, each one with its own connection, so the event loop
+is never blocked and many coroutines can use the database at the same time: readers don't block each other thanks to
+the WAL journal mode, and writers wait for the lock up to the busy_timeout of the configuration.
+"""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from functools import partial
+from typing import Any, Callable, Final, Optional, TypeVar, final
+
+import codenotes.config as config
+import codenotes.db.utilities.notes_categories as notes_categories
+import codenotes.db.utilities.tasks_categories as tasks_categories
+from codenotes.db.connection import SQLiteConnection
+from codenotes.db.entities import Category, Note, Task
+from codenotes.db.repository import CategoryRepository, NoteRepository, TaskRepository
+from codenotes.exceptions import CategoryNotExistsError
+
+# Categories table of each type of annotation
+ANNOTATIONS: Final[dict[str, str]] = {
+    "task": tasks_categories.TABLE_NAME,
+    "note": notes_categories.TABLE_NAME,
+}
+
+DEFAULT_MAX_WORKERS: Final[int] = 4
+MAX_NAME_LENGTH: Final[int] = 30  # Of categories and note titles
+
+T = TypeVar("T")
+
+
+@final
+class Codenotes:
+    """Class to create and search annotations and categories from coroutines
+
+    Every method is a coroutine that runs its queries in a thread of the pool, in a single transaction, and returns
+    entities (Task, Note and Category) instead of displaying them. The categories are passed by its name; the ones used
+    to create annotations are created when they don't exist.
+
+    Attributes
+    ----------
+    database_path: str
+        Path of the database
+
+    max_workers: int
+        Max number of threads, and connections, used at the same time
+    """
+
+    database_path: str
+    max_workers: int
+
+    def __init__(self, database_path: Optional[str] = None, max_workers: int = DEFAULT_MAX_WORKERS) -> None:
+        """Codenotes Constructor
+
+        Parameters
+        ----------
+        database_path: Optional[str]
+            Path of the database (Default the one of the configuration, see codenotes.config.database_path)
+
+        max_workers: int
+            Max number of threads, and connections, used at the same time (Default 4). A database in memory always
+            uses one, because each connection would have its own database
+        """
+        self.database_path = config.database_path(database_path)
+        self.max_workers = 1 if self.database_path == config.MEMORY_DATABASE else max_workers
+
+        self.__executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="codenotes")
+        self.__local = threading.local()
+        self.__connections: list[SQLiteConnection] = []
+        self.__connections_lock = threading.Lock()
+
+    async def __aenter__(self) -> "Codenotes":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Waits for the queries that are running, and closes the connections"""
+        await asyncio.get_running_loop().run_in_executor(None, self.__executor.shutdown)
+
+        with self.__connections_lock:
+            for db in self.__connections:
+                db.close()
+            self.__connections.clear()
+
+    async def create_task(self, content: str, category: Optional[str] = None) -> Task:
+        """Creates a task
+
+        Parameters
+        ----------
+        content: str
+            Content of the task
+
+        category: Optional[str]
+            Name of the category of the task (Default the default category of tasks)
+
+        Returns
+        -------
+        task: Task
+            Task created
+        """
+        return (await self.create_tasks([content], category))[0]
+
+    async def create_tasks(self, contents: list[str], category: Optional[str] = None) -> list[Task]:
+        """Creates many tasks in the same category, in a single transaction
+
+        Parameters
+        ----------
+        contents: list[str]
+            Content of each task
+
+        category: Optional[str]
+            Name of the category of the tasks (Default the default category of tasks)
+
+        Returns
+        -------
+        tasks: list[Task]
+            Tasks created
+        """
+        contents = [content.strip() for content in contents]
+        if not all(contents):
+            raise ValueError("The content of a task can't be empty")
+
+        if category is not None:
+            category = category.strip()
+
+        return await self.__run(self.__create_tasks, contents, category)
+
+    async def search_tasks(
+        self,
+        text: Optional[str] = None,
+        category: Optional[str] = None,
+        since: Optional[date] = None,
+        until: Optional[date] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        sort: str = "category",
+        descending: bool = False,
+        match: str = "words",
+    ) -> list[Task]:
+        """Searches tasks, ordered by category and the sort key (or relevance, when text is searched without pages)
+
+        Parameters
+        ----------
+        text: Optional[str]
+            Words that the tasks must contain
+
+        category: Optional[str]
+            Name of the category of the tasks
+
+        since: Optional[date]
+            First creation date of the tasks
+
+        until: Optional[date]
+            Last creation date of the tasks
+
+        limit: Optional[int]
+            Max number of tasks returned
+
+        offset: Optional[int]
+            Number of tasks skipped
+
+        sort: str
+            Key used to sort the tasks of each category, category (Default) or date or status
+
+        descending: bool
+            Reverses the order of the tasks
+
+        match: str
+            Way the text is matched, words (Default) or infix (any part of the text) or glob (GLOB pattern)
+
+        Returns
+        -------
+        tasks: list[Task]
+            Tasks found
+
+        Raises
+        ------
+        CategoryNotExistsError
+            When the category doesn't exist
+        """
+        filters = {
+            "text": text,
+            "since": since,
+            "until": until,
+            "limit": limit,
+            "offset": offset,
+            "sort": sort,
+            "descending": descending,
+            "match": match,
+        }
+        return await self.__run(self.__search, TaskRepository, "task", category, filters)
+
+    async def create_note(
+        self,
+        title: str,
+        content: Optional[str] = None,
+        category: Optional[str] = None,
+        markdown: bool = False,
+    ) -> Note:
+        """Creates a note
+
+        Parameters
+        ----------
+        title: str
+            Title of the note (Max. 30 characters)
+
+        content: Optional[str]
+            Content of the note
+
+        category: Optional[str]
+            Name of the category of the note (Default the default category of notes)
+
+        markdown: bool
+            Whether the content is written in markdown
+
+        Returns
+        -------
+        note: Note
+            Note created
+        """
+        title = title.strip()
+        if not title or len(title) > MAX_NAME_LENGTH:
+            raise ValueError(f"The title of a note must have between 1 and {MAX_NAME_LENGTH} characters")
+
+        if category is not None:
+            category = category.strip()
+
+        return await self.__run(self.__create_note, title, content, category, markdown)
+
+    async def search_notes(
+        self,
+        text: Optional[str] = None,
+        category: Optional[str] = None,
+        since: Optional[date] = None,
+        until: Optional[date] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        sort: str = "category",
+        descending: bool = False,
+        match: str = "words",
+    ) -> list[Note]:
+        """Searches notes, ordered by category and the sort key (or relevance, when text is searched without pages)
+
+        Parameters
+        ----------
+        text: Optional[str]
+            Words that the title or content of the notes must contain
+
+        category: Optional[str]
+            Name of the category of the notes
+
+        since: Optional[date]
+            First creation date of the notes
+
+        until: Optional[date]
+            Last creation date of the notes
+
+        limit: Optional[int]
+            Max number of notes returned
+
+        offset: Optional[int]
+            Number of notes skipped
+
+        sort: str
+            Key used to sort the notes of each category, category (Default) or date or title
+
+        descending: bool
+            Reverses the order of the notes
+
+        match: str
+            Way the text is matched, words (Default) or infix (any part of the text) or glob (GLOB pattern)
+
+        Returns
+        -------
+        notes: list[Note]
+            Notes found
+
+        Raises
+        ------
+        CategoryNotExistsError
+            When the category doesn't exist
+        """
+        filters = {
+            "text": text,
+            "since": since,
+            "until": until,
+            "limit": limit,
+            "offset": offset,
+            "sort": sort,
+            "descending": descending,
+            "match": match,
+        }
+        return await self.__run(self.__search, NoteRepository, "note", category, filters)
+
+    async def create_category(self, name: str, annotation: str = "task") -> Category:
+        """Creates a category, if it doesn't exist
+
+        Parameters
+        ----------
+        name: str
+            Name of the category (Max. 30 characters)
+
+        annotation: str
+            Type of annotation of the category (task or note)
+
+        Returns
+        -------
+        category: Category
+            Category created, or the existing one with the same name
+        """
+        return await self.__run(self.__category, annotation, name.strip())
+
+    async def list_categories(self, annotation: str = "task", text: Optional[str] = None) -> list[Category]:
+        """Lists the categories of a type of annotation, in creation order
+
+        Parameters
+        ----------
+        annotation: str
+            Type of annotation of the categories (task or note)
+
+        text: Optional[str]
+            Text that the name of the categories must contain (Default all the categories)
+
+        Returns
+        -------
+        categories: list[Category]
+            Categories found
+        """
+        return await self.__run(lambda db: list(self.__categories(db, annotation).search(text)))
+
+    async def __run(self, function: Callable[..., T], *args: Any) -> T:
+        """Runs a function in a thread of the pool, in a transaction of the connection of the thread
+
+        Parameters
+        ----------
+        function: Callable[..., T]
+            Function that receives the connection and the arguments
+
+        args: Any
+            Arguments passed to the function after the connection
+
+        Returns
+        -------
+        result: T
+            Value returned by the function, after committing the transaction
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.__executor, partial(self.__transaction, function, *args))
+
+    def __transaction(self, function: Callable[..., T], *args: Any) -> T:
+        """Runs a function with the connection of the current thread, committing the changes or rolling them back
+
+        Parameters
+        ----------
+        function: Callable[..., T]
+            Function that receives the connection and the arguments
+
+        args: Any
+            Arguments passed to the function after the connection
+
+        Returns
+        -------
+        result: T
+            Value returned by the function
+        """
+        db = self.__connection()
+
+        try:
+            result = function(db, *args)
+            db.commit()
+            return result
+
+        except BaseException:
+            db.connection.rollback()
+            self.__local.categories.clear()  # They may have categories created by the transaction
+            raise
+
+    def __connection(self) -> SQLiteConnection:
+        """Returns the connection of the current thread, opening it the first time
+
+        Returns
+        -------
+        db: SQLiteConnection
+            Connection of the current thread
+        """
+        db = getattr(self.__local, "db", None)
+
+        if db is None:
+            # Only used by this thread, but closed by close() from another one
+            db = self.__local.db = SQLiteConnection(self.database_path, check_same_thread=False)
+            self.__local.categories = {}
+
+            with self.__connections_lock:
+                self.__connections.append(db)
+        return db
+
+    def __categories(self, db: SQLiteConnection, annotation: str) -> CategoryRepository:
+        """Returns the categories repository of a type of annotation for the connection of the current thread
+
+        Parameters
+        ----------
+        db: SQLiteConnection
+            Connection of the current thread
+
+        annotation: str
+            Type of annotation of the categories (task or note)
+
+        Returns
+        -------
+        categories: CategoryRepository
+            Repository of the categories, which caches their ids
+        """
+        if annotation not in ANNOTATIONS:
+            raise ValueError(f"Unknown annotation: {annotation}")
+
+        table_name = ANNOTATIONS[annotation]
+        if table_name not in self.__local.categories:
+            self.__local.categories[table_name] = CategoryRepository(table_name, db)
+        return self.__local.categories[table_name]
+
+    def __category(self, db: SQLiteConnection, annotation: str, name: str) -> Category:
+        """Returns a category by its name, creating it when it doesn't exist
+
+        Parameters
+        ----------
+        db: SQLiteConnection
+            Connection of the current thread
+
+        annotation: str
+            Type of annotation of the category (task or note)
+
+        name: str
+            Name of the category (Max. 30 characters)
+
+        Returns
+        -------
+        category: Category
+            Category created, or the existing one with the same name
+        """
+        if not name or len(name) > MAX_NAME_LENGTH:
+            raise ValueError(f"The name of a category must have between 1 and {MAX_NAME_LENGTH} characters")
+
+        categories = self.__categories(db, annotation)
+        categories.add_many([name])
+
+        return Category(categories.get_id(name), name)
+
+    def __create_tasks(self, db: SQLiteConnection, contents: list[str], category: Optional[str]) -> list[Task]:
+        """Creates tasks in a category, creating the category when it doesn't exist
+
+        Parameters
+        ----------
+        db: SQLiteConnection
+            Connection of the current thread
+
+        contents: list[str]
+            Content of each task
+
+        category: Optional[str]
+            Name of the category of the tasks (Default the default category of tasks)
+
+        Returns
+        -------
+        tasks: list[Task]
+            Tasks created
+        """
+        category_id = self.__category(db, "task", category).id if category is not None else 1
+
+        return TaskRepository(db).create(contents, category_id)
+
+    def __create_note(
+        self, db: SQLiteConnection, title: str, content: Optional[str], category: Optional[str], markdown: bool
+    ) -> Note:
+        """Creates a note in a category, creating the category when it doesn't exist
+
+        Parameters
+        ----------
+        db: SQLiteConnection
+            Connection of the current thread
+
+        title: str
+            Title of the note
+
+        content: Optional[str]
+            Content of the note
+
+        category: Optional[str]
+            Name of the category of the note (Default the default category of notes)
+
+        markdown: bool
+            Whether the content is written in markdown
+
+        Returns
+        -------
+        note: Note
+            Note created
+        """
+        category_id = self.__category(db, "note", category).id if category is not None else 1
+
+        return NoteRepository(db).create(title, content, category_id, markdown)
+
+    def __search(
+        self,
+        db: SQLiteConnection,
+        repository: type,
+        annotation: str,
+        category: Optional[str],
+        filters: dict[str, Any],
+    ) -> list:
+        """Searches annotations of a type, in an existing category
+
+        Parameters
+        ----------
+        db: SQLiteConnection
+            Connection of the current thread
+
+        repository: type
+            Repository of the annotations (TaskRepository or NoteRepository)
+
+        annotation: str
+            Type of annotation (task or note)
+
+        category: Optional[str]
+            Name of the category of the annotations (Default every category)
+
+        filters: dict[str, Any]
+            Arguments passed to the search of the repository
+
+        Returns
+        -------
+        annotations: list
+            Annotations found
+
+        Raises
+        ------
+        CategoryNotExistsError
+            When the category doesn't exist
+        """
+        if category is not None:
+            category_id = self.__categories(db, annotation).get_id(category)
+            if category_id is None:
+                raise CategoryNotExistsError(f'"{category}" category does not exists')
+            filters["category_id"] = category_id
+
+        return list(repository(db).search(**filters))
@@ -3,21 +3,62 @@ from typing import Optional, final
 from rich.console import Console
 from rich.theme import Theme
 
+_console: Optional[Console] = None
+
+
+def get_console() -> Console:
+    """Returns the (rich) Console shared by the whole process, creating it the first time
+
+    Returns
+    -------
+    console: Console
+        Console used to print everything in the terminal
+    """
+    global _console
+
+    if _console is None:
+        _console = Console()
+    return _console
+
+
+def set_console(console: Optional[Console]) -> Optional[Console]:
+    """Replaces the Console shared by the whole process, used to display the output somewhere else
+
+    Parameters
+    ----------
+    console: Optional[Console]
+        Console used from now on, None to create a new one the next time it's needed
+
+    Returns
+    -------
+    previous_console: Optional[Console]
+        Console used until now
+    """
+    global _console
+
+    previous_console, _console = _console, console
+    return previous_console
+
 
 @final
 class PrintFormatted:
     """Class to display in the terminal beautiful text
 
     This class only has the purpose to print beautiful text using rich package. It is mainly created with @classmethod
-    to print some specific type of text with its own theme
+    to print some specific type of text with its own theme, which is applied to the shared console only while the text
+    is printed
 
     Attributes
     ----------
     console: Console
         (Rich) Console for beatiful printting
+
+    custom_theme: Optional[Theme]
+        Theme used while the text is printed
     """
 
     console: Console
+    custom_theme: Optional[Theme]
 
     def __init__(self, custom_theme: Optional[Theme] = None):
         """PrintFormatted Constructor
@@ -27,11 +68,22 @@ class PrintFormatted:
         custom_theme: Optional[Theme]
             Theme use for Console class
         """
+        self.console = get_console()
+        self.custom_theme = custom_theme
 
-        if custom_theme is not None:
-            self.console = Console(theme=custom_theme)
+    def print(self, text: str) -> None:
+        """Prints the text with the theme of the instance
+
+        Parameters
+        ----------
+        text: str
+            Text with rich format
+        """
+        if self.custom_theme is not None:
+            with self.console.use_theme(self.custom_theme):
+                self.console.print(text)
         else:
-            self.console = Console()
+            self.console.print(text)
 
     @classmethod
     def custom_print(cls, text: str, theme: Theme = None) -> None:
@@ -45,7 +97,7 @@ class PrintFormatted:
             Theme used for the text to be displayed
         """
         print_formatted = cls(theme)
-        print_formatted.console.print(text)
+        print_formatted.print(text)
 
     @classmethod
     def print_category_creation(cls, category: str) -> None:
@@ -61,7 +113,7 @@ class PrintFormatted:
         custom_theme = Theme({"msg": "#31f55f bold", "name": "#616161 italic"})
 
         print_formatted = cls(custom_theme)
-        print_formatted.console.print(custom_txt)
+        print_formatted.print(custom_txt)
 
     @classmethod
     def print_content_storage(cls, content: str, category: str) -> None:
@@ -80,7 +132,7 @@ class PrintFormatted:
         custom_theme = Theme({"msg": "#d898ed bold", "content": "#616161 italic"})
 
         print_formatted = cls(custom_theme)
-        print_formatted.console.print(custom_txt)
+        print_formatted.print(custom_txt)
 
     @classmethod
     def ask_confirmation(cls, text: str) -> bool:
@@ -94,15 +146,18 @@ class PrintFormatted:
         Returns
         -------
         confirmation: bool
-            Return boolean value that indicates the confirmation
+            Return boolean value that indicates the confirmation, False when there's no input to answer it
         """
         print_formatted = cls()
 
         custom_text = text  # Text with rich format
-        answer = print_formatted.console.input(custom_text).strip()
+        try:
+            answer = print_formatted.console.input(custom_text).strip()
 
-        while len(answer) > 0 and answer.lower() != "n" and answer.lower() != "y":
-            answer = print_formatted.console.input(custom_text)
+            while len(answer) > 0 and answer.lower() != "n" and answer.lower() != "y":
+                answer = print_formatted.console.input(custom_text)
+        except EOFError:  # The standard input is closed (or the command is run by the daemon)
+            return False
 
         if answer.lower() == "y":
             return True
@@ -122,11 +177,11 @@ class PrintFormatted:
         custom_theme = Theme({"header": "white bold", "quote": "purple"})
 
         print_formatted = cls(custom_theme)
-        print_formatted.console.print(custom_text)
+        print_formatted.print(custom_text)
 
     @classmethod
     def interruption(cls) -> None:
         custom_text = "[bold red]Interrupted[/bold red]"
 
         print_formatted = cls()
-        print_formatted.console.print(custom_text)
+        print_formatted.print(custom_text)
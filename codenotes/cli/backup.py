@@ -0,0 +1,247 @@
+import os
+import sys
+from argparse import Namespace
+from contextlib import nullcontext
+from typing import IO, final
+
+from rich.console import Console
+
+from codenotes.cli import PrintFormatted, get_console
+from codenotes.config import MEMORY_DATABASE
+from codenotes.db.backup import BACKUP_PAGES, backup_database, export_database, restore_database
+from codenotes.db.connection import SQLiteConnection, get_connection
+from codenotes.exceptions import InvalidBackupError
+
+
+def open_file(path: str, mode: str) -> IO[bytes]:
+    """Opens a file in binary mode, or the standard input or output when the path is -
+
+    Parameters
+    ----------
+    path: str
+        Path of the file, or -
+
+    mode: str
+        Mode of the file (rb or wb)
+
+    Returns
+    -------
+    file: IO[bytes]
+        File opened, the standard input and output are left open when it's closed
+    """
+    if path == "-":
+        stream = sys.stdin if mode == "rb" else sys.stdout
+        return nullcontext(stream.buffer)
+    return open(path, mode)
+
+
+@final
+class Backup:
+    """Class to copy the database into another file while it's being used
+
+    This class only has the purpose to make a backup with the online backup API of SQLite, which copies the database
+    in steps of pages, so the other processes can keep writing while it's copied. The progress is displayed after each
+    step.
+
+    Attributes
+    ----------
+    path: str
+        Path of the copy
+
+    pages: int
+        Number of pages copied in each step
+
+    console: Console
+        (Rich) Console for beatiful printting
+
+    db: SQLiteConnection
+        Connection with the dabatase
+    """
+
+    path: str
+    pages: int
+    console: Console
+    db: SQLiteConnection
+
+    def __init__(self, args: Namespace) -> None:
+        """Backup Constructor
+
+        Parameters
+        ----------
+        args : NameSpace
+            Arguments of argparse
+        """
+        self.console = get_console()
+        self.db = get_connection()
+        self.path = args.path
+        self.pages = args.pages or BACKUP_PAGES
+
+        try:
+            if self.db.database_path != MEMORY_DATABASE and os.path.exists(self.path) and (
+                os.path.samefile(self.path, self.db.database_path)
+            ):
+                PrintFormatted.custom_print("[red]❌ The backup can't replace the database used[/red]")
+
+            elif os.path.exists(self.path) and not args.force:
+                PrintFormatted.custom_print(
+                    f'[red][bold]❌"{self.path}"[/bold] already exists, use --force to replace it[/red]'
+                )
+
+            else:
+                self.backup()
+
+        except KeyboardInterrupt:
+            PrintFormatted.interruption()
+
+        except OSError as error:
+            PrintFormatted.custom_print(f'[red][bold]❌"{self.path}"[/bold] {error.strerror}[/red]')
+
+    @classmethod
+    def set_args(cls, args: Namespace) -> None:
+        """Set args and initialize class
+
+        Parameters
+        ----------
+        args: NameSpace
+            Arguments of argparse
+        """
+        cls(args)
+
+    def backup(self) -> None:
+        """Copies the database, displaying the percentage of pages copied"""
+        with self.console.status("[bold yellow]Backing up...") as status:
+            backup_database(
+                self.db,
+                self.path,
+                self.pages,
+                lambda copied, total: status.update(f"[bold yellow]Backing up... {copied * 100 // total}%"),
+            )
+            status.stop()
+
+        PrintFormatted.custom_print(f"[bold green]✔️ Backup saved in[/bold green] [#616161]{self.path}")
+
+
+@final
+class Export:
+    """Class to export every table of the database as compressed JSON Lines
+
+    This class only has the purpose to write the export in a file, or in the standard output when the path is -, so
+    it can be piped to another machine. The rows are written while they are read from the database.
+
+    Attributes
+    ----------
+    path: str
+        Path of the file, or - for the standard output
+
+    console: Console
+        (Rich) Console for beatiful printting
+
+    db: SQLiteConnection
+        Connection with the dabatase
+    """
+
+    path: str
+    console: Console
+    db: SQLiteConnection
+
+    def __init__(self, args: Namespace) -> None:
+        """Export Constructor
+
+        Parameters
+        ----------
+        args : NameSpace
+            Arguments of argparse
+        """
+        self.console = get_console()
+        self.db = get_connection()
+        self.path = args.path
+
+        try:
+            with open_file(self.path, "wb") as file:
+                rows_count = export_database(self.db, file)
+
+            if self.path != "-":  # Otherwise, the message would be part of the export
+                PrintFormatted.custom_print(
+                    f"[bold green]✔️ Exported {rows_count} rows to[/bold green] [#616161]{self.path}"
+                )
+
+        except KeyboardInterrupt:
+            PrintFormatted.interruption()
+
+        except OSError as error:
+            PrintFormatted.custom_print(f'[red][bold]❌"{self.path}"[/bold] {error.strerror}[/red]')
+
+    @classmethod
+    def set_args(cls, args: Namespace) -> None:
+        """Set args and initialize class
+
+        Parameters
+        ----------
+        args: NameSpace
+            Arguments of argparse
+        """
+        cls(args)
+
+
+@final
+class Restore:
+    """Class to restore an export into the database
+
+    This class only has the purpose to read an export, from a file or from the standard input when the path is -, and
+    store its rows in a single transaction, so a failed restore doesn't change the database.
+
+    Attributes
+    ----------
+    path: str
+        Path of the file, or - for the standard input
+
+    console: Console
+        (Rich) Console for beatiful printting
+
+    db: SQLiteConnection
+        Connection with the dabatase
+    """
+
+    path: str
+    console: Console
+    db: SQLiteConnection
+
+    def __init__(self, args: Namespace) -> None:
+        """Restore Constructor
+
+        Parameters
+        ----------
+        args : NameSpace
+            Arguments of argparse
+        """
+        self.console = get_console()
+        self.db = get_connection()
+        self.path = args.path
+
+        try:
+            with self.console.status("[bold yellow]Restoring...") as status:
+                with open_file(self.path, "rb") as file:
+                    rows_count = restore_database(self.db, file, args.force)
+                status.stop()
+
+            PrintFormatted.custom_print(f"[bold green]✔️ Restored {rows_count} rows")
+
+        except KeyboardInterrupt:
+            PrintFormatted.interruption()
+
+        except InvalidBackupError as error:
+            PrintFormatted.custom_print(f"[red]❌ {error}[/red]")
+
+        except OSError as error:
+            PrintFormatted.custom_print(f'[red][bold]❌"{self.path}"[/bold] {error.strerror}[/red]')
+
+    @classmethod
+    def set_args(cls, args: Namespace) -> None:
+        """Set args and initialize class
+
+        Parameters
+        ----------
+        args: NameSpace
+            Arguments of argparse
+        """
+        cls(args)
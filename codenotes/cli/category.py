@@ -1,5 +1,5 @@
 from argparse import Namespace
-from typing import Final, Union, final
+from typing import Final, Iterator, Optional, Union, final
 
 from rich import box
 from rich.console import Console
@@ -9,11 +9,13 @@ from rich.tree import Tree
 import codenotes.db.utilities.notes_categories as notes_categories
 import codenotes.db.utilities.tasks_categories as task_categories
 from codenotes.abstract import CreateABC, SearchABC
-from codenotes.cli import PrintFormatted
-from codenotes.db.connection import SQLiteConnection
+from codenotes.cli import PrintFormatted, get_console
+from codenotes.db.connection import SQLiteConnection, get_connection
+from codenotes.db.entities import Category
+from codenotes.db.repository import get_category_repository
 from codenotes.exceptions import MissingArgsException
 from codenotes.util.args import format_argument_text
-from codenotes.util.sql import add_conditions_sql
+from codenotes.util.formats import write_rows
 from codenotes.util.text import format_list_text
 
 
@@ -64,6 +66,9 @@ class CreateCategory(CreateABC):
 
     Attributes
     ----------
+    PRINT_LIMIT: Final[int]
+        Max number of categories created at once that are printed one by one, instead of a summary
+
     category: Union[list[str], str]
         Single or list of category names that will be stored
 
@@ -83,6 +88,8 @@ class CreateCategory(CreateABC):
         Connection with the dabatase
     """
 
+    PRINT_LIMIT: Final[int] = 20
+
     category: Union[list[str], str]
     category_table_name: str
     category_id_column: str
@@ -98,8 +105,8 @@ class CreateCategory(CreateABC):
         args : NameSpace
             Arguments of argparse
         """
-        self.console = Console()
-        self.db = SQLiteConnection()
+        self.console = get_console()
+        self.db = get_connection()
 
         try:
             if create_args_empty(args):
@@ -157,16 +164,7 @@ class CreateCategory(CreateABC):
         exists: bool
             Boolean value flag if the category already exists
         """
-        sql = (
-            f"SELECT {self.category_id_column} FROM {self.category_table_name} WHERE "
-            f"{self.category_name_column} = '{category_name}'"
-        )
-        query = self.db.exec_sql(sql)
-        categories_list: list[tuple] = query.fetchall()
-
-        if categories_list:  # categories_list == []
-            return True
-        return False
+        return get_category_repository(self.category_table_name).exists(category_name)
 
     def show_preview(self) -> None:
         """Displays a table with the categories that will be stored"""
@@ -188,36 +186,33 @@ class CreateCategory(CreateABC):
             self.save()
 
     def save(self) -> None:
-        """Stores the categories in the database"""
+        """Stores the categories in the database
 
-        sql = f"INSERT INTO {self.category_table_name} ({self.category_name_column}) VALUES(?)"
+        The categories are created in bulk: repeated names are removed, the existing ones are looked up at once and
+        the new ones are inserted with a single statement, all in one transaction
+        """
+        repository = get_category_repository(self.category_table_name)
+        # TODO: Validate if len of the category is 30
+        category_names = self.category if isinstance(self.category, list) else [self.category]
+        category_names = list(dict.fromkeys(category_names))  # Without repeated names, in the same order
 
         with self.console.status("[bold yellow]Saving Category...") as status:
-            if isinstance(self.category, list):
-                # TODO: Validate if len of the category is 30
-                for category in self.category:
-                    if not self.category_exists(category):
-                        values = (category,)
-                        self.db.exec_sql(sql, values)
+            created_names = repository.add_many(category_names)
 
+            if len(category_names) <= self.PRINT_LIMIT:
+                for category in category_names:
+                    if category in created_names:
                         PrintFormatted.print_category_creation(category)
 
                     else:
                         PrintFormatted.custom_print(
                             f'❌ [bold] [red]"{category}"[/bold] already exists'
                         )
-
-            elif isinstance(self.category, str):
-                if not self.category_exists(self.category):
-                    values = (self.category,)
-                    self.db.exec_sql(sql, values)
-
-                    PrintFormatted.print_category_creation(self.category)
-
-                else:
-                    PrintFormatted.custom_print(
-                        f'❌ [bold] [red]"{self.category}"[/bold] already exists'
-                    )
+            else:
+                PrintFormatted.custom_print(
+                    f"[bold green]Created {len(created_names)} categories[/bold green] "
+                    f"[#616161]({len(category_names) - len(created_names)} already existed)"
+                )
 
             if self.category:
                 self.console.print("[bold green]✔️ Category Saved")
@@ -228,7 +223,6 @@ class CreateCategory(CreateABC):
             status.stop()
 
         self.db.commit()
-        self.db.close()
 
 
 class SearchCategory(SearchABC):
@@ -252,14 +246,11 @@ class SearchCategory(SearchABC):
     search_category: str
         Name of the category that will be searched in the type of annotations
 
-    category_table_name: str
-        Name of the annotation type table where the categories will be searched
-
-    category_id_column: str
-        Name of the annotation type id column used to check if a category already exists
+    category_table_name: Union[list[str], str]
+        Name of the annotation type table, or tables, where the categories will be searched
 
-    category_name_column: str
-        Name of the annotation type name column where the categories will be seached
+    output_format: Optional[str]
+        Machine-readable format (json, jsonl, csv or tsv) used to write the categories instead of displaying them
     """
 
     ANNOTATIONS_TYPES: Final[list[str]] = ["Tasks", "Notes"]
@@ -268,8 +259,7 @@ class SearchCategory(SearchABC):
     db: SQLiteConnection
     search_category: str
     category_table_name: Union[list[str], str]
-    category_id_column: Union[list[str], str]
-    category_name_column: Union[list[str], str]
+    output_format: Optional[str] = None
 
     def __init__(self, args: Namespace) -> None:
         """SearchCategory Constructor
@@ -279,13 +269,14 @@ class SearchCategory(SearchABC):
         args : NameSpace
             Arguments of argparse
         """
-        self.console = Console()
-        self.db = SQLiteConnection()
+        self.console = get_console()
+        self.db = get_connection()
         try:
             if search_args_empty(args):
                 raise MissingArgsException
 
             self.search_category = format_argument_text(args.text)
+            self.output_format = args.format
 
             self.__get_category_table(args)
 
@@ -309,7 +300,7 @@ class SearchCategory(SearchABC):
         cls(args)
 
     def __get_category_table(self, args: Namespace) -> None:
-        """Sets a single or a list of table names and columns to search the category in the types of annations
+        """Sets a single or a list of table names to search the category in the types of annations
 
         Parameters
         ----------
@@ -318,69 +309,78 @@ class SearchCategory(SearchABC):
         """
         if args.note:
             self.category_table_name = notes_categories.TABLE_NAME
-            self.category_id_column = notes_categories.COLUMN_ID
-            self.category_name_column = notes_categories.COLUMN_NAME
 
         elif args.task:
             self.category_table_name = task_categories.TABLE_NAME
-            self.category_id_column = task_categories.COLUMN_ID
-            self.category_name_column = task_categories.COLUMN_NAME
 
         elif args.all:
             self.category_table_name = [
                 task_categories.TABLE_NAME,
                 notes_categories.TABLE_NAME,
             ]
-            self.category_id_column = [
-                task_categories.COLUMN_ID,
-                notes_categories.COLUMN_ID,
-            ]
-            self.category_name_column = [
-                task_categories.COLUMN_NAME,
-                notes_categories.COLUMN_NAME,
-            ]
 
     def category_exists(self, category_name: str) -> bool:
         # TODO: Check if category typed exists in any type of annotation
         pass
 
-    def sql_query(self) -> list[list[tuple]]:
-        """Makes a query of related information of tasks, and also adds more statements to the main sql
-        sql
+    def sql_query(self) -> list[list[Category]]:
+        """Searches the categories of each type of annotation
 
         Returns
         -------
-        query: list[list[tuple]]
-            Query done to the database
+        query: list[list[Category]]
+            Categories found of each type of annotation, in creation order
         """
-        query_list = []
+        return [self.__search_table(table_name) for table_name in self.__tables()]
 
+    def __tables(self) -> list[str]:
+        """Returns the table of each type of annotation where the categories are searched
+
+        Returns
+        -------
+        tables: list[str]
+            Name of the categories table of each type of annotation
+        """
         if isinstance(self.category_table_name, str):
-            sql = f"SELECT {self.category_name_column} FROM {self.category_table_name}"
+            return [self.category_table_name]
 
-            if self.search_category:
-                sql = add_conditions_sql(
-                    sql, f'{self.category_name_column} LIKE "%{self.search_category}%"'
-                )
+        return list(self.category_table_name)
+
+    def __search_table(self, table_name: str) -> list[Category]:
+        """Searches the categories of a type of annotation
 
-            query_list.append(self.db.exec_sql(sql).fetchall())
+        Parameters
+        ----------
+        table_name: str
+            Name of the annotation type table where the categories are searched
 
-        elif isinstance(self.category_table_name, list):
-            for i in range(len(self.ANNOTATIONS_TYPES)):
-                sql = f"SELECT {self.category_name_column[i]} FROM {self.category_table_name[i]}"
+        Returns
+        -------
+        categories: list[Category]
+            Categories found, in creation order
+        """
+        return list(get_category_repository(table_name).search(self.search_category))
 
-                if self.search_category:
-                    sql = add_conditions_sql(
-                        sql,
-                        f'{self.category_name_column[i]} LIKE "%{self.search_category}%"',
-                    )
+    def __export_rows(self) -> Iterator[tuple[str, str]]:
+        """Reads the categories found of every type of annotation
 
-                query_list.append(self.db.exec_sql(sql).fetchall())
+        Returns
+        -------
+        rows: Iterator[tuple[str, str]]
+            Type of annotation and name of each category
+        """
+        for table_name in self.__tables():
+            annotation = "task" if table_name == task_categories.TABLE_NAME else "note"
 
-        return query_list
+            for category in get_category_repository(table_name).search(self.search_category):
+                yield annotation, category.name
 
     def search(self) -> None:
         """Displays a tree with tables as child nodes with the categories searched"""
+        if self.output_format is not None:
+            write_rows(self.__export_rows(), ("annotation", "name"), self.output_format)
+            return
+
         root = Tree("📒[bold blue] List of Categories Found")
         query = self.sql_query()
 
@@ -392,8 +392,8 @@ class SearchCategory(SearchABC):
                 table = Table()
                 table.add_column("Name")
 
-                for categories in categories_list:
-                    table.add_row(categories[0])
+                for category in categories_list:
+                    table.add_row(category.name)
 
                 child_branch.add(table)
                 i += 1
@@ -1,39 +1,41 @@
+import os
 from argparse import Namespace
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, datetime
-from typing import Any, Optional, Union, final
+from typing import Final, Iterator, Optional, Union, final
 
 from rich.console import Console
-from rich.markdown import Markdown
+from rich.markup import escape
 from rich.panel import Panel
 from rich.theme import Theme
 from rich.tree import Tree
 
+import codenotes.db.utilities.note_imports as note_imports
 import codenotes.db.utilities.notes as notes
 import codenotes.db.utilities.notes_categories as categories
 import codenotes.util.help as help_text
 from codenotes.abstract import CreateABC, SearchABC
-from codenotes.cli import PrintFormatted
-from codenotes.db.connection import SQLiteConnection
+from codenotes.cli import PrintFormatted, get_console
+from codenotes.cli.render_cache import CachedMarkdown, RenderCache
+from codenotes.config import render_cache_size
+from codenotes.db.connection import SQLiteConnection, get_connection
+from codenotes.db.entities import Note, NoteSummary
+from codenotes.db.repository import NoteRepository, get_category_repository
 from codenotes.exceptions import CategoryNotExistsError, MissingArgsException
 from codenotes.util.args import (date_args_empty, dates_to_search,
                                  format_argument_text)
-from codenotes.util.sql import add_conditions_sql
+from codenotes.util.formats import write_rows
 
 
-def sorter(query: tuple) -> Any:
-    """Function used to get the key that will be used in the built-in function sorted()
+# Names of the columns of the notes when written in other formats
+DETAIL_COLUMNS_NAMES: Final[tuple[str, ...]] = ("id", "title", "content", "category", "markdown", "creation")
+SUMMARY_COLUMNS_NAMES: Final[tuple[str, ...]] = ("id", "title", "category", "creation")
 
-    Parameters
-    ----------
-    query: tuple
-        Row from the query done to the database, which contains the variables that will be used to sort the query
+# Extensions of the files imported by note import
+MARKDOWN_EXTENSIONS: Final[tuple[str, ...]] = (".md", ".markdown")
 
-    Returns
-    -------
-    key: Any
-        Returns the key that will be used
-    """
-    return query[2]
+# Max length of the titles of notes and the names of categories
+MAX_NAME_LENGTH: Final[int] = 30
 
 
 def create_args_empty(args: Namespace) -> bool:
@@ -99,8 +101,8 @@ class CreateNote(CreateABC):
         args : NameSpace
             Arguments of argparse
         """
-        self.console = Console()
-        self.db = SQLiteConnection()
+        self.console = get_console()
+        self.db = get_connection()
         self.creation_date = datetime.now().date()
 
         try:
@@ -122,6 +124,9 @@ class CreateNote(CreateABC):
         except KeyboardInterrupt:
             PrintFormatted.interruption()
 
+        except EOFError:  # A title or category too long, and no input to ask for another (closed, or in the daemon)
+            PrintFormatted.custom_print("[red]❌ No input to answer the prompt, the command was cancelled[/red]")
+
         except MissingArgsException:
             PrintFormatted.print_help(help_text.ADD_NOTE_USAGE_TEXT)
 
@@ -191,10 +196,7 @@ class CreateNote(CreateABC):
                     custom_theme,
                 )
             else:
-                sql = f"INSERT INTO {categories.TABLE_NAME} ({categories.COLUMN_NAME}) VALUES (?)"
-                cursor = self.db.exec_sql(sql, (self.category_name,))
-
-                self.category_id = cursor.lastrowid
+                self.category_id = get_category_repository(categories.TABLE_NAME).add(self.category_name)
 
                 self.db.commit()
                 PrintFormatted.print_category_creation(self.category_name)
@@ -215,15 +217,10 @@ class CreateNote(CreateABC):
         exists: bool
             Boolean value flag if the category already exists
         """
-        sql = (
-            f"SELECT {categories.COLUMN_ID} FROM {categories.TABLE_NAME} WHERE "
-            f"{categories.COLUMN_NAME} = '{category_name}'"
-        )
-        query = self.db.exec_sql(sql)
-        categories_list: list[tuple] = query.fetchall()
+        category_id = get_category_repository(categories.TABLE_NAME).get_id(category_name)
 
-        if categories_list:  # # categories_list == (id,)
-            self.category_id = categories_list[0][0]
+        if category_id is not None:
+            self.category_id = category_id
             return True
         return False
 
@@ -265,7 +262,6 @@ class CreateNote(CreateABC):
             status.stop()
 
         self.db.commit()
-        self.db.close()
 
 
 @final
@@ -288,13 +284,40 @@ class SearchNote(SearchABC):
         Date or list of dates to search the notes
 
     search_text: str
-        Text to search in the title of the notes
+        Text to search in the title and content of the notes
 
     search_category: str
         Name of the category where the notes will be searched
 
     search_category_id : int
         Id of the category where the notes will be searched
+
+    limit: Optional[int]
+        Max number of notes displayed
+
+    offset: Optional[int]
+        Number of notes skipped before the first one displayed
+
+    after: Optional[int]
+        Id of the note after which the search continues (keyset pagination in the order of the search)
+
+    sort: str
+        Key used to sort the notes of each category (category, date or title)
+
+    descending: bool
+        Reverses the order of the notes
+
+    match: str
+        Way the text is matched (words, infix or glob)
+
+    output_format: Optional[str]
+        Machine-readable format (json, jsonl, csv or tsv) used to write the notes instead of displaying them
+
+    compact: bool
+        Lists only the id, title and creation date of the notes, without reading its content
+
+    render_cache: RenderCache
+        Cache of the notes rendered as markdown
     """
 
     console: Console
@@ -303,6 +326,15 @@ class SearchNote(SearchABC):
     search_text: str
     search_category: str = None
     search_category_id: int = None
+    limit: Optional[int] = None
+    offset: Optional[int] = None
+    after: Optional[int] = None
+    sort: str = "category"
+    descending: bool = False
+    match: str = "words"
+    output_format: Optional[str] = None
+    compact: bool = False
+    render_cache: RenderCache
 
     def __init__(self, args: Namespace) -> None:
         """SearchNote constructor
@@ -312,10 +344,19 @@ class SearchNote(SearchABC):
         args: Namespace
             Arguments of argparse
         """
-        self.console = Console()
-        self.db = SQLiteConnection()
+        self.console = get_console()
+        self.db = get_connection()
         self.search_date = dates_to_search(args)
         self.search_text = format_argument_text(args.text)
+        self.limit = args.limit
+        self.offset = args.offset
+        self.after = args.after
+        self.sort = args.sort
+        self.descending = args.desc
+        self.match = args.match
+        self.output_format = args.format
+        self.compact = args.compact
+        self.render_cache = RenderCache(render_cache_size())
 
         try:
             if date_args_empty(args):
@@ -361,101 +402,508 @@ class SearchNote(SearchABC):
         exists: bool
             Boolean value flag if the category already exists
         """
-        sql = (
-            f"SELECT {categories.COLUMN_ID} FROM {categories.TABLE_NAME} WHERE "
-            f"{categories.COLUMN_NAME} = '{category_name}'"
-        )
-        query = self.db.exec_sql(sql)
-        categories_list: list[tuple] = query.fetchall()
+        category_id = get_category_repository(categories.TABLE_NAME).get_id(category_name)
 
-        if categories_list:  # categories_list == (id,)
-            self.search_category_id = categories_list[0][0]
+        if category_id is not None:
+            self.search_category_id = category_id
             return True
         return False
 
-    def sql_query(self) -> list[tuple]:
-        """Makes a query of related information of notes, and also adds more statements to the main sql
+    def sql_query(self) -> Union[Iterator[Note], Iterator[NoteSummary]]:
+        """Searches the notes with the filters of the arguments
 
         Returns
         -------
-        query: list[tuple]
-            Query done to the database
+        query: Union[Iterator[Note], Iterator[NoteSummary]]
+            Notes found (its summaries when the search is compact), ordered by category, read from the database while
+            they are iterated
+
+        Raises
+        ------
+        CategoryNotExistsError
+            When the category searched doesn't exist
         """
-        sql = (
-            f"SELECT {notes.TABLE_NAME}.{notes.COLUMN_TITLE}, {notes.TABLE_NAME}.{notes.COLUMN_CONTENT}, "
-            f"{categories.TABLE_NAME}.{categories.COLUMN_NAME}, "
-            f"{notes.TABLE_NAME}.{notes.COLUMN_README}, {notes.TABLE_NAME}.{notes.COLUMN_CREATION} FROM "
-            f"{notes.TABLE_NAME} INNER JOIN {categories.TABLE_NAME} ON "
-            f"{notes.TABLE_NAME}.{notes.COLUMN_CATEGORY} = {categories.TABLE_NAME}.{categories.COLUMN_ID}"
-        )
-
-        if self.search_date:
-            if isinstance(self.search_date, date):
-                sql = add_conditions_sql(
-                    sql, f'{notes.COLUMN_CREATION} LIKE date("{self.search_date}")'
-                )
-
-            elif isinstance(self.search_date, list):
-                first_day, last_day = self.search_date
-                sql = add_conditions_sql(
-                    sql,
-                    f'{notes.COLUMN_CREATION} BETWEEN date("{first_day}") '
-                    f'AND date("{last_day}")',
-                )
-
-        if self.search_text:
-            sql = add_conditions_sql(
-                sql, f'{notes.COLUMN_TITLE} LIKE "%{self.search_text}%"', "AND"
-            )
+        filters = {
+            "text": self.search_text,
+            "after": self.after,
+            "limit": self.limit,
+            "offset": self.offset,
+            "sort": self.sort,
+            "descending": self.descending,
+            "match": self.match,
+        }
+
+        if isinstance(self.search_date, date):
+            filters["since"] = filters["until"] = self.search_date
+
+        elif isinstance(self.search_date, list):
+            filters["since"], filters["until"] = self.search_date
 
         if self.search_category:
             if not self.category_exists(self.search_category):
                 raise CategoryNotExistsError
+            filters["category_id"] = self.search_category_id
 
-            sql = add_conditions_sql(
-                sql, f"{notes.COLUMN_CATEGORY} = {self.search_category_id}", "AND"
+        if self.compact:
+            return NoteRepository(self.db).search_summaries(**filters)
+        return NoteRepository(self.db).search(**filters)
+
+    def search(self) -> None:
+        """Displays the notes searched one category at a time, while they are read from the database
+
+        The notes are ordered by category by the query, so only the notes of the category being displayed are kept
+        in memory. When the number of notes displayed reaches the limit, it shows the id to use with --after to get
+        the next page
+        """
+        if self.output_format is not None and self.compact:
+            rows = ((note.id, note.title, note.category, note.creation.isoformat()) for note in self.sql_query())
+            write_rows(rows, SUMMARY_COLUMNS_NAMES, self.output_format)
+            return
+
+        if self.output_format is not None:
+            rows = (
+                (note.id, note.title, note.content, note.category, int(note.markdown), note.creation.isoformat())
+                for note in self.sql_query()
             )
+            write_rows(rows, DETAIL_COLUMNS_NAMES, self.output_format)
+            return
 
-        query = self.db.exec_sql(sql)
+        self.console.print("📒[bold #964B00] List of Notes Found")
 
-        return query.fetchall()
+        branch = None
+        actual_category = None
+        notes_count = 0
+        last_id = None
 
-    def search(self) -> None:
-        """Displays a tree with Panels as child nodes with the notes searched"""
-        root = Tree("📒[bold #964B00] List of Notes Found")
-        query = self.sql_query()
-
-        if query:  # query != []
-            notes_sorted = sorted(query, key=sorter)
-            actual_note = notes_sorted[0]
-            actual_category = actual_note[2]
-
-            child_node = root.add(f":file_folder:[#d898ed]{actual_category}")
-            for actual_note in notes_sorted:
-                if actual_note[2] != actual_category:
-
-                    actual_category = actual_note[2]
-                    child_node = root.add(f":file_folder: [#d898ed]{actual_category}")
-
-                if actual_note[3] == 0:
-                    child_node.add(
-                        Panel(
-                            actual_note[1]
-                            if actual_note[1]
-                            else "[red bold]Empty note[/red bold]",
-                            title=f"{actual_note[0]} {actual_note[4]}",
-                        )
-                    )
-                else:  # actual_note[3] == 1
-                    markdown = Markdown(
-                        actual_note[1] if actual_note[1] else "# Note Empty"
-                    )
-                    child_node.add(
-                        Panel(markdown, title=f"{actual_note[0]} {actual_note[4]}")
-                    )
+        for note in self.sql_query():
+            if note.category != actual_category:
+                if branch is not None:
+                    self.console.print(branch)
+
+                branch = Tree(f":file_folder:[#d898ed]{note.category}")
+                actual_category = note.category
+
+            if self.compact:
+                branch.add(f"[#616161]#{note.id}[/#616161] {escape(note.title)} [yellow]{note.creation.isoformat()}")
+            else:
+                branch.add(note_panel(note, self.render_cache))
+            notes_count += 1
+            last_id = note.id
 
+        if branch is not None:
+            self.console.print(branch)
+
+            if self.limit is not None and notes_count == self.limit:
+                self.console.print(f"[#616161]Next page: --after {last_id}")
         else:
-            root.add("[red]❌ No Note Found")
-        self.console.print(root)
+            self.console.print("[red]❌ No Note Found")
+
+        self.render_cache.evict()
+
+
+@final
+class ShowNote:
+    """Class to display a single note, with its whole content
+
+    This class only has the purpose to read a note by its id and display it as note search does, so the notes listed
+    by a compact search can be read one at a time.
+
+    Attributes
+    ----------
+    console: Console
+        (Rich) Console for beautiful printting
+
+    db: SQLiteConnection
+        Connection with the dabatase
+
+    note_id: int
+        Id of the note displayed
+
+    render_cache: RenderCache
+        Cache of the notes rendered as markdown
+    """
+
+    console: Console
+    db: SQLiteConnection
+    note_id: int
+    render_cache: RenderCache
+
+    def __init__(self, args: Namespace) -> None:
+        """ShowNote Constructor
+
+        Parameters
+        ----------
+        args: Namespace
+            Arguments of argparse
+        """
+        self.console = get_console()
+        self.db = get_connection()
+        self.note_id = args.id
+        self.render_cache = RenderCache(render_cache_size())
+
+        try:
+            self.show()
+
+        except KeyboardInterrupt:
+            PrintFormatted.interruption()
+
+    @classmethod
+    def set_args(cls, args: Namespace) -> None:
+        """Set args and initialize class
+
+        Parameters
+        ----------
+        args: Namespace
+            Arguments of argparse
+        """
+        cls(args)
+
+    def show(self) -> None:
+        """Displays the note, in its category"""
+        note = NoteRepository(self.db).get(self.note_id)
+
+        if note is None:
+            self.console.print(f"[red]❌ Note #{self.note_id} not found")
+            return
+
+        branch = Tree(f":file_folder:[#d898ed]{note.category}")
+        branch.add(note_panel(note, self.render_cache))
+        self.console.print(branch)
+
+        self.render_cache.evict()
+
+
+def note_panel(note: Note, render_cache: RenderCache) -> Panel:
+    """Creates the panel where a note is displayed. The markdown notes are read from the cache when they were rendered
+    before with the same width
+
+    Parameters
+    ----------
+    note: Note
+        Note displayed
+
+    render_cache: RenderCache
+        Cache of the notes rendered as markdown
+
+    Returns
+    -------
+    panel: Panel
+        Panel with the content of the note
+    """
+    title = f"#{note.id} {note.title} {note.creation.isoformat()}"
+
+    if not note.markdown:
+        return Panel(note.content if note.content else "[red bold]Empty note[/red bold]", title=title)
+
+    content = note.content if note.content else "# Note Empty"
+    return Panel(CachedMarkdown(note.id, content, render_cache), title=title)
+
+
+def find_markdown_files(directory: str) -> Iterator[str]:
+    """Walks the directory tree looking for markdown files, in the same order every time
+
+    Parameters
+    ----------
+    directory: str
+        Directory where the files are searched
+
+    Returns
+    -------
+    paths: Iterator[str]
+        Path of each markdown file
+    """
+    for root, directories, files in os.walk(directory):
+        directories.sort()
+
+        for file_name in sorted(files):
+            if os.path.splitext(file_name)[1].lower() in MARKDOWN_EXTENSIONS:
+                yield os.path.join(root, file_name)
+
+
+def markdown_title(content: str, path: str) -> str:
+    """Gets the title of a note from the heading in the first line of its content, or from the name of its file
+
+    Parameters
+    ----------
+    content: str
+        Content of the file
+
+    path: str
+        Path of the file
+
+    Returns
+    -------
+    title: str
+        Title of the note, with a limit of 30 characters
+    """
+    first_line = content[:1024].lstrip("\ufeff \t\r\n").split("\n", 1)[0].strip()
+
+    title = first_line.lstrip("#").strip() if first_line.startswith("#") else ""
+    if not title:
+        title = os.path.splitext(os.path.basename(path))[0].strip() or "Imported note"
+
+    return title[:MAX_NAME_LENGTH].strip()
+
+
+def read_markdown_file(path: str) -> Optional[tuple[str, str, str, date]]:
+    """Reads a markdown file as a note. It's run by the processes of note import, so it doesn't use the database
+
+    Parameters
+    ----------
+    path: str
+        Path of the file
+
+    Returns
+    -------
+    note: Optional[tuple[str, str, str, date]]
+        Path, title, content and modification date of the file, or None when it can't be read
+    """
+    try:
+        with open(path, "rb") as file:
+            stat = os.fstat(file.fileno())
+            content = file.read().decode("utf-8", "replace")
+
+    except OSError:
+        return None
+
+    return path, markdown_title(content, path), content, date.fromtimestamp(stat.st_mtime)
+
+
+@final
+class ImportNote:
+    """Class to import the markdown files of a directory tree as notes
+
+    This class only has the purpose to read markdown files and store them in batches. The files of each subdirectory
+    are stored in a category named as the subdirectory (its path relative to the directory imported), which is created
+    when it doesn't exist, and the files of the directory itself in the category passed in the arguments or in the
+    default category. The title of each note is the heading of the first line, or the name of the file.
+
+    The files are read by a pool of processes while the notes read are stored by this process, a batch per
+    transaction. The path of every file stored is saved in the same transaction, so an interrupted import continues
+    with the files left when it's run again.
+
+    Attributes
+    ----------
+    BATCH_SIZE: Final[int]
+        Number of notes inserted in each transaction
+
+    PARALLEL_THRESHOLD: Final[int]
+        Min number of files read with the pool of processes, less files are read by this process
+
+    directory: str
+        Absolute path of the directory imported
+
+    category_name: Optional[str]
+        Category used for the files of the directory itself
+
+    workers: int
+        Number of processes that read files
+
+    imported: int
+        Number of notes imported
+
+    already_imported: int
+        Number of files skipped, because they were imported before
 
-        # self.db.close() # FIXME: DATABASE DONT CLOSE CORRECTLY
+    skipped: int
+        Number of files that couldn't be read
+
+    console: Console
+        (Rich) Console for beatiful printting
+
+    db: SQLiteConnection
+        Connection with the dabatase
+    """
+
+    BATCH_SIZE: Final[int] = 1000
+    PARALLEL_THRESHOLD: Final[int] = 200
+
+    directory: str
+    category_name: Optional[str] = None
+    workers: int
+    imported: int = 0
+    already_imported: int = 0
+    skipped: int = 0
+    console: Console
+    db: SQLiteConnection
+
+    def __init__(self, args: Namespace) -> None:
+        """ImportNote Constructor
+
+        Parameters
+        ----------
+        args : NameSpace
+            Arguments of argparse
+        """
+        self.console = get_console()
+        self.db = get_connection()
+        self.directory = os.path.abspath(args.directory)
+        self.workers = args.workers or os.cpu_count() or 1
+
+        try:
+            if args.category:
+                self.category_name = format_argument_text(args.category)[:MAX_NAME_LENGTH]
+
+            if not os.path.isdir(self.directory):
+                PrintFormatted.custom_print(f'[red][bold]❌"{args.directory}"[/bold] is not a directory[/red]')
+                return
+
+            self.save(self.pending_files())
+
+        except KeyboardInterrupt:
+            PrintFormatted.interruption()
+
+    @classmethod
+    def set_args(cls, args: Namespace) -> None:
+        """Set args and initialize class
+
+        Parameters
+        ----------
+        args: NameSpace
+            Arguments of argparse
+        """
+        cls(args)
+
+    def pending_files(self) -> list[str]:
+        """Looks for the markdown files of the directory that weren't imported before
+
+        Returns
+        -------
+        paths: list[str]
+            Absolute path of each file left to import
+        """
+        prefix = os.path.join(self.directory, "")
+        imported_paths = {
+            path
+            for (path,) in self.db.exec_sql(
+                f"SELECT {note_imports.COLUMN_PATH} FROM {note_imports.TABLE_NAME} WHERE "
+                f"{note_imports.COLUMN_PATH} >= ? AND {note_imports.COLUMN_PATH} < ?",
+                (prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)),  # Files under the directory, using the primary key
+            )
+        }
+
+        paths = []
+        for path in find_markdown_files(self.directory):
+            if path in imported_paths:
+                self.already_imported += 1
+            else:
+                paths.append(path)
+        return paths
+
+    def category_of(self, path: str) -> Optional[str]:
+        """Gets the name of the category of a file from its subdirectory
+
+        Parameters
+        ----------
+        path: str
+            Absolute path of the file
+
+        Returns
+        -------
+        category_name: Optional[str]
+            Path of the subdirectory relative to the directory imported, or only the name of the subdirectory when
+            it's too long. The category of the arguments for the files of the directory itself
+        """
+        subdirectory = os.path.relpath(os.path.dirname(path), self.directory)
+
+        if subdirectory == os.curdir:
+            return self.category_name
+
+        category_name = subdirectory.replace(os.sep, "/")
+        if len(category_name) > MAX_NAME_LENGTH:
+            category_name = os.path.basename(subdirectory)[:MAX_NAME_LENGTH]
+        return category_name
+
+    def read_files(self, paths: list[str]) -> Iterator[list[tuple[str, str, str, date]]]:
+        """Reads the files in batches, with a pool of processes when there are many
+
+        While a batch is stored, the processes already read the next one, but never more, so the memory used doesn't
+        depend on the number of files
+
+        Parameters
+        ----------
+        paths: list[str]
+            Path of each file
+
+        Returns
+        -------
+        batches: Iterator[list[tuple[str, str, str, date]]]
+            Path, title, content and modification date of the files of each batch that could be read
+        """
+        windows = [paths[start:start + self.BATCH_SIZE] for start in range(0, len(paths), self.BATCH_SIZE)]
+
+        if self.workers <= 1 or len(paths) < self.PARALLEL_THRESHOLD:
+            for window in windows:
+                yield self.__valid_notes(map(read_markdown_file, window))
+            return
+
+        executor = ProcessPoolExecutor(self.workers)
+        chunk_size = max(1, self.BATCH_SIZE // (self.workers * 4))
+        try:
+            previous_results = None
+            for window in windows:
+                results = executor.map(read_markdown_file, window, chunksize=chunk_size)  # Submitted right away
+
+                if previous_results is not None:
+                    yield self.__valid_notes(previous_results)
+                previous_results = results
+
+            if previous_results is not None:
+                yield self.__valid_notes(previous_results)
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    def __valid_notes(
+        self, results: Iterator[Optional[tuple[str, str, str, date]]]
+    ) -> list[tuple[str, str, str, date]]:
+        """Keeps the files that could be read, and counts the other ones as skipped"""
+        valid_notes = []
+        for note in results:
+            if note is not None:
+                valid_notes.append(note)
+            else:
+                self.skipped += 1
+        return valid_notes
+
+    def save(self, paths: list[str]) -> None:
+        """Stores the notes of the files, a batch per transaction with the paths of its files
+
+        Parameters
+        ----------
+        paths: list[str]
+            Path of each file to import
+        """
+        sql = (
+            f"INSERT INTO {notes.TABLE_NAME} ({notes.COLUMN_TITLE}, {notes.COLUMN_CONTENT}, {notes.COLUMN_CATEGORY}, "
+            f"{notes.COLUMN_README}, {notes.COLUMN_CREATION}) VALUES (?,?,?,1,?);"
+        )
+        progress_sql = f"INSERT OR IGNORE INTO {note_imports.TABLE_NAME} ({note_imports.COLUMN_PATH}) VALUES (?);"
+        categories_repository = get_category_repository(categories.TABLE_NAME)
+
+        with self.console.status("[bold yellow]Importing Notes...") as status:
+            for batch in self.read_files(paths):
+                # Without repeated names, in the order of the files, so the categories are created in that order
+                categories_names = list(dict.fromkeys(filter(None, (self.category_of(path) for path, *_ in batch))))
+
+                categories_repository.add_many(categories_names)
+                categories_id = categories_repository.resolve(categories_names)
+
+                self.db.exec_many(
+                    sql,
+                    (
+                        (title, content, categories_id.get(self.category_of(path), 1), creation.isoformat())
+                        for path, title, content, creation in batch
+                    ),
+                )
+                self.db.exec_many(progress_sql, ((path,) for path, *_ in batch))
+                self.db.commit()
+
+                self.imported += len(batch)
+                status.update(f"[bold yellow]Importing Notes... {self.imported + self.skipped}/{len(paths)}")
+
+            status.stop()
+
+        PrintFormatted.custom_print(
+            f"[bold green]✔️ Imported {self.imported} notes[/bold green] [#616161]({self.already_imported} already "
+            f"imported, {self.skipped} skipped)"
+        )
@@ -0,0 +1,238 @@
+""" Module with the cache of the notes rendered as markdown
+
+Parsing the markdown of a note and laying it out takes most of the time of a search, so the lines rendered (the text
+and style of each segment) are stored in the cache directory, as a JSON file for each note, content and width. A note
+is rendered again only when its content or the width of the terminal change.
+
+The files used most recently are kept: each hit updates the modification time of its file, and when the files take
+more than the max size the oldest ones are removed.
+"""
+import hashlib
+import json
+import os
+from typing import Final, Optional, final
+
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.segment import Segment
+from rich.style import Style
+
+from codenotes.config import cache_dir
+
+# Version of the format of the files, part of their name so the files of other versions are never read
+CACHE_FORMAT: Final[int] = 1
+
+Lines = list[list[Segment]]
+
+
+@final
+class RenderCache:
+    """Class to store the lines of the notes rendered, in a file for each note, content and width
+
+    Attributes
+    ----------
+    directory: str
+        Directory where the files are stored
+
+    max_size: int
+        Max size in bytes of the files, 0 disables the cache
+
+    written: bool
+        Flag that indicates if a file was written since the last eviction
+    """
+
+    directory: str
+    max_size: int
+    written: bool = False
+
+    def __init__(self, max_size: int, directory: Optional[str] = None) -> None:
+        """RenderCache Constructor
+
+        Parameters
+        ----------
+        max_size: int
+            Max size in bytes of the files, 0 disables the cache
+
+        directory: Optional[str]
+            Directory where the files are stored (Default notes in the cache directory, see codenotes.config.cache_dir)
+        """
+        self.max_size = max_size
+        self.directory = directory if directory is not None else os.path.join(cache_dir(), "notes")
+
+    def path(self, note_id: int, content: str, width: int) -> str:
+        """Returns the path of the file of a note rendered
+
+        Parameters
+        ----------
+        note_id: int
+            Id of the note
+
+        content: str
+            Content rendered
+
+        width: int
+            Width of the lines rendered
+
+        Returns
+        -------
+        path: str
+            Path of the file, which may not exist
+        """
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"v{CACHE_FORMAT}-{note_id}-{width}-{digest}.json")
+
+    def get(self, note_id: int, content: str, width: int) -> Optional[Lines]:
+        """Reads the lines of a note rendered, marking them as used
+
+        Parameters
+        ----------
+        note_id: int
+            Id of the note
+
+        content: str
+            Content rendered
+
+        width: int
+            Width of the lines rendered
+
+        Returns
+        -------
+        lines: Optional[Lines]
+            Segments of each line, or None when the note isn't in the cache
+        """
+        if not self.max_size:
+            return None
+
+        path = self.path(note_id, content, width)
+        try:
+            with open(path, encoding="utf-8") as file:
+                lines = json.load(file)
+            os.utime(path)  # Most recently used
+
+            return [
+                [Segment(text, Style.parse(style) if style is not None else None) for text, style in line]
+                for line in lines
+            ]
+
+        except (OSError, ValueError, TypeError):  # Not cached, or damaged
+            return None
+
+    def set(self, note_id: int, content: str, width: int, lines: Lines) -> None:
+        """Stores the lines of a note rendered. The cache is only an optimization, so errors writing it are ignored
+
+        Parameters
+        ----------
+        note_id: int
+            Id of the note
+
+        content: str
+            Content rendered
+
+        width: int
+            Width of the lines rendered
+
+        lines: Lines
+            Segments of each line
+        """
+        if not self.max_size:
+            return
+
+        path = self.path(note_id, content, width)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        data = [
+            [(segment.text, str(segment.style) if segment.style is not None else None) for segment in line]
+            for line in lines
+        ]
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(temporary_path, "w", encoding="utf-8") as file:
+                json.dump(data, file, ensure_ascii=False, separators=(",", ":"))
+            os.replace(temporary_path, path)  # Other processes never read a file half written
+            self.written = True
+
+        except OSError:
+            try:
+                os.remove(temporary_path)
+            except OSError:
+                pass
+
+    def evict(self) -> None:
+        """Removes the files used least recently, until the files don't take more than the max size"""
+        if not self.written:
+            return
+        self.written = False
+
+        files = []
+        try:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        stat = entry.stat()
+                        files.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError:  # Removed meanwhile by another process
+            return
+
+        total_size = sum(size for _, size, _ in files)
+
+        for _, size, path in sorted(files):
+            if total_size <= self.max_size:
+                break
+
+            try:
+                os.remove(path)
+                total_size -= size
+            except OSError:
+                pass
+
+
+@final
+class CachedMarkdown:
+    """Renderable of the content of a note as markdown, that is only parsed when it isn't in the cache
+
+    Attributes
+    ----------
+    note_id: int
+        Id of the note
+
+    content: str
+        Markdown rendered
+
+    cache: RenderCache
+        Cache where the lines rendered are stored
+    """
+
+    note_id: int
+    content: str
+    cache: RenderCache
+
+    def __init__(self, note_id: int, content: str, cache: RenderCache) -> None:
+        """CachedMarkdown Constructor
+
+        Parameters
+        ----------
+        note_id: int
+            Id of the note
+
+        content: str
+            Markdown rendered
+
+        cache: RenderCache
+            Cache where the lines rendered are stored
+        """
+        self.note_id = note_id
+        self.content = content
+        self.cache = cache
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        lines = self.cache.get(self.note_id, self.content, options.max_width)
+
+        if lines is None:
+            from rich.markdown import Markdown  # Only needed (and slow to import) when notes aren't cached
+
+            lines = console.render_lines(Markdown(self.content), options, pad=False)
+            self.cache.set(self.note_id, self.content, options.max_width, lines)
+
+        new_line = Segment.line()
+        for line in lines:
+            yield from line
+            yield new_line
@@ -0,0 +1,239 @@
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+from argparse import Namespace
+from contextlib import redirect_stderr, redirect_stdout
+from importlib import import_module
+from typing import Any, BinaryIO, final
+
+from rich.console import Console
+
+import codenotes
+import codenotes.db.utilities.notes_categories as notes_categories
+import codenotes.db.utilities.tasks_categories as tasks_categories
+from codenotes.cli import PrintFormatted, get_console, set_console
+from codenotes.config import MEMORY_DATABASE
+from codenotes.daemon import STATUS_LOCAL, STATUS_OK, forwardable, owned_socket, socket_path
+from codenotes.db.connection import SQLiteConnection, get_connection
+from codenotes.db.repository import clear_category_repositories, get_category_repository
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Handler of the connections of the clients, that runs the command of each one"""
+
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError:
+            return
+
+        if isinstance(request, dict):
+            self.server.serve.run_request(request, self.wfile)
+
+
+@final
+class Serve:
+    """Class to run codenotes as a daemon, listening on a Unix socket
+
+    This class only has the purpose to run the commands sent by the client of codenotes.daemon, with the connection,
+    the categories, the modules of the commands and rich already loaded. The commands are run one at a time, with its
+    output sent to the client while it's displayed.
+
+    Attributes
+    ----------
+    socket_path: str
+        Path of the socket where the daemon listens
+
+    database_path: str
+        Absolute path of the database used, the clients of other databases run the commands by themselves
+
+    console: Console
+        (Rich) Console for beatiful printting
+
+    db: SQLiteConnection
+        Connection with the dabatase, open while the daemon runs
+    """
+
+    socket_path: str
+    database_path: str
+    console: Console
+    db: SQLiteConnection
+
+    def __init__(self, args: Namespace) -> None:
+        """Serve Constructor
+
+        Parameters
+        ----------
+        args : NameSpace
+            Arguments of argparse
+        """
+        self.console = get_console()
+        self.db = get_connection()
+        self.socket_path = args.socket or socket_path()
+        self.database_path = self.db.database_path
+        if self.database_path != MEMORY_DATABASE:
+            self.database_path = os.path.abspath(self.database_path)
+
+        try:
+            self.serve()
+
+        except KeyboardInterrupt:
+            PrintFormatted.interruption()
+
+    @classmethod
+    def set_args(cls, args: Namespace) -> None:
+        """Set args and initialize class
+
+        Parameters
+        ----------
+        args: NameSpace
+            Arguments of argparse
+        """
+        cls(args)
+
+    def serve(self) -> None:
+        """Listens on the socket until the daemon is interrupted or terminated"""
+        if not hasattr(socket, "AF_UNIX"):
+            PrintFormatted.custom_print("[red]❌ Unix sockets are not supported in this platform[/red]")
+            return
+
+        if os.path.lexists(self.socket_path) and not owned_socket(self.socket_path):
+            PrintFormatted.custom_print(f"[red]❌ {self.socket_path} isn't a socket of the user[/red]")
+            return
+
+        if self.daemon_running():
+            PrintFormatted.custom_print(f"[red]❌ The daemon is already running in {self.socket_path}[/red]")
+            return
+
+        self.warm_up()
+
+        socket_dir = os.path.dirname(os.path.abspath(self.socket_path))
+        os.makedirs(socket_dir, mode=0o700, exist_ok=True)
+
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        previous_umask = os.umask(0o177)  # Only the user can connect
+        try:
+            server = socketserver.UnixStreamServer(self.socket_path, _RequestHandler)
+            os.umask(previous_umask)
+            server.serve = self
+
+            self.console.print(f"[bold green]✔️ Listening on[/bold green] [#616161]{self.socket_path}")
+            with server:
+                server.serve_forever()
+        finally:
+            os.umask(previous_umask)
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
+
+    def daemon_running(self) -> bool:
+        """Checks if another daemon listens on the socket, and removes the socket when it's stale
+
+        Returns
+        -------
+        running: bool
+            Boolean value that indicates if the socket is used by a daemon
+        """
+        if not os.path.exists(self.socket_path):
+            return False
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            try:
+                client.connect(self.socket_path)
+                return True
+            except OSError:
+                os.remove(self.socket_path)
+                return False
+
+    def warm_up(self) -> None:
+        """Imports the modules of the commands and reads the categories, so the first command doesn't wait for them"""
+        for module_name, _ in codenotes.COMMANDS.values():
+            import_module(module_name)
+        import_module("rich.markdown")
+
+        for table_name in (tasks_categories.TABLE_NAME, notes_categories.TABLE_NAME):
+            get_category_repository(table_name).ids
+
+    def run_request(self, request: dict[str, Any], response: BinaryIO) -> None:
+        """Runs the command of a client, sending the output to it
+
+        Parameters
+        ----------
+        request: dict[str, Any]
+            Request sent by the client (see codenotes.daemon.build_request)
+
+        response: BinaryIO
+            Connection with the client
+        """
+        argv = request.get("argv")
+
+        if not (isinstance(argv, list) and forwardable(argv) and request.get("database") == self.database_path):
+            response.write(STATUS_LOCAL)
+            return
+
+        response.write(STATUS_OK)
+        output = io.TextIOWrapper(response, encoding="utf-8", errors="replace", write_through=True)
+
+        color_system = None  # Without styles, as rich does when the output isn't a terminal
+        if request.get("terminal"):
+            color_system = "truecolor" if request.get("colorterm") in ("truecolor", "24bit") else "256"
+
+        console = Console(
+            file=output,
+            width=request.get("width"),
+            force_terminal=bool(request.get("terminal")),
+            no_color=bool(request.get("no_color")),
+            color_system=color_system,
+        )
+        previous_console = set_console(console)
+        # The prompts read an empty input that isn't a terminal, instead of the standard input of the daemon
+        previous_stdin, sys.stdin = sys.stdin, io.StringIO()
+
+        try:
+            with redirect_stdout(output), redirect_stderr(output):
+                self.run_command(argv)
+
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # The client was interrupted
+
+        except Exception as error:
+            try:
+                console.print(f"[red]❌ {type(error).__name__}: {error}[/red]")
+            except OSError:
+                pass
+
+        finally:
+            sys.stdin = previous_stdin
+            set_console(previous_console)
+            try:
+                output.detach()
+            except OSError:
+                pass
+
+            if self.db.connection.in_transaction:  # Changes of a command that didn't finish
+                self.db.connection.rollback()
+                clear_category_repositories()
+
+    @staticmethod
+    def run_command(argv: list[str]) -> None:
+        """Runs a command as main() does
+
+        Parameters
+        ----------
+        argv: list[str]
+            Arguments of the command
+        """
+        try:
+            args = codenotes.parse_args(argv)
+        except SystemExit:  # --help
+            return
+
+        command = codenotes.COMMANDS.get((args.subargs, getattr(args, "action", None)))
+
+        if command is not None:
+            codenotes.run_command(args, *command)
+        else:
+            codenotes.print_usage()
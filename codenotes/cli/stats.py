@@ -0,0 +1,166 @@
+from argparse import Namespace
+from typing import Any, Final, Iterator, Optional, final
+
+from rich.console import Console
+from rich.table import Table
+
+from codenotes.cli import PrintFormatted, get_console
+from codenotes.db.connection import SQLiteConnection, get_connection
+from codenotes.db.repository import NoteRepository, TaskRepository
+from codenotes.util.formats import write_rows
+
+# Names of the columns of the stats when written in other formats, the counts that don't apply to a type of
+# annotation are empty
+COLUMNS_NAMES: Final[tuple[str, ...]] = (
+    "annotation", "category", "period", "total", "incomplete", "in_process", "finished", "plain", "markdown"
+)
+
+
+@final
+class Stats:
+    """Class to display how many annotations there are of each category, created in each period
+
+    This class only has the purpose to display the stats of tasks (by status) and notes (by markdown flag). The
+    annotations are counted by the database, grouped by category and by day, week or month, so the stats don't depend
+    on the number of annotations.
+
+    Attributes
+    ----------
+    console: Console
+        (Rich) Console for beatiful printting
+
+    db: SQLiteConnection
+        Connection with the dabatase
+
+    period: str
+        Length of the periods (day, week or month)
+
+    show_tasks: bool
+        Displays the stats of tasks
+
+    show_notes: bool
+        Displays the stats of notes
+
+    output_format: Optional[str]
+        Machine-readable format (json, jsonl, csv or tsv) used to write the stats instead of displaying them
+    """
+
+    console: Console
+    db: SQLiteConnection
+    period: str
+    show_tasks: bool
+    show_notes: bool
+    output_format: Optional[str] = None
+
+    def __init__(self, args: Namespace) -> None:
+        """Stats Constructor
+
+        Parameters
+        ----------
+        args : NameSpace
+            Arguments of argparse
+        """
+        self.console = get_console()
+        self.db = get_connection()
+        self.period = args.by
+        self.show_tasks = args.task or not args.note
+        self.show_notes = args.note or not args.task
+        self.output_format = args.format
+
+        try:
+            self.show()
+
+        except KeyboardInterrupt:
+            PrintFormatted.interruption()
+
+    @classmethod
+    def set_args(cls, args: Namespace) -> None:
+        """Set args and initialize class
+
+        Parameters
+        ----------
+        args: NameSpace
+            Arguments of argparse
+        """
+        cls(args)
+
+    def rows(self) -> Iterator[tuple[Any, ...]]:
+        """Reads the stats of the types of annotation selected
+
+        Returns
+        -------
+        rows: Iterator[tuple[Any, ...]]
+            Stats of each category and period, with the columns of COLUMNS_NAMES
+        """
+        if self.show_tasks:
+            for stats in TaskRepository(self.db).stats(self.period):
+                counts = (stats.incomplete, stats.in_process, stats.finished, None, None)
+                yield ("task", stats.category, stats.period.isoformat(), stats.total, *counts)
+
+        if self.show_notes:
+            for stats in NoteRepository(self.db).stats(self.period):
+                counts = (None, None, None, stats.plain, stats.markdown)
+                yield ("note", stats.category, stats.period.isoformat(), stats.total, *counts)
+
+    def show(self) -> None:
+        """Displays a table with the stats of each type of annotation selected"""
+        if self.output_format is not None:
+            write_rows(self.rows(), COLUMNS_NAMES, self.output_format)
+            return
+
+        if self.show_tasks:
+            table = self.__new_table("📒[bold blue] Tasks", ("Incomplete", "In Process", "Finished"))
+
+            for stats in TaskRepository(self.db).stats(self.period):
+                counts = (stats.incomplete, stats.in_process, stats.finished, stats.total)
+                table.add_row(stats.category, stats.period.isoformat(), *map(str, counts))
+            self.__print_table(table, "Task")
+
+        if self.show_notes:
+            table = self.__new_table("📒[bold #964B00] Notes", ("Plain", "Markdown"))
+
+            for stats in NoteRepository(self.db).stats(self.period):
+                counts = (stats.plain, stats.markdown, stats.total)
+                table.add_row(stats.category, stats.period.isoformat(), *map(str, counts))
+            self.__print_table(table, "Note")
+
+    def __new_table(self, title: str, counts: tuple[str, ...]) -> Table:
+        """Creates the table where the stats of a type of annotation are displayed
+
+        Parameters
+        ----------
+        title: str
+            Title of the table
+
+        counts: tuple[str, ...]
+            Name of the columns of the counts, before the total
+
+        Returns
+        -------
+        table: Table
+            Table without rows
+        """
+        table = Table(title=title, title_justify="left")
+        table.add_column("Category")
+        table.add_column(self.period.capitalize(), justify="center", style="yellow")
+        for count in counts:
+            table.add_column(count, justify="right")
+        table.add_column("Total", justify="right", style="bold")
+
+        return table
+
+    def __print_table(self, table: Table, annotation: str) -> None:
+        """Displays the table of stats of a type of annotation, or a message when it doesn't have rows
+
+        Parameters
+        ----------
+        table: Table
+            Table with the stats
+
+        annotation: str
+            Name of the type of annotation
+        """
+        if table.row_count:
+            self.console.print(table)
+        else:
+            self.console.print(f"[red]❌ No {annotation} Found")
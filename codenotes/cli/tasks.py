@@ -1,6 +1,11 @@
+import csv
+import json
+import os
+import sys
 from argparse import Namespace
 from datetime import date, datetime
-from typing import Any, Optional, Union, final
+from itertools import islice
+from typing import Any, Final, Iterator, Optional, TextIO, Union, final
 
 from rich import box
 from rich.console import Console
@@ -12,29 +17,19 @@ import codenotes.db.utilities.tasks as tasks
 import codenotes.db.utilities.tasks_categories as categories
 import codenotes.util.help as help_text
 from codenotes.abstract import CreateABC, SearchABC
-from codenotes.cli import PrintFormatted
-from codenotes.db.connection import SQLiteConnection
+from codenotes.cli import PrintFormatted, get_console
+from codenotes.db.connection import SQLiteConnection, get_connection
+from codenotes.db.entities import Task
+from codenotes.db.repository import TaskRepository, get_category_repository
 from codenotes.exceptions import CategoryNotExistsError, MissingArgsException
 from codenotes.util.args import (date_args_empty, dates_to_search,
                                  format_argument_text)
-from codenotes.util.sql import add_conditions_sql
+from codenotes.util.formats import write_rows
 from codenotes.util.text import format_list_text, status_text
 
 
-def sorter(query: tuple) -> Any:
-    """Function used to get the key that will be used in the built-in function sorted()
-
-    Parameters
-    ----------
-    query: tuple
-        Row from the query done to the database, which contains the variables that will be used to sort the query
-
-    Returns
-    -------
-    key: Any
-        Returns the key that will be used
-    """
-    return query[3]
+# Names of the columns of the tasks when written in other formats
+DETAIL_COLUMNS_NAMES: Final[tuple[str, ...]] = ("id", "content", "status", "creation", "category")
 
 
 def create_args_empty(args: Namespace) -> bool:
@@ -100,8 +95,8 @@ class CreateTask(CreateABC):
         args : NameSpace
             Arguments of argparse
         """
-        self.console = Console()
-        self.db = SQLiteConnection()
+        self.console = get_console()
+        self.db = get_connection()
         self.creation_date = datetime.now().date()
 
         try:
@@ -124,6 +119,9 @@ class CreateTask(CreateABC):
         except KeyboardInterrupt:
             PrintFormatted.interruption()
 
+        except EOFError:  # A category too long, and no input to ask for another one (closed, or in the daemon)
+            PrintFormatted.custom_print("[red]❌ No input to answer the prompt, the command was cancelled[/red]")
+
         except MissingArgsException:
             PrintFormatted.print_help(help_text.ADD_TASK_USAGE_TEXT)
 
@@ -154,10 +152,7 @@ class CreateTask(CreateABC):
                 )
             else:
 
-                sql = f"INSERT INTO {categories.TABLE_NAME} ({categories.COLUMN_NAME}) VALUES (?)"
-                cursor = self.db.exec_sql(sql, (self.category_name,))
-
-                self.category_id = cursor.lastrowid
+                self.category_id = get_category_repository(categories.TABLE_NAME).add(self.category_name)
 
                 self.db.commit()
                 PrintFormatted.print_category_creation(self.category_name)
@@ -188,15 +183,10 @@ class CreateTask(CreateABC):
         exists: bool
             Boolean value flag if the category already exists
         """
-        sql = (
-            f"SELECT {categories.COLUMN_ID} FROM {categories.TABLE_NAME} WHERE "
-            f"{categories.COLUMN_NAME} = '{category_name}'"
-        )
-        query = self.db.exec_sql(sql)
-        categories_list: list[tuple] = query.fetchall()
+        category_id = get_category_repository(categories.TABLE_NAME).get_id(category_name)
 
-        if categories_list:  # categories_list == (id,)
-            self.category_id = categories_list[0][0]
+        if category_id is not None:
+            self.category_id = category_id
             return True
         return False
 
@@ -253,7 +243,6 @@ class CreateTask(CreateABC):
             status.stop()
 
         self.db.commit()
-        self.db.close()
 
 
 @final
@@ -283,6 +272,27 @@ class SearchTask(SearchABC):
 
     search_category_id : int
         Id of the category where the notes will be searched
+
+    limit: Optional[int]
+        Max number of tasks displayed
+
+    offset: Optional[int]
+        Number of tasks skipped before the first one displayed
+
+    after: Optional[int]
+        Id of the task after which the search continues (keyset pagination in the order of the search)
+
+    sort: str
+        Key used to sort the tasks of each category (category, date or status)
+
+    descending: bool
+        Reverses the order of the tasks
+
+    match: str
+        Way the text is matched (words, infix or glob)
+
+    output_format: Optional[str]
+        Machine-readable format (json, jsonl, csv or tsv) used to write the tasks instead of displaying them
     """
 
     console: Console
@@ -291,6 +301,13 @@ class SearchTask(SearchABC):
     search_text: str
     search_category: str = None
     search_category_id: int = None
+    limit: Optional[int] = None
+    offset: Optional[int] = None
+    after: Optional[int] = None
+    sort: str = "category"
+    descending: bool = False
+    match: str = "words"
+    output_format: Optional[str] = None
 
     def __init__(self, args: Namespace) -> None:
         """SearchTask Constructor
@@ -300,10 +317,17 @@ class SearchTask(SearchABC):
         args : NameSpace
             Arguments of argparse
         """
-        self.console = Console()
-        self.db = SQLiteConnection()
+        self.console = get_console()
+        self.db = get_connection()
         self.search_date = dates_to_search(args)
         self.search_text = format_argument_text(args.text)
+        self.limit = args.limit
+        self.offset = args.offset
+        self.after = args.after
+        self.sort = args.sort
+        self.descending = args.desc
+        self.match = args.match
+        self.output_format = args.format
 
         try:
             if date_args_empty(args):
@@ -349,108 +373,331 @@ class SearchTask(SearchABC):
         exists: bool
             Boolean value flag if the category already exists
         """
-        sql = (
-            f"SELECT {categories.COLUMN_ID} FROM {categories.TABLE_NAME} WHERE "
-            f"{categories.COLUMN_NAME} = '{category_name}'"
-        )
-        query = self.db.exec_sql(sql)
-        categories_list: list[tuple] = query.fetchall()
+        category_id = get_category_repository(categories.TABLE_NAME).get_id(category_name)
 
-        if categories_list:  # categories_list == (id,)
-            self.search_category_id = categories_list[0][0]
+        if category_id is not None:
+            self.search_category_id = category_id
             return True
         return False
 
-    def sql_query(self) -> list[tuple]:
-        """Makes a query of related information of tasks, and also adds more statements to the main sql
-        sql
+    def sql_query(self) -> Iterator[Task]:
+        """Searches the tasks with the filters of the arguments
 
         Returns
         -------
-        query: list[tuple]
-            Query done to the database
-        """
-        sql = (
-            f"SELECT {tasks.TABLE_NAME}.{tasks.COLUMN_CONTENT},{tasks.TABLE_NAME}.{tasks.COLUMN_STATUS}, "
-            f"{tasks.TABLE_NAME}.{tasks.COLUMN_CREATION}, "
-            f"{categories.TABLE_NAME}.{categories.COLUMN_NAME} FROM {tasks.TABLE_NAME} INNER JOIN "
-            f"{categories.TABLE_NAME} ON {tasks.TABLE_NAME}.{tasks.COLUMN_CATEGORY} = "
-            f"{categories.TABLE_NAME}.{categories.COLUMN_ID}"
-        )
+        query: Iterator[Task]
+            Tasks found, ordered by category, read from the database while they are iterated
 
-        if self.search_date:
-            if isinstance(self.search_date, date):
-                sql = add_conditions_sql(
-                    sql, f'{tasks.COLUMN_CREATION} LIKE date("{self.search_date}")'
-                )
-
-            elif isinstance(self.search_date, list):
-                first_day, last_day = self.search_date
-                sql = add_conditions_sql(
-                    sql,
-                    f'{tasks.COLUMN_CREATION} BETWEEN date("{first_day}") '
-                    f'AND date("{last_day}")',
-                )
-        if self.search_text:
-            sql = add_conditions_sql(
-                sql, f'{tasks.COLUMN_CONTENT} LIKE "%{self.search_text}%"', "AND"
-            )
+        Raises
+        ------
+        CategoryNotExistsError
+            When the category searched doesn't exist
+        """
+        filters = {
+            "text": self.search_text,
+            "after": self.after,
+            "limit": self.limit,
+            "offset": self.offset,
+            "sort": self.sort,
+            "descending": self.descending,
+            "match": self.match,
+        }
+
+        if isinstance(self.search_date, date):
+            filters["since"] = filters["until"] = self.search_date
+
+        elif isinstance(self.search_date, list):
+            filters["since"], filters["until"] = self.search_date
 
         if self.search_category:
             if not self.category_exists(self.search_category):
                 raise CategoryNotExistsError
-            sql = add_conditions_sql(
-                sql, f"{tasks.COLUMN_CATEGORY} = {self.search_category_id}", "AND"
+            filters["category_id"] = self.search_category_id
+
+        return TaskRepository(self.db).search(**filters)
+
+    def search(self) -> None:
+        """Displays the tasks searched one category at a time, while they are read from the database
+
+        The tasks are ordered by category by the query, so only the tasks of the category being displayed are kept
+        in memory. When the number of tasks displayed reaches the limit, it shows the id to use with --after to get
+        the next page
+        """
+        if self.output_format is not None:
+            rows = (
+                (task.id, task.content, task.status, task.creation.isoformat(), task.category)
+                for task in self.sql_query()
             )
+            write_rows(rows, DETAIL_COLUMNS_NAMES, self.output_format)
+            return
 
-        query = self.db.exec_sql(sql)
+        self.console.print("📒[bold blue] List of Tasks  Found")
 
-        return query.fetchall()
+        actual_category = None
+        table = None
+        tasks_count = 0
+        last_id = None
 
-    def search(self) -> None:
-        """Displays a tree with tables as child nodes with the tasks searched"""
-        root = Tree("📒[bold blue] List of Tasks  Found")
-        query = self.sql_query()
-
-        if query:  # When the list is not empty
-            table = Table()
-            table.add_column("Tasks")
-            table.add_column("Status")
-            table.add_column("Category")
-            table.add_column("Creation Date", justify="center", style="yellow")
-
-            tasks_sorted = sorted(query, key=sorter)
-            actual_task = tasks_sorted[0]
-            actual_category = actual_task[3]
-
-            child_branch = root.add(f":file_folder:[#d898ed]{actual_category}")
-
-            for actual_task in tasks_sorted:
-                if actual_task[3] != actual_category:
-                    child_branch.add(table)
-
-                    table = Table()
-                    table.add_column("Tasks")
-                    table.add_column("Status")
-                    table.add_column("Category")
-                    table.add_column("Creation Date", justify="center", style="yellow")
-
-                    actual_category = actual_task[3]
-                    child_branch = root.add(f":file_folder: [#d898ed]{actual_category}")
-
-                table.add_row(
-                    actual_task[0],
-                    status_text(actual_task[1]),
-                    actual_task[3],
-                    actual_task[2],
-                )
+        for task in self.sql_query():
+            if task.category != actual_category:
+                if table is not None:
+                    self.__print_category(actual_category, table)
+
+                table = self.__new_table()
+                actual_category = task.category
+
+            table.add_row(
+                str(task.id), task.content, status_text(task.status), task.category, task.creation.isoformat()
+            )
+            tasks_count += 1
+            last_id = task.id
+
+        if table is not None:
+            self.__print_category(actual_category, table)
+
+            if self.limit is not None and tasks_count == self.limit:
+                self.console.print(f"[#616161]Next page: --after {last_id}")
+        else:
+            self.console.print("[red]❌ No Task Found")
+
+    def __print_category(self, category: str, table: Table) -> None:
+        """Displays a category with its table of tasks
+
+        Parameters
+        ----------
+        category: str
+            Name of the category
+
+        table: Table
+            Table with the tasks of the category
+        """
+        branch = Tree(f":file_folder:[#d898ed]{category}")
+        branch.add(table)
+        self.console.print(branch)
+
+    @staticmethod
+    def __new_table() -> Table:
+        """Creates the table where the tasks of a category are displayed
+
+        Returns
+        -------
+        table: Table
+            Table without rows
+        """
+        table = Table()
+        table.add_column("Id", justify="right", style="#616161")
+        table.add_column("Tasks")
+        table.add_column("Status")
+        table.add_column("Category")
+        table.add_column("Creation Date", justify="center", style="yellow")
+
+        return table
+
+
+def guess_import_format(file_name: Optional[str]) -> str:
+    """Gets the format of the file to import by its extension
+
+    Parameters
+    ----------
+    file_name: Optional[str]
+        Name of the file, None when the tasks are read from the standard input
+
+    Returns
+    -------
+    import_format: str
+        Format of the file (csv, jsonl or lines)
+    """
+    if file_name is not None:
+        extension = os.path.splitext(file_name)[1].lower()
+
+        if extension == ".csv":
+            return "csv"
+        elif extension in (".jsonl", ".ndjson"):
+            return "jsonl"
+    return "lines"
+
+
+@final
+class ImportTask:
+    """Class to import tasks in bulk from a file or the standard input
+
+    This class only has the purpose to read tasks in a streaming way and store them in batches. Tasks can be written as
+    plain lines (one task per line), CSV (content, category and status columns, the last two are optional) or JSON
+    Lines (objects with content, category and status keys, or plain strings). Categories that don't exist are created,
+    and tasks without one are stored in the category passed in the arguments or in the default category.
+
+    Attributes
+    ----------
+    BATCH_SIZE: Final[int]
+        Number of tasks inserted in each transaction
+
+    import_format: str
+        Format of the tasks to import (lines, csv or jsonl)
+
+    category_name: Optional[str]
+        Category used for the tasks that doesn't specify one
+
+    imported: int
+        Number of tasks imported
+
+    skipped: int
+        Number of rows that couldn't be imported (empty content, invalid status, category name too long or invalid
+        JSON)
+
+    console: Console
+        (Rich) Console for beatiful printting
+
+    db: SQLiteConnection
+        Connection with the dabatase
+    """
+
+    BATCH_SIZE: Final[int] = 5000
+
+    import_format: str
+    category_name: Optional[str] = None
+    imported: int = 0
+    skipped: int = 0
+    console: Console
+    db: SQLiteConnection
+
+    def __init__(self, args: Namespace) -> None:
+        """ImportTask Constructor
+
+        Parameters
+        ----------
+        args : NameSpace
+            Arguments of argparse
+        """
+        self.console = get_console()
+        self.db = get_connection()
+        self.import_format = args.format or guess_import_format(args.file)
+
+        try:
+            if args.category:
+                self.category_name = format_argument_text(args.category)
+
+                if len(self.category_name) > 30:  # Otherwise, every task would be skipped
+                    PrintFormatted.custom_print("[red]❌ Category name is too long (Max. 30 characters)[/red]")
+                    sys.exit(1)
+
+            if args.file is None or args.file == "-":
+                self.save(self.read_tasks(sys.stdin))
             else:
-                child_branch.add(table)
+                with open(args.file, "r", encoding="utf-8", newline="") as file:
+                    self.save(self.read_tasks(file))
+
+        except KeyboardInterrupt:
+            PrintFormatted.interruption()
+
+        except OSError as error:
+            PrintFormatted.custom_print(f'[red][bold]❌"{args.file}"[/bold] {error.strerror}[/red]')
+
+    @classmethod
+    def set_args(cls, args: Namespace) -> None:
+        """Set args and initialize class
+
+        Parameters
+        ----------
+        args: NameSpace
+            Arguments of argparse
+        """
+        cls(args)
+
+    def read_tasks(self, file: TextIO) -> Iterator[tuple[str, Optional[str], Any]]:
+        """Reads the tasks of the file one by one
+
+        Parameters
+        ----------
+        file: TextIO
+            File (or standard input) where the tasks are read
+
+        Returns
+        -------
+        tasks: Iterator[tuple[str, Optional[str], Any]]
+            Content, category name and status of each task
+        """
+        if self.import_format == "csv":
+            for i, row in enumerate(csv.reader(file)):
+                if row and not (i == 0 and row[0].strip().lower() == "content"):  # Skips the header
+                    yield row[0], (row[1] if len(row) > 1 else None), (row[2] if len(row) > 2 else 0)
+
+        elif self.import_format == "jsonl":
+            for line in file:
+                if line.strip():
+                    try:
+                        task = json.loads(line)
+                    except ValueError:
+                        task = None
+
+                    if isinstance(task, dict):
+                        yield task.get("content", ""), task.get("category"), task.get("status", 0)
+                    elif isinstance(task, str):
+                        yield task, None, 0
+                    else:
+                        self.skipped += 1
 
         else:
-            root.add("[red]❌ No Task Found")
-        self.console.print(root)
-        # self.db.close() # FIXME: DATABASE DONT CLOSE CORRECTLY
+            for line in file:
+                yield line, None, 0
+
+    def save(self, tasks_read: Iterator[tuple[str, Optional[str], Any]]) -> None:
+        """Stores the tasks read in batches, each one in a single transaction
+
+        Parameters
+        ----------
+        tasks_read: Iterator[tuple[str, Optional[str], Any]]
+            Content, category name and status of each task
+        """
+        sql = (
+            f"INSERT INTO {tasks.TABLE_NAME} ({tasks.COLUMN_CONTENT}, {tasks.COLUMN_STATUS}, "
+            f"{tasks.COLUMN_CREATION}, {tasks.COLUMN_CATEGORY}) VALUES (?,?,?,?);"
+        )
+        creation_date = datetime.now().date().isoformat()
+
+        with self.console.status("[bold yellow]Importing Tasks...") as status:
+            batch = list(islice(tasks_read, self.BATCH_SIZE))
+
+            while batch:
+                valid_tasks = []
+                for content, category_name, status_value in batch:
+                    content = content.strip() if isinstance(content, str) else ""
+                    valid_category = category_name is None or isinstance(category_name, str)  # Any value in JSON
+                    category_name = category_name.strip() if valid_category and category_name else self.category_name
+                    status_value = str(status_value).strip() or "0"
+
+                    if (
+                        content
+                        and valid_category
+                        and status_value in ("0", "1", "2")
+                        and len(category_name or "") <= 30
+                    ):
+                        valid_tasks.append((content, int(status_value), category_name))
+                    else:
+                        self.skipped += 1
+
+                category_names = {task[2] for task in valid_tasks if task[2]}
+                categories_repository = get_category_repository(categories.TABLE_NAME)
+
+                categories_repository.add_many(category_names)
+                categories_id = categories_repository.resolve(category_names)
+
+                self.db.exec_many(
+                    sql,
+                    (
+                        (content, status_value, creation_date, categories_id.get(category_name, 1))
+                        for content, status_value, category_name in valid_tasks
+                    ),
+                )
+                self.db.commit()
+
+                self.imported += len(valid_tasks)
+                batch = list(islice(tasks_read, self.BATCH_SIZE))
+
+            status.stop()
+
+        PrintFormatted.custom_print(
+            f"[bold green]✔️ Imported {self.imported} tasks[/bold green] [#616161]({self.skipped} skipped)"
+        )
 
 
 @final
@@ -0,0 +1,264 @@
+""" Module with the user configuration of codenotes
+
+The configuration is read from an INI file, located in $CODENOTES_CONFIG or in $XDG_CONFIG_HOME/codenotes/config.ini
+(~/.config/codenotes/config.ini by default). Every option can also be set with an environment variable named
+CODENOTES_<OPTION>, which has priority over the file.
+
+Example of the file::
+
+    [database]
+    path = ~/notes/codenotes.db
+    journal_mode = WAL
+    synchronous = NORMAL
+    busy_timeout = 5000
+
+    [stores]
+    work = /mnt/fast/work.db
+
+    [daemon]
+    socket = ~/.codenotes.sock
+
+    [cache]
+    render_cache_size = 33554432
+"""
+import os
+import re
+from configparser import ConfigParser
+from typing import Callable, Final, Optional
+
+from codenotes.exceptions import InvalidConfigError
+
+DATABASE_SECTION: Final[str] = "database"
+STORES_SECTION: Final[str] = "stores"
+CACHE_SECTION: Final[str] = "cache"
+
+DATABASE_NAME: Final[str] = "codenotes.db"
+
+# Where the database was stored by older versions, next to the installed package
+LEGACY_DATABASE_PATH: Final[str] = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), DATABASE_NAME
+)
+
+MEMORY_DATABASE: Final[str] = ":memory:"
+
+# Max size in bytes of the notes rendered kept in the cache, 0 disables it
+DEFAULT_RENDER_CACHE_SIZE: Final[str] = "33554432"  # 32 MB
+
+# Pragmas applied to every connection, in the order they are executed, with its default value
+DEFAULT_PRAGMAS: Final[dict[str, str]] = {
+    "busy_timeout": "5000",  # Milliseconds waiting for a lock before failing with 'database is locked'
+    "journal_mode": "WAL",  # Readers and a writer can work at the same time
+    "synchronous": "NORMAL",  # With WAL, only checkpoints fsync
+    "cache_size": "-16000",  # 16 MB of page cache
+    "mmap_size": "268435456",  # 256 MB memory-mapped
+    "temp_store": "MEMORY",
+}
+
+
+def _is_integer(value: str) -> bool:
+    """Checks if the value is a (maybe negative) integer"""
+    return value.lstrip("-").isdigit()
+
+
+# Validation of each pragma, since its value can't be passed as a parameter of the statement
+PRAGMAS_VALIDATION: Final[dict[str, Callable[[str], bool]]] = {
+    "busy_timeout": lambda value: value.isdigit(),
+    "journal_mode": lambda value: value.upper() in ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"),
+    "synchronous": lambda value: value.upper() in ("OFF", "NORMAL", "FULL", "EXTRA", "0", "1", "2", "3"),
+    "cache_size": _is_integer,
+    "mmap_size": lambda value: value.isdigit(),
+    "temp_store": lambda value: value.upper() in ("DEFAULT", "FILE", "MEMORY", "0", "1", "2"),
+}
+
+_config: Optional[ConfigParser] = None
+
+
+def config_path() -> str:
+    """Returns the path of the configuration file
+
+    Returns
+    -------
+    path: str
+        Path of the INI file, which may not exist
+    """
+    if "CODENOTES_CONFIG" in os.environ:
+        return os.environ["CODENOTES_CONFIG"]
+
+    config_home = os.environ.get("XDG_CONFIG_HOME") or os.path.join(os.path.expanduser("~"), ".config")
+    return os.path.join(config_home, "codenotes", "config.ini")
+
+
+def load_config() -> ConfigParser:
+    """Reads the configuration file once per process
+
+    Returns
+    -------
+    config: ConfigParser
+        Configuration read, empty if the file doesn't exist
+    """
+    global _config
+
+    if _config is None:
+        _config = ConfigParser()
+        _config.read(config_path(), encoding="utf-8")
+    return _config
+
+
+def get_option(section: str, option: str, default: Optional[str] = None) -> Optional[str]:
+    """Returns the value of an option, from its environment variable or from the configuration file
+
+    Parameters
+    ----------
+    section: str
+        Section of the configuration file where the option is
+
+    option: str
+        Name of the option
+
+    default: Optional[str]
+        Value returned when the option isn't set
+
+    Returns
+    -------
+    value: Optional[str]
+        Value of the option
+    """
+    value = os.environ.get(f"CODENOTES_{option.upper()}")
+
+    if value is None:
+        value = load_config().get(section, option, fallback=default)
+    return value
+
+
+def data_dir() -> str:
+    """Returns the directory where the databases are stored by default
+
+    Returns
+    -------
+    path: str
+        $XDG_DATA_HOME/codenotes (~/.local/share/codenotes by default)
+    """
+    data_home = os.environ.get("XDG_DATA_HOME") or os.path.join(os.path.expanduser("~"), ".local", "share")
+    return os.path.join(data_home, "codenotes")
+
+
+def cache_dir() -> str:
+    """Returns the directory where the files that can be created again are stored
+
+    Returns
+    -------
+    path: str
+        $XDG_CACHE_HOME/codenotes (~/.cache/codenotes by default)
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "codenotes")
+
+
+def render_cache_size() -> int:
+    """Returns the max size of the cache of notes rendered
+
+    Returns
+    -------
+    size: int
+        Max size in bytes, 0 when the cache is disabled
+
+    Raises
+    ------
+    InvalidConfigError
+        When the size isn't a positive integer or 0
+    """
+    value = get_option(CACHE_SECTION, "render_cache_size", DEFAULT_RENDER_CACHE_SIZE).strip()
+
+    if not value.isdigit():
+        raise InvalidConfigError(f'Invalid value "{value}" for render_cache_size')
+    return int(value)
+
+
+def store_path(store: str) -> str:
+    """Returns the path of the database of a named store
+
+    Parameters
+    ----------
+    store: str
+        Name of the store, with its path in the [stores] section of the configuration, or stored as <name>.db in the
+        data directory
+
+    Returns
+    -------
+    path: str
+        Path of the database of the store
+
+    Raises
+    ------
+    InvalidConfigError
+        When the name of the store has characters not allowed in a file name
+    """
+    path = load_config().get(STORES_SECTION, store, fallback=None)
+
+    if path is not None:
+        return os.path.expanduser(path)
+
+    if not re.fullmatch(r"[\w.-]+", store) or store.startswith("."):
+        raise InvalidConfigError(f'Invalid store name "{store}"')
+    return os.path.join(data_dir(), f"{store}.db")
+
+
+def database_path(path: Optional[str] = None, store: Optional[str] = None) -> str:
+    """Returns the path of the database that will be used
+
+    The path is taken, in order, from the path or store passed, the CODENOTES_DB environment variable, the path
+    option of the configuration file, or the default location in the data directory. When the database only exists in
+    the location used by older versions, that one is used.
+
+    Parameters
+    ----------
+    path: Optional[str]
+        Path of the database, or :memory: for a temporary database in memory
+
+    store: Optional[str]
+        Name of the store
+
+    Returns
+    -------
+    path: str
+        Path of the database
+    """
+    if path is not None:
+        return path if path == MEMORY_DATABASE else os.path.expanduser(path)
+
+    if store is not None:
+        return store_path(store)
+
+    path = os.environ.get("CODENOTES_DB") or load_config().get(DATABASE_SECTION, "path", fallback=None)
+    if path is not None:
+        return path if path == MEMORY_DATABASE else os.path.expanduser(path)
+
+    path = os.path.join(data_dir(), DATABASE_NAME)
+    if not os.path.exists(path) and os.path.exists(LEGACY_DATABASE_PATH):
+        return LEGACY_DATABASE_PATH
+    return path
+
+
+def database_pragmas() -> dict[str, str]:
+    """Returns the pragmas applied to the connections with the database
+
+    Returns
+    -------
+    pragmas: dict[str, str]
+        Value of each pragma, in the order they must be executed
+
+    Raises
+    ------
+    InvalidConfigError
+        When the value of a pragma is not valid
+    """
+    pragmas = {}
+
+    for pragma, default in DEFAULT_PRAGMAS.items():
+        value = get_option(DATABASE_SECTION, pragma, default).strip()
+
+        if not PRAGMAS_VALIDATION[pragma](value):
+            raise InvalidConfigError(f'Invalid value "{value}" for {pragma}')
+        pragmas[pragma] = value
+
+    return pragmas
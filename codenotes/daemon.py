@@ -0,0 +1,201 @@
+""" Module with the client of the codenotes daemon
+
+The daemon (codenotes serve, see codenotes.cli.serve) keeps the interpreter, the connection with the database, the
+categories and the console loaded, and listens on a Unix socket. When it's running, main() sends the arguments to it
+and copies the output it streams back, so the command doesn't pay the startup of codenotes.
+
+This module is imported before the arguments are parsed, so it must only import what the client needs.
+
+Protocol: the client sends a JSON line with the request, and the daemon answers with a status line, OK when it runs
+the command (followed by the output of the command until the connection is closed) or LOCAL when the command must be
+run by the client.
+"""
+import os
+import stat
+import sys
+from typing import Any, Final, Optional
+
+DAEMON_SECTION: Final[str] = "daemon"
+
+STATUS_OK: Final[bytes] = b"OK\n"
+STATUS_LOCAL: Final[bytes] = b"LOCAL\n"
+
+# Annotations whose commands can be run by the daemon, and the commands that only read them
+ANNOTATIONS: Final[tuple[str, ...]] = ("task", "note", "category", "stats")
+
+# Arguments of the commands that must be run locally: asking for confirmation needs the terminal, the import reads
+# the standard input or files relative to the directory of the client, and the daemon uses a single database
+LOCAL_ARGUMENTS: Final[frozenset[str]] = frozenset(("--preview", "-p", "import", "--db", "--store", "--log"))
+
+CHUNK_SIZE: Final[int] = 65536
+
+
+def socket_path() -> str:
+    """Returns the path of the socket where the daemon listens
+
+    Returns
+    -------
+    path: str
+        The socket option of the [daemon] section of the configuration (or $CODENOTES_SOCKET), or codenotes.sock in
+        $XDG_RUNTIME_DIR, or in the temporary directory when it isn't set
+    """
+    from codenotes.config import get_option
+
+    path = get_option(DAEMON_SECTION, "socket")
+    if path is not None:
+        return os.path.expanduser(path)
+
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "codenotes.sock")
+
+    import tempfile  # Slow to import, and only needed without $XDG_RUNTIME_DIR
+
+    user = os.getuid() if hasattr(os, "getuid") else os.getlogin()
+    return os.path.join(tempfile.gettempdir(), f"codenotes-{user}.sock")
+
+
+def owned_socket(path: str) -> bool:
+    """Checks if a path is a socket of the user. The socket may be in the shared temporary directory, so the arguments
+    are never sent to a socket created by another user
+
+    Parameters
+    ----------
+    path: str
+        Path of the socket
+
+    Returns
+    -------
+    owned: bool
+        Boolean value that indicates if the path exists, is a socket and its owner is the user
+    """
+    try:
+        status = os.lstat(path)
+    except OSError:
+        return False
+
+    if not stat.S_ISSOCK(status.st_mode):
+        return False
+    return not hasattr(os, "getuid") or status.st_uid == os.getuid()
+
+
+def forwardable(argv: list[str]) -> bool:
+    """Checks if a command can be run by the daemon
+
+    Parameters
+    ----------
+    argv: list[str]
+        Arguments of the command
+
+    Returns
+    -------
+    forwardable: bool
+        Boolean value that indicates if the command can be sent to the daemon
+    """
+    return bool(argv) and argv[0] in ANNOTATIONS and LOCAL_ARGUMENTS.isdisjoint(argv)
+
+
+def terminal_width() -> Optional[int]:
+    """Returns the width of the terminal of the client, if the output is a terminal"""
+    try:
+        return os.get_terminal_size(sys.stdout.fileno()).columns
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def build_request(argv: list[str], database_path: str) -> dict[str, Any]:
+    """Returns the request sent to the daemon to run a command
+
+    Parameters
+    ----------
+    argv: list[str]
+        Arguments of the command
+
+    database_path: str
+        Path of the database the command uses
+
+    Returns
+    -------
+    request: dict[str, Any]
+        Arguments, database, and how the output of the client is displayed
+    """
+    width = terminal_width()
+
+    return {
+        "argv": argv,
+        "database": os.path.abspath(database_path),
+        "terminal": width is not None,
+        "width": width,
+        "colorterm": os.environ.get("COLORTERM"),
+        "no_color": "NO_COLOR" in os.environ,
+    }
+
+
+def run_client(argv: list[str]) -> bool:
+    """Runs the command in the daemon, when it's running
+
+    Parameters
+    ----------
+    argv: list[str]
+        Arguments of the command
+
+    Returns
+    -------
+    done: bool
+        Boolean value that indicates if the daemon ran the command. It's False when the command must be run locally,
+        because the daemon isn't running, it uses another database or the command can't be run by it
+    """
+    if not forwardable(argv):
+        return False
+
+    import socket
+
+    if not hasattr(socket, "AF_UNIX"):
+        return False
+
+    path = socket_path()
+    if not owned_socket(path):
+        return False
+
+    import json
+
+    from codenotes.config import MEMORY_DATABASE, database_path
+
+    database = database_path()
+    if database == MEMORY_DATABASE:
+        return False  # A temporary database for this command only
+    request = build_request(argv, database)
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(path)
+            client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+
+            response = client.makefile("rb")
+            if response.readline() != STATUS_OK:
+                return False
+        except OSError:
+            return False  # The daemon isn't running anymore, the socket is stale
+
+        output = getattr(sys.stdout, "buffer", None)
+        try:
+            while chunk := response.read1(CHUNK_SIZE):
+                if output is not None:
+                    output.write(chunk)
+                    output.flush()
+                else:
+                    sys.stdout.write(chunk.decode("utf-8", errors="replace"))
+                    sys.stdout.flush()
+        except KeyboardInterrupt:
+            pass  # Closing the connection stops the command in the daemon
+
+        except BrokenPipeError:
+            # The output was closed before the end (e.g. piped to head). Like the note on SIGPIPE of the signal module
+            # recommends, the rest goes to devnull so Python doesn't fail again flushing the output at exit
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, sys.stdout.fileno())
+
+        except OSError:
+            pass  # The connection with the daemon was lost
+
+    return True
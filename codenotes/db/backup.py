@@ -0,0 +1,273 @@
+""" Module to copy the database while it's used, and to export and restore it as compressed JSON Lines
+
+The backup uses the online backup API of SQLite, which copies the pages of the database in steps and lets the other
+connections write between them. The export is a text file that doesn't depend on the version of SQLite, so it can be
+moved between machines. Both the export and the restore read and write the rows as a stream, so they use the same
+memory no matter the size of the database.
+
+Format of the export: gzip-compressed JSON Lines. The first line is an object with the version of the schema, then each
+table is written as an object with its name and columns, followed by a JSON array with the values of each row.
+"""
+import gzip
+import json
+import os
+import sqlite3
+from typing import IO, Any, Callable, Final, Iterator, Optional
+
+import codenotes.db.utilities.note_imports as note_imports
+import codenotes.db.utilities.notes as notes
+import codenotes.db.utilities.notes_categories as notes_categories
+import codenotes.db.utilities.tasks as tasks
+import codenotes.db.utilities.tasks_categories as tasks_categories
+from codenotes.db.connection import SQLiteConnection
+from codenotes.db.migrations import SCHEMA_VERSION
+from codenotes.exceptions import InvalidBackupError
+
+# Tables exported, with the categories before its annotations. The full-text indexes aren't exported, because its
+# triggers fill them again while the annotations are restored
+TABLES: Final[tuple[str, ...]] = (
+    tasks_categories.TABLE_NAME,
+    notes_categories.TABLE_NAME,
+    tasks.TABLE_NAME,
+    notes.TABLE_NAME,
+    note_imports.TABLE_NAME,
+)
+
+# Default number of pages copied in each step of the backup, the other connections can write between steps
+BACKUP_PAGES: Final[int] = 1024
+
+COMPRESS_LEVEL: Final[int] = 6
+
+
+def backup_database(
+    db: SQLiteConnection,
+    path: str,
+    pages: int = BACKUP_PAGES,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> None:
+    """Copies the database into a file, without blocking the other connections while it's copied
+
+    The copy is written in a temporary file next to the path, that replaces the file of the path when it's complete,
+    so an interrupted backup never leaves a broken database
+
+    Parameters
+    ----------
+    db: SQLiteConnection
+        Connection with the database copied
+
+    path: str
+        Path of the copy
+
+    pages: int
+        Number of pages copied in each step (Default 1024)
+
+    progress: Optional[Callable[[int, int], None]]
+        Function called after each step with the number of pages copied and the total of pages
+    """
+    temporary_path = f"{path}.tmp"
+    target = sqlite3.connect(temporary_path)
+
+    try:
+        if progress is not None:
+            db.connection.backup(target, pages=pages, progress=lambda _, left, total: progress(total - left, total))
+        else:
+            db.connection.backup(target, pages=pages)
+        target.close()
+
+        os.replace(temporary_path, path)
+
+    except BaseException:
+        target.close()
+        os.remove(temporary_path)
+        raise
+
+
+def export_rows(db: SQLiteConnection) -> Iterator[Any]:
+    """Reads the lines of the export, while the rows are read from the database
+
+    Parameters
+    ----------
+    db: SQLiteConnection
+        Connection with the database exported
+
+    Returns
+    -------
+    lines: Iterator[Any]
+        Header, and the name and columns of each table followed by its rows
+    """
+    yield {"codenotes": "export", "schema": SCHEMA_VERSION}
+
+    for table in TABLES:
+        cursor = db.exec_sql(f"SELECT * FROM {table}")
+
+        yield {"table": table, "columns": [column[0] for column in cursor.description]}
+        yield from cursor
+
+
+def export_database(db: SQLiteConnection, file: IO[bytes]) -> int:
+    """Writes every table of the database as compressed JSON Lines
+
+    The tables are read in a single transaction, so the export is consistent even when other connections write
+    meanwhile
+
+    Parameters
+    ----------
+    db: SQLiteConnection
+        Connection with the database exported
+
+    file: IO[bytes]
+        Binary file where the export is written
+
+    Returns
+    -------
+    rows: int
+        Number of rows exported
+    """
+    rows_count = 0
+
+    db.exec_sql("BEGIN")  # Same snapshot for every table
+    try:
+        with gzip.GzipFile(fileobj=file, mode="wb", compresslevel=COMPRESS_LEVEL) as compressed:
+            for line in export_rows(db):
+                compressed.write(json.dumps(line, ensure_ascii=False).encode("utf-8"))
+                compressed.write(b"\n")
+                rows_count += isinstance(line, tuple)
+    finally:
+        db.commit()
+
+    return rows_count
+
+
+def restore_database(db: SQLiteConnection, file: IO[bytes], replace: bool = False) -> int:
+    """Restores the tables of an export, in a single transaction
+
+    Parameters
+    ----------
+    db: SQLiteConnection
+        Connection with the database where the export is restored
+
+    file: IO[bytes]
+        Binary file with the export
+
+    replace: bool
+        Deletes the annotations and categories of the database before restoring. Otherwise, the database must not
+        have any of them, besides the default categories
+
+    Returns
+    -------
+    rows: int
+        Number of rows restored
+
+    Raises
+    ------
+    InvalidBackupError
+        When the file isn't an export of codenotes, it was exported by a newer version or the database isn't empty
+    """
+    with gzip.GzipFile(fileobj=file, mode="rb") as compressed:
+        lines = (json.loads(line) for line in compressed)
+
+        try:
+            header = next(lines, None)
+        except (OSError, EOFError, ValueError) as error:
+            raise InvalidBackupError(f"The file isn't an export of codenotes ({error})") from error
+
+        if not isinstance(header, dict) or header.get("codenotes") != "export":
+            raise InvalidBackupError("The file isn't an export of codenotes")
+        if not isinstance(header.get("schema"), int) or header["schema"] > SCHEMA_VERSION:
+            raise InvalidBackupError("The file was exported by a newer version of codenotes")
+
+        db.exec_sql("BEGIN IMMEDIATE")
+        try:
+            if not replace and not database_empty(db):
+                raise InvalidBackupError("The database already has annotations, use --force to replace them")
+
+            for table in reversed(TABLES):
+                db.exec_sql(f"DELETE FROM {table}")  # Even the default categories, which are in the export
+
+            rows_count = 0
+            for table, columns, rows in _tables_rows(db, lines):
+                sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+                rows_count += db.exec_many(sql, rows).rowcount
+
+            db.commit()
+            return rows_count
+
+        except (OSError, EOFError, ValueError, sqlite3.Error) as error:  # Rows with other fields or invalid values
+            db.connection.rollback()
+            raise InvalidBackupError(f"The export is damaged ({error})") from error
+
+        except BaseException:
+            db.connection.rollback()
+            raise
+
+
+def database_empty(db: SQLiteConnection) -> bool:
+    """Checks if the database doesn't have annotations nor categories, besides the default ones
+
+    Parameters
+    ----------
+    db: SQLiteConnection
+        Connection with the database
+
+    Returns
+    -------
+    empty: bool
+        Boolean value that indicates if the database is empty
+    """
+    for table in (tasks.TABLE_NAME, notes.TABLE_NAME):
+        if db.exec_sql(f"SELECT 1 FROM {table} LIMIT 1").fetchone() is not None:
+            return False
+
+    for table, id_column in (
+        (tasks_categories.TABLE_NAME, tasks_categories.COLUMN_ID),
+        (notes_categories.TABLE_NAME, notes_categories.COLUMN_ID),
+    ):
+        if db.exec_sql(f"SELECT 1 FROM {table} WHERE {id_column} > 1 LIMIT 1").fetchone() is not None:
+            return False
+    return True
+
+
+def _tables_rows(
+    db: SQLiteConnection, lines: Iterator[Any]
+) -> Iterator[tuple[str, list[str], Iterator[tuple]]]:
+    """Splits the lines of an export in the rows of each table
+
+    The rows of a table must be read before the next table is read, as executemany does
+
+    Parameters
+    ----------
+    db: SQLiteConnection
+        Connection with the database, used to check the tables and columns of the export
+
+    lines: Iterator[Any]
+        Lines of the export, after the header
+
+    Returns
+    -------
+    tables: Iterator[tuple[str, list[str], Iterator[tuple]]]
+        Name, columns and rows of each table
+    """
+    line = next(lines, None)
+
+    while line is not None:
+        if not isinstance(line, dict) or line.get("table") not in TABLES:
+            raise ValueError(f"unknown table in line {line!r:.80}")
+
+        table = line["table"]
+        table_columns = {column[1] for column in db.exec_sql(f"PRAGMA table_info({table})")}
+        columns = line.get("columns")
+
+        if not isinstance(columns, list) or not columns or not set(columns) <= table_columns:
+            raise ValueError(f"unknown columns of {table}")
+
+        next_line: list[Any] = [None]
+
+        def rows() -> Iterator[tuple]:
+            for row in lines:
+                if not isinstance(row, list):
+                    next_line[0] = row  # Name of the next table
+                    return
+                yield tuple(row)
+
+        yield table, columns, rows()
+        line = next_line[0]
@@ -1,12 +1,13 @@
+import atexit
 import os
 import sqlite3
+import sys
+from contextlib import contextmanager
 from sqlite3.dbapi2 import Connection, Cursor
-from typing import Any, AnyStr, Final, Optional
+from typing import Any, Callable, Iterable, Iterator, Optional
 
-import codenotes.db.utilities.notes as notes
-import codenotes.db.utilities.notes_categories as notes_categories
-import codenotes.db.utilities.tasks as tasks
-import codenotes.db.utilities.tasks_categories as tasks_categories
+import codenotes.db.migrations as migrations
+import codenotes.config as config
 
 
 class SQLiteConnection:
@@ -15,57 +16,71 @@ class SQLiteConnection:
 
     Class has the purpouse to manage the connection with the database created with
     sqlite3. Everytime the constructor is executed, it connects to the database, then
-    execute the SQL statements that creates the tables if they not exist. Also, this class
+    applies the pragmas of the configuration (WAL journal mode by default, so many processes can read while one
+    writes) and the schema migrations that the database doesn't have yet. Also, this class
     allows you to execute sql, commit the transactions and close the connection with
     the database.
 
     Attributes
     ---------
-    BASE_DIR: Final[AnyStr]
-        Root path where the __main__ is executed
-
-    DATABASE_NAME:Final[str]
-        Name of the database
-
-    DATABASE_PATH: Final[str]
-        Complete path where is the database (its getted after joinning BASE_DIR & DATABASE_NAME)
+    database_path: str
+        Path of the database, or :memory: for a temporary database
 
     connection: Connection
-        Connection with the database specified in DATABASE_PATH
+        Connection with the database specified in database_path
 
     cursor: Cursor
         Cursor created to interact with the database
     """
 
-    BASE_DIR: Final[AnyStr] = os.path.dirname(
-        os.path.dirname(os.path.abspath(__file__))
-    )
-    DATABASE_NAME: Final[str] = "codenotes.db"
-    DATABASE_PATH: Final[str] = os.path.join(BASE_DIR, DATABASE_NAME)
-
+    database_path: str
     connection: Connection
     cursor: Cursor
 
-    def __init__(self) -> None:
-        """SQLiteConnection Constructor"""
-        self.connection = sqlite3.connect(self.DATABASE_PATH)
-        self.cursor = self.connection.cursor()
+    def __init__(
+        self,
+        database_path: Optional[str] = None,
+        pragmas: Optional[dict[str, str]] = None,
+        check_same_thread: bool = True,
+    ) -> None:
+        """SQLiteConnection Constructor
 
-        self.exec_sql(notes_categories.CREATE_TABLE)  # Notes Category Table
-        self.cursor.execute(
-            notes_categories.INSERT_DEFAULT_CATEGORY
-        )  # Insert Default Category
-        self.exec_sql(notes.CREATE_TABLE)  # Notes Table
+        Parameters
+        ----------
+        database_path: Optional[str]
+            Path of the database (Default the one of the configuration, see codenotes.config.database_path)
 
-        self.exec_sql(tasks_categories.CREATE_TABLE)  # Task Category Table
-        self.cursor.execute(
-            tasks_categories.INSERT_DEFAULT_CATEGORY
-        )  # Insert Default Category
-        self.exec_sql(tasks.CREATE_TABLE)  # Tasks Table
+        pragmas: Optional[dict[str, str]]
+            Pragmas executed after connecting, in order (Default the ones of the configuration)
 
-        self.connection.commit()
+        check_same_thread: bool
+            Only allow using the connection in the thread that created it (Default True). When False, the caller must
+            make sure it's used by one thread at a time
+        """
+        if pragmas is None:
+            pragmas = config.database_pragmas()
+
+        self.database_path = database_path or config.database_path()
+        if self.database_path != config.MEMORY_DATABASE:
+            os.makedirs(os.path.dirname(os.path.abspath(self.database_path)), exist_ok=True)
+
+        busy_timeout = int(pragmas.get("busy_timeout", 5000)) / 1000
+        self.connection = sqlite3.connect(
+            self.database_path, timeout=busy_timeout, check_same_thread=check_same_thread
+        )
+        self.cursor = self.connection.cursor()
+
+        for pragma, value in pragmas.items():
+            self.exec_sql(f"PRAGMA {pragma} = {value}")
+
+        migrations.migrate(self)
 
-    def exec_sql(self, sql: str, values: Optional[tuple[Any]] = None) -> Cursor:
+    def exec_sql(
+        self,
+        sql: str,
+        values: Optional[tuple[Any]] = None,
+        row_factory: Optional[Callable[[Cursor, tuple], Any]] = None,
+    ) -> Cursor:
         """Method that executes sql command
 
         Parameters
@@ -76,14 +91,42 @@ class SQLiteConnection:
         values: tuple[Any]
             Optional argument typo of tuple, which contains the values the sql statement requires
 
+        row_factory: Optional[Callable[[Cursor, tuple], Any]]
+            Function that builds each row read from the cursor, like the from_row methods of the entities (Default
+            rows are read as tuples)
+
         Returns
         -------
         cursor : Cursor
-            Method will return the cursor that the method execute returns
+            Method will return a new cursor with the result, so the results of previous statements that are still
+            being read are not lost
         """
+        if row_factory is not None:
+            cursor = self.connection.cursor()
+            cursor.row_factory = row_factory
+            return cursor.execute(sql, values if values is not None else ())
+
         if values is not None:
-            return self.cursor.execute(sql, values)
-        return self.cursor.execute(sql)
+            return self.connection.execute(sql, values)
+        return self.connection.execute(sql)
+
+    def exec_many(self, sql: str, values: Iterable[tuple[Any]]) -> Cursor:
+        """Method that executes a sql command once for every set of values
+
+        Parameters
+        ----------
+        sql : str
+            SQL statement to be executed
+
+        values: Iterable[tuple[Any]]
+            Iterable of tuples, each one with the values the sql statement requires
+
+        Returns
+        -------
+        cursor : Cursor
+            Method will return a new cursor with the result
+        """
+        return self.connection.executemany(sql, values)
 
     def commit(self) -> None:
         """Commits the current transaction"""
@@ -93,3 +136,92 @@ class SQLiteConnection:
         """Close database and cursor connection"""
         self.cursor.close()
         self.connection.close()
+
+
+_connection: Optional[SQLiteConnection] = None
+_database_path: Optional[str] = None
+
+
+def set_database_path(database_path: Optional[str]) -> None:
+    """Sets the database used by the shared connection the next time it's opened
+
+    Parameters
+    ----------
+    database_path: Optional[str]
+        Path of the database, None to use the one of the configuration
+    """
+    global _database_path
+
+    _database_path = database_path
+
+
+def get_connection() -> SQLiteConnection:
+    """Returns the connection shared by the whole process, opening it the first time
+
+    The connection is closed with close_connection(), or when the interpreter exits
+
+    Returns
+    -------
+    db: SQLiteConnection
+        Connection with the database
+    """
+    global _connection
+
+    if _connection is None:
+        _connection = SQLiteConnection(_database_path)
+        atexit.register(_close_at_exit)
+    return _connection
+
+
+def close_connection(commit: bool = True) -> None:
+    """Closes the shared connection, if it's open
+
+    Parameters
+    ----------
+    commit: bool
+        Commit the changes not committed yet, otherwise they are rolled back (Default True)
+    """
+    global _connection
+
+    if _connection is not None:
+        atexit.unregister(_close_at_exit)
+        try:
+            if commit:
+                _connection.commit()
+            else:
+                _connection.connection.rollback()
+        finally:
+            _connection.close()
+            _connection = None
+
+
+def _close_at_exit() -> None:
+    """Closes the shared connection when the interpreter exits, rolling back the changes when it exits because of an
+    exception not handled"""
+    close_connection(commit=getattr(sys, "last_value", None) is None)
+
+
+@contextmanager
+def shared_connection() -> Iterator[SQLiteConnection]:
+    """Context manager that provides the shared connection, and closes it when exits. The changes are committed, or
+    rolled back when it exits because of an exception
+
+    When the connection was already open, it's left open for the code that opened it
+
+    Returns
+    -------
+    db: Iterator[SQLiteConnection]
+        Connection with the database
+    """
+    opened = _connection is None
+    try:
+        yield get_connection()
+
+    except BaseException:
+        if opened:
+            close_connection(commit=False)  # The command didn't finish
+        raise
+
+    else:
+        if opened:
+            close_connection()
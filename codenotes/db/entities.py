@@ -1,9 +1,35 @@
+""" Module with the entities built from the rows of the database
+
+The entities are frozen and slotted, so they can be shared and kept in caches, and each one only uses the memory of
+its fields. The slots are declared by hand, because dataclass(slots=True) needs Python 3.10, so the entities inherit
+from _Entity the methods to be copied and pickled that it would add.
+
+Each entity has a from_row class method, used as row_factory of the cursors, so the rows are read as entities
+without an intermediate tuple being indexed by position.
+"""
 from dataclasses import dataclass
 from datetime import date
+from sqlite3 import Cursor
+from typing import Optional
+
+
+class _Entity:
+    """Base class of the entities, that restores the slots with object.__setattr__ when they are copied or unpickled,
+    because setattr fails in frozen dataclasses
+    """
+
+    __slots__ = ()
+
+    def __getstate__(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
 
+    def __setstate__(self, state: tuple) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
 
-@dataclass
-class Category:
+
+@dataclass(frozen=True)
+class Category(_Entity):
     """Dataclass to store category information
 
     Parameters
@@ -15,6 +41,8 @@ class Category:
         Category name
     """
 
+    __slots__ = ("id", "name")
+
     id: int
     name: str
 
@@ -22,9 +50,28 @@ class Category:
         """Return category name"""
         return self.name
 
+    @classmethod
+    def from_row(cls, cursor: Cursor, row: tuple) -> "Category":
+        """Row factory that builds the category from the id and name columns
+
+        Parameters
+        ----------
+        cursor: Cursor
+            Cursor that read the row
+
+        row: tuple
+            Id and name of the category
+
+        Returns
+        -------
+        category: Category
+            Category of the row
+        """
+        return cls(*row)
+
 
-@dataclass
-class Task:
+@dataclass(frozen=True)
+class Task(_Entity):
     """Dataclass to store task information
 
     Parameters
@@ -35,8 +82,8 @@ class Task:
     content: str
         Task content
 
-    status: str
-        Task status (Incomplete, In Process & Finished)
+    status: int
+        Task status (0 Incomplete, 1 In Process & 2 Finished, see codenotes.util.text.status_text)
 
     category: str
         Category name where is the task stored
@@ -45,12 +92,253 @@ class Task:
         Date when the task was created
     """
 
+    __slots__ = ("id", "content", "status", "category", "creation")
+
     id: int
     content: str
-    status: str
+    status: int
     category: str
     creation: date
 
     def __str__(self) -> str:
         """Return task content"""
         return self.content
+
+    @classmethod
+    def from_row(cls, cursor: Cursor, row: tuple) -> "Task":
+        """Row factory that builds the task from the id, content, status, category name and creation columns
+
+        Parameters
+        ----------
+        cursor: Cursor
+            Cursor that read the row
+
+        row: tuple
+            Columns of the task, with the creation date in ISO format
+
+        Returns
+        -------
+        task: Task
+            Task of the row
+        """
+        task_id, content, status, category, creation = row
+        return cls(task_id, content, status, category, date.fromisoformat(creation))
+
+
+@dataclass(frozen=True)
+class Note(_Entity):
+    """Dataclass to store note information
+
+    Parameters
+    ----------
+    id: int
+        Id of the note
+
+    title: str
+        Note title
+
+    content: Optional[str]
+        Note content
+
+    category: str
+        Category name where is the note stored
+
+    markdown: bool
+        Whether the content is written in markdown
+
+    creation: date
+        Date when the note was created
+    """
+
+    __slots__ = ("id", "title", "content", "category", "markdown", "creation")
+
+    id: int
+    title: str
+    content: Optional[str]
+    category: str
+    markdown: bool
+    creation: date
+
+    def __str__(self) -> str:
+        """Return note title"""
+        return self.title
+
+    @classmethod
+    def from_row(cls, cursor: Cursor, row: tuple) -> "Note":
+        """Row factory that builds the note from the id, title, content, category name, markdown flag and creation
+        columns
+
+        Parameters
+        ----------
+        cursor: Cursor
+            Cursor that read the row
+
+        row: tuple
+            Columns of the note, with the markdown flag as 0 or 1 and the creation date in ISO format
+
+        Returns
+        -------
+        note: Note
+            Note of the row
+        """
+        note_id, title, content, category, markdown, creation = row
+        return cls(note_id, title, content, category, bool(markdown), date.fromisoformat(creation))
+
+
+@dataclass(frozen=True)
+class NoteSummary(_Entity):
+    """Dataclass to store the information of a note listed without its content
+
+    Parameters
+    ----------
+    id: int
+        Id of the note
+
+    title: str
+        Note title
+
+    category: str
+        Category name where is the note stored
+
+    creation: date
+        Date when the note was created
+    """
+
+    __slots__ = ("id", "title", "category", "creation")
+
+    id: int
+    title: str
+    category: str
+    creation: date
+
+    def __str__(self) -> str:
+        """Return note title"""
+        return self.title
+
+    @classmethod
+    def from_row(cls, cursor: Cursor, row: tuple) -> "NoteSummary":
+        """Row factory that builds the summary from the id, title, category name and creation columns
+
+        Parameters
+        ----------
+        cursor: Cursor
+            Cursor that read the row
+
+        row: tuple
+            Columns of the note, with the creation date in ISO format
+
+        Returns
+        -------
+        note: NoteSummary
+            Summary of the note of the row
+        """
+        note_id, title, category, creation = row
+        return cls(note_id, title, category, date.fromisoformat(creation))
+
+
+@dataclass(frozen=True)
+class TaskStats(_Entity):
+    """Dataclass to store the number of tasks of a category created in a period, by status
+
+    Parameters
+    ----------
+    category: str
+        Category name of the tasks
+
+    period: date
+        First day of the period (day, week or month) when the tasks were created
+
+    incomplete: int
+        Number of incomplete tasks
+
+    in_process: int
+        Number of tasks in process
+
+    finished: int
+        Number of finished tasks
+    """
+
+    __slots__ = ("category", "period", "incomplete", "in_process", "finished")
+
+    category: str
+    period: date
+    incomplete: int
+    in_process: int
+    finished: int
+
+    @property
+    def total(self) -> int:
+        """Number of tasks"""
+        return self.incomplete + self.in_process + self.finished
+
+    @classmethod
+    def from_row(cls, cursor: Cursor, row: tuple) -> "TaskStats":
+        """Row factory that builds the stats from the category name, period and count of each status columns
+
+        Parameters
+        ----------
+        cursor: Cursor
+            Cursor that read the row
+
+        row: tuple
+            Columns of the stats, with the period in ISO format
+
+        Returns
+        -------
+        stats: TaskStats
+            Stats of the row
+        """
+        category, period, incomplete, in_process, finished = row
+        return cls(category, date.fromisoformat(period), incomplete, in_process, finished)
+
+
+@dataclass(frozen=True)
+class NoteStats(_Entity):
+    """Dataclass to store the number of notes of a category created in a period, by markdown flag
+
+    Parameters
+    ----------
+    category: str
+        Category name of the notes
+
+    period: date
+        First day of the period (day, week or month) when the notes were created
+
+    plain: int
+        Number of notes written in plain text
+
+    markdown: int
+        Number of notes written in markdown
+    """
+
+    __slots__ = ("category", "period", "plain", "markdown")
+
+    category: str
+    period: date
+    plain: int
+    markdown: int
+
+    @property
+    def total(self) -> int:
+        """Number of notes"""
+        return self.plain + self.markdown
+
+    @classmethod
+    def from_row(cls, cursor: Cursor, row: tuple) -> "NoteStats":
+        """Row factory that builds the stats from the category name, period and count of each markdown flag columns
+
+        Parameters
+        ----------
+        cursor: Cursor
+            Cursor that read the row
+
+        row: tuple
+            Columns of the stats, with the period in ISO format
+
+        Returns
+        -------
+        stats: NoteStats
+            Stats of the row
+        """
+        category, period, plain, markdown = row
+        return cls(category, date.fromisoformat(period), plain, markdown)
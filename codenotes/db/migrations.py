@@ -0,0 +1,177 @@
+""" Module with the versioned migrations of the database schema
+
+The version of the schema is stored in the database with PRAGMA user_version. Every migration is a function that
+receives the connection, and the version of a database is the number of migrations applied to it, so a new migration
+must be appended at the end of MIGRATIONS and the existing ones must never be modified nor reordered.
+
+The statements of the first migrations use IF NOT EXISTS, because databases created before the migrations existed
+already have some of the tables, but its version is 0.
+"""
+import sqlite3
+from typing import TYPE_CHECKING, Callable, Final
+
+import codenotes.db.utilities.note_imports as note_imports
+import codenotes.db.utilities.notes as notes
+import codenotes.db.utilities.notes_categories as notes_categories
+import codenotes.db.utilities.tasks as tasks
+import codenotes.db.utilities.tasks_categories as tasks_categories
+
+if TYPE_CHECKING:
+    from codenotes.db.connection import SQLiteConnection
+
+
+# First version of SQLite with the trigram tokenizer
+TRIGRAM_SQLITE_VERSION: Final[tuple[int, int, int]] = (3, 34, 0)
+
+
+def create_tables(db: "SQLiteConnection") -> None:
+    """Creates the tables of notes, tasks and its categories, and the default category of each one"""
+    db.exec_sql(notes_categories.CREATE_TABLE)  # Notes Category Table
+    db.exec_sql(notes_categories.INSERT_DEFAULT_CATEGORY)  # Insert Default Category
+    db.exec_sql(notes.CREATE_TABLE)  # Notes Table
+
+    db.exec_sql(tasks_categories.CREATE_TABLE)  # Task Category Table
+    db.exec_sql(tasks_categories.INSERT_DEFAULT_CATEGORY)  # Insert Default Category
+    db.exec_sql(tasks.CREATE_TABLE)  # Tasks Table
+
+
+def create_fts_indexes(db: "SQLiteConnection") -> None:
+    """Creates the full-text indexes of notes and tasks, with the triggers that keep them in sync, and fills them with
+    the rows already stored"""
+    for table in (notes, tasks):
+        db.exec_sql(table.CREATE_FTS_TABLE)
+        for trigger in table.CREATE_FTS_TRIGGERS:
+            db.exec_sql(trigger)
+
+        db.exec_sql(table.REBUILD_FTS_TABLE)  # Backfill
+
+
+def create_indexes(db: "SQLiteConnection") -> None:
+    """Creates the indexes used to search by category and creation date, and to look up categories by name
+
+    Category names are indexed as unique, except in databases that already have a duplicated name, where a regular
+    index is created instead
+    """
+    for index in notes.CREATE_INDEXES + tasks.CREATE_INDEXES:
+        db.exec_sql(index)
+
+    for table in (notes_categories, tasks_categories):
+        db.exec_sql("SAVEPOINT name_index")
+        try:
+            db.exec_sql(table.CREATE_NAME_INDEX)
+        except sqlite3.IntegrityError:
+            db.exec_sql("ROLLBACK TO name_index")
+            db.exec_sql(table.CREATE_NAME_INDEX_NOT_UNIQUE)
+        db.exec_sql("RELEASE name_index")
+
+
+def create_note_imports(db: "SQLiteConnection") -> None:
+    """Creates the table with the files already imported by note import, used to resume interrupted imports"""
+    db.exec_sql(note_imports.CREATE_TABLE)
+
+
+def create_notes_summary_indexes(db: "SQLiteConnection") -> None:
+    """Replaces the indexes of notes by category and creation date with ones that also have the title, used by the
+    compact searches of notes"""
+    for index in notes.CREATE_SUMMARY_INDEXES + notes.DROP_INDEXES:
+        db.exec_sql(index)
+
+
+def create_trigram_indexes(db: "SQLiteConnection") -> None:
+    """Creates the trigram indexes of notes and tasks, with the triggers that keep them in sync, and fills them with
+    the rows already stored. SQLite has the trigram tokenizer since 3.34, with older versions the indexes aren't
+    created and the infix and GLOB searches read the whole tables, until migrate() finds a newer SQLite"""
+    if sqlite3.sqlite_version_info < TRIGRAM_SQLITE_VERSION:
+        return
+
+    for table in (notes, tasks):
+        db.exec_sql(table.CREATE_TRIGRAM_TABLE)
+        for trigger in table.CREATE_TRIGRAM_TRIGGERS:
+            db.exec_sql(trigger)
+
+        db.exec_sql(table.REBUILD_TRIGRAM_TABLE)  # Backfill
+
+
+def trigram_indexes_missing(db: "SQLiteConnection") -> bool:
+    """Checks if the trigram indexes can be created but are missing, because the database was migrated with a SQLite
+    older than 3.34
+
+    Parameters
+    ----------
+    db: SQLiteConnection
+        Connection with the database
+
+    Returns
+    -------
+    missing: bool
+        Boolean value that indicates if create_trigram_indexes must be run again
+    """
+    if sqlite3.sqlite_version_info < TRIGRAM_SQLITE_VERSION:
+        return False
+
+    sql = "SELECT count(*) FROM sqlite_master WHERE type = 'table' AND name IN (?, ?)"
+    return db.exec_sql(sql, (notes.TRIGRAM_TABLE_NAME, tasks.TRIGRAM_TABLE_NAME)).fetchone()[0] < 2
+
+
+MIGRATIONS: Final[tuple[Callable[["SQLiteConnection"], None], ...]] = (
+    create_tables,  # Version 1
+    create_fts_indexes,  # Version 2
+    create_indexes,  # Version 3
+    create_note_imports,  # Version 4
+    create_notes_summary_indexes,  # Version 5
+    create_trigram_indexes,  # Version 6
+)
+
+SCHEMA_VERSION: Final[int] = len(MIGRATIONS)
+
+
+def schema_version(db: "SQLiteConnection") -> int:
+    """Returns the version of the schema stored in the database
+
+    Parameters
+    ----------
+    db: SQLiteConnection
+        Connection with the database
+
+    Returns
+    -------
+    version: int
+        Number of migrations applied to the database
+    """
+    return db.exec_sql("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(db: "SQLiteConnection") -> None:
+    """Applies the migrations that the database doesn't have yet
+
+    When the database is up to date, it only reads its version and schema, so it doesn't take a write lock nor write
+    to disk. Otherwise, all the pending migrations are applied in a single transaction. The trigram indexes are also
+    created in a database already migrated when they are missing, because it was migrated with an older SQLite.
+
+    Parameters
+    ----------
+    db: SQLiteConnection
+        Connection with the database
+    """
+    if schema_version(db) >= SCHEMA_VERSION and not trigram_indexes_missing(db):
+        return
+
+    db.exec_sql("BEGIN IMMEDIATE")
+    try:
+        # Another process may have migrated the database while waiting for the lock
+        version = schema_version(db)
+
+        if version < SCHEMA_VERSION:
+            for migration in MIGRATIONS[version:]:
+                migration(db)
+
+            db.exec_sql(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+        if trigram_indexes_missing(db):
+            create_trigram_indexes(db)
+
+        db.commit()
+
+    except BaseException:
+        db.connection.rollback()
+        raise
@@ -0,0 +1,769 @@
+""" Module with the repositories used to read and store data of the database """
+from datetime import date
+from types import ModuleType
+from typing import Final, Iterable, Iterator, Optional, final
+
+import codenotes.db.utilities.notes as notes
+import codenotes.db.utilities.notes_categories as notes_categories
+import codenotes.db.utilities.tasks as tasks
+import codenotes.db.utilities.tasks_categories as tasks_categories
+from codenotes.db.connection import SQLiteConnection, get_connection
+from codenotes.db.entities import Category, Note, NoteStats, NoteSummary, Task, TaskStats
+from codenotes.exceptions import CategoryNotExistsError
+from codenotes.util.sql import Select, fts_match_text, like_pattern
+
+# Id and name columns of the categories table of each type of annotation
+CATEGORY_TABLES: Final[dict[str, tuple[str, str]]] = {
+    tasks_categories.TABLE_NAME: (tasks_categories.COLUMN_ID, tasks_categories.COLUMN_NAME),
+    notes_categories.TABLE_NAME: (notes_categories.COLUMN_ID, notes_categories.COLUMN_NAME),
+}
+
+# Expression of the first day of each period of the stats, from the creation date (column) of the annotations
+PERIODS: Final[dict[str, str]] = {
+    "day": "{column}",
+    "week": "date({column}, '-6 days', 'weekday 1')",
+    "month": "date({column}, 'start of month')",
+}
+
+# Max number of names searched with a single IN (...), below the limit of parameters of SQLite
+CHUNK_SIZE: Final[int] = 500
+
+# Ways the text of the searches is matched: words (or its beginning) with the full-text index, any part of the text
+# (infix), or a GLOB pattern of the whole text. The last two use the trigram index, when the database has it
+MATCHES: Final[tuple[str, ...]] = ("words", "infix", "glob")
+
+
+@final
+class CategoryRepository:
+    """Class to look up and store the categories of a type of annotation
+
+    All the categories of the table are read the first time one is looked up, and kept by its name, so looking up
+    categories doesn't query the database again. The categories stored with this class are added to them, and names
+    that aren't found are searched in the database, in case another process created them.
+
+    Attributes
+    ----------
+    table_name: str
+        Name of the categories table
+
+    id_column: str
+        Name of the id column of the table
+
+    name_column: str
+        Name of the name column of the table
+
+    db: SQLiteConnection
+        Connection with the dabatase
+    """
+
+    table_name: str
+    id_column: str
+    name_column: str
+    db: SQLiteConnection
+
+    def __init__(self, table_name: str, db: SQLiteConnection) -> None:
+        """CategoryRepository Constructor
+
+        Parameters
+        ----------
+        table_name: str
+            Name of the categories table (one of CATEGORY_TABLES)
+
+        db: SQLiteConnection
+            Connection with the database
+        """
+        self.table_name = table_name
+        self.id_column, self.name_column = CATEGORY_TABLES[table_name]
+        self.db = db
+        self.__ids: Optional[dict[str, int]] = None
+
+    @property
+    def ids(self) -> dict[str, int]:
+        """Id of every category known, by its name, reading them from the database the first time"""
+        if self.__ids is None:
+            sql = f"SELECT {self.name_column}, {self.id_column} FROM {self.table_name} ORDER BY {self.id_column}"
+
+            self.__ids = {}
+            for name, category_id in self.db.exec_sql(sql):
+                self.__ids.setdefault(name, category_id)  # Older databases may have duplicated names
+        return self.__ids
+
+    def get_id(self, name: str) -> Optional[int]:
+        """Returns the id of a category
+
+        Parameters
+        ----------
+        name: str
+            Name of the category
+
+        Returns
+        -------
+        category_id: Optional[int]
+            Id of the category, or None if it doesn't exist
+        """
+        return self.resolve((name,)).get(name)
+
+    def exists(self, name: str) -> bool:
+        """Checks if a category exists
+
+        Parameters
+        ----------
+        name: str
+            Name of the category
+
+        Returns
+        -------
+        exists: bool
+            Boolean value flag if the category exists
+        """
+        return self.get_id(name) is not None
+
+    def resolve(self, names: Iterable[str]) -> dict[str, int]:
+        """Returns the id of many categories at once
+
+        Parameters
+        ----------
+        names: Iterable[str]
+            Name of the categories
+
+        Returns
+        -------
+        ids: dict[str, int]
+            Id of the categories that exist, by its name
+        """
+        names = set(names)
+        missing_names = [name for name in names if name not in self.ids]
+
+        for i in range(0, len(missing_names), CHUNK_SIZE):
+            chunk = missing_names[i:i + CHUNK_SIZE]
+            sql = (
+                f"SELECT {self.name_column}, {self.id_column} FROM {self.table_name} "
+                f"WHERE {self.name_column} IN ({','.join('?' * len(chunk))})"
+            )
+            self.ids.update(self.db.exec_sql(sql, tuple(chunk)))
+
+        return {name: self.ids[name] for name in names if name in self.ids}
+
+    def add(self, name: str) -> int:
+        """Stores a new category, without committing it
+
+        Parameters
+        ----------
+        name: str
+            Name of the category
+
+        Returns
+        -------
+        category_id: int
+            Id of the category created
+        """
+        sql = f"INSERT INTO {self.table_name} ({self.name_column}) VALUES (?)"
+        category_id = self.db.exec_sql(sql, (name,)).lastrowid
+
+        self.ids[name] = category_id
+        return category_id
+
+    def add_many(self, names: Iterable[str]) -> dict[str, int]:
+        """Stores the categories that don't exist yet, without committing them
+
+        The names are deduplicated and looked up at once, and the new ones are inserted with a single executemany.
+        INSERT OR IGNORE skips the names that were created by another process in the meantime, thanks to the unique
+        index of the names
+
+        Parameters
+        ----------
+        names: Iterable[str]
+            Name of the categories
+
+        Returns
+        -------
+        ids: dict[str, int]
+            Id of the categories created, by its name
+        """
+        names = list(dict.fromkeys(names))  # Without duplicates, in the order they are created
+        existing_ids = self.resolve(names)
+        new_names = [name for name in names if name not in existing_ids]
+
+        if not new_names:
+            return {}
+
+        sql = f"INSERT OR IGNORE INTO {self.table_name} ({self.name_column}) VALUES (?)"
+        self.db.exec_many(sql, ((name,) for name in new_names))
+
+        return self.resolve(new_names)
+
+    def search(self, text: Optional[str] = None) -> Iterator[Category]:
+        """Searches categories by its name, in creation order
+
+        Parameters
+        ----------
+        text: Optional[str]
+            Text that the name of the categories must contain (Default all the categories)
+
+        Returns
+        -------
+        categories: Iterator[Category]
+            Categories found, read from the database while they are iterated
+        """
+        select = Select(f"{self.id_column}, {self.name_column}", self.table_name)
+
+        if text:
+            select.where(f"{self.name_column} LIKE ? ESCAPE '\\'", like_pattern(text))
+        select.order_by(self.id_column)
+
+        return self.db.exec_sql(select.sql(), select.values(), Category.from_row)
+
+
+_category_repositories: dict[str, CategoryRepository] = {}
+
+
+def get_category_repository(table_name: str) -> CategoryRepository:
+    """Returns the categories repository of a type of annotation shared by the whole process
+
+    The repository is created again when the shared connection changes, so it never has categories of another
+    database
+
+    Parameters
+    ----------
+    table_name: str
+        Name of the categories table (one of CATEGORY_TABLES)
+
+    Returns
+    -------
+    repository: CategoryRepository
+        Repository of the categories of the table
+    """
+    db = get_connection()
+    repository = _category_repositories.get(table_name)
+
+    if repository is None or repository.db is not db:
+        repository = _category_repositories[table_name] = CategoryRepository(table_name, db)
+    return repository
+
+
+def clear_category_repositories() -> None:
+    """Forgets the categories repositories shared by the process, so the categories are read again. Used after a
+    rollback, which may remove categories they have
+    """
+    _category_repositories.clear()
+
+
+def _select_annotations(
+    table: ModuleType,
+    categories_table: ModuleType,
+    columns: str,
+    text: Optional[str] = None,
+    category_id: Optional[int] = None,
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+    after: Optional[int] = None,
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+    sort: str = "category",
+    descending: bool = False,
+    match: str = "words",
+    trigram: bool = False,
+) -> Select:
+    """Builds the query of the tasks or notes searched, ordered by category and id
+
+    The annotations are always ordered by the name of its category first, so they can be grouped by category while
+    they are read. The sort key orders the annotations of each category, and the id breaks the ties
+
+    Parameters
+    ----------
+    table: ModuleType
+        Utility module of the annotations table (tasks or notes)
+
+    categories_table: ModuleType
+        Utility module of the categories table of the annotations
+
+    columns: str
+        Columns selected
+
+    text: Optional[str]
+        Words that the annotations must contain, searched in its full-text index
+
+    category_id: Optional[int]
+        Id of the category of the annotations
+
+    since: Optional[date]
+        First creation date of the annotations
+
+    until: Optional[date]
+        Last creation date of the annotations
+
+    after: Optional[int]
+        Id of the annotation after which the search continues, in category and id order
+
+    limit: Optional[int]
+        Max number of annotations
+
+    offset: Optional[int]
+        Number of annotations skipped
+
+    sort: str
+        Key used to sort the annotations of each category, category (Default, or relevance when text is searched
+        without pages) or one of the SORT_COLUMNS of the table
+
+    descending: bool
+        Reverses the order of the annotations, including the order of the categories
+
+    match: str
+        Way the text is matched, one of MATCHES (Default words)
+
+    trigram: bool
+        Whether the table has a trigram index, used by the infix and GLOB searches instead of reading the whole table
+
+    Returns
+    -------
+    select: Select
+        Query of the annotations
+    """
+    select = Select(columns, table.TABLE_NAME).join(
+        categories_table.TABLE_NAME,
+        f"{table.TABLE_NAME}.{table.COLUMN_CATEGORY} = {categories_table.TABLE_NAME}.{categories_table.COLUMN_ID}",
+    )
+
+    if match not in MATCHES:
+        raise ValueError(f"Unknown match: {match}")
+
+    if text and match == "words":
+        select.join(table.FTS_TABLE_NAME, f"{table.FTS_TABLE_NAME}.rowid = {table.TABLE_NAME}.{table.COLUMN_ID}")
+
+    if since is not None:
+        select.where(f"{table.COLUMN_CREATION} >= ?", since.isoformat())
+    if until is not None:
+        select.where(f"{table.COLUMN_CREATION} <= ?", until.isoformat())
+
+    if text and match == "words":
+        select.where(f"{table.FTS_TABLE_NAME} MATCH ?", fts_match_text(text))
+    elif text:
+        _where_substring(select, table, text, match, trigram)
+
+    if category_id is not None:
+        select.where(f"{table.COLUMN_CATEGORY} = ?", category_id)
+
+    if sort != "category" and sort not in table.SORT_COLUMNS:
+        raise ValueError(f"Unknown sort key: {sort}")
+
+    # Qualified and plain name of each column of the order, the plain ones are used by the subquery of --after
+    order_columns = [(f"{categories_table.TABLE_NAME}.{categories_table.COLUMN_NAME}", categories_table.COLUMN_NAME)]
+    if sort != "category":
+        order_columns.append((f"{table.TABLE_NAME}.{table.SORT_COLUMNS[sort]}", table.SORT_COLUMNS[sort]))
+    order_columns.append((f"{table.TABLE_NAME}.{table.COLUMN_ID}", table.COLUMN_ID))
+
+    if after is not None:
+        select.where(
+            f"({', '.join(column for column, _ in order_columns)}) {'<' if descending else '>'} "
+            f"(SELECT {', '.join(column for _, column in order_columns)} FROM {table.TABLE_NAME} INNER JOIN "
+            f"{categories_table.TABLE_NAME} ON {table.COLUMN_CATEGORY} = {categories_table.COLUMN_ID} WHERE "
+            f"{table.COLUMN_ID} = ?)",
+            after,
+        )
+
+    direction = " DESC" if descending else ""
+    select.order_by(f"{order_columns[0][0]}{direction}")
+    if sort == "category" and text and match == "words" and limit is None and offset is None and after is None:
+        select.order_by(f"{table.FTS_TABLE_NAME}.rank")  # Best matches first, when pages don't need a stable order
+    select.order_by(*(f"{column}{direction}" for column, _ in order_columns[1:]))
+
+    return select.limit(limit, offset)
+
+
+def _where_substring(select: Select, table: ModuleType, text: str, match: str, trigram: bool) -> None:
+    """Adds the condition of the annotations whose text contains the text searched, or matches it as GLOB pattern
+
+    With the trigram index, the ids of the annotations are looked up in the index, which only reads the whole index
+    when the text doesn't have 3 characters in a row without wildcards. The index can't escape the wildcards of LIKE,
+    so the infix searches with % or _ are checked again in the table
+
+    Parameters
+    ----------
+    select: Select
+        Query of the annotations
+
+    table: ModuleType
+        Utility module of the annotations table (tasks or notes)
+
+    text: str
+        Text searched in the TEXT_COLUMNS of the table
+
+    match: str
+        infix or glob
+
+    trigram: bool
+        Whether the table has a trigram index
+    """
+    if trigram:
+        operator, pattern = ("GLOB", text) if match == "glob" else ("LIKE", f"%{text}%")
+        subqueries = " UNION ".join(
+            f"SELECT rowid FROM {table.TRIGRAM_TABLE_NAME} WHERE {column} {operator} ?" for column in table.TEXT_COLUMNS
+        )
+        select.where(f"{table.TABLE_NAME}.{table.COLUMN_ID} IN ({subqueries})", *[pattern] * len(table.TEXT_COLUMNS))
+
+        if match == "glob" or ("%" not in text and "_" not in text):
+            return  # The index matched the text exactly
+
+    if match == "glob":
+        condition, pattern = "GLOB ?", text
+    else:
+        condition, pattern = "LIKE ? ESCAPE '\\'", like_pattern(text)
+
+    select.where(
+        f"({' OR '.join(f'{table.TABLE_NAME}.{column} {condition}' for column in table.TEXT_COLUMNS)})",
+        *[pattern] * len(table.TEXT_COLUMNS),
+    )
+
+
+def _trigram_index(db: SQLiteConnection, table: ModuleType, filters: dict) -> bool:
+    """Checks if the table has a trigram index, only when the search uses it
+
+    Parameters
+    ----------
+    db: SQLiteConnection
+        Connection with the database
+
+    table: ModuleType
+        Utility module of the annotations table (tasks or notes)
+
+    filters: dict
+        Filters of the search, see the parameters of _select_annotations
+
+    Returns
+    -------
+    trigram: bool
+        Boolean value that indicates if the search can use the trigram index
+    """
+    if not filters.get("text") or filters.get("match", "words") == "words":
+        return False
+
+    sql = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?"
+    return db.exec_sql(sql, (table.TRIGRAM_TABLE_NAME,)).fetchone() is not None
+
+
+def _select_stats(table: ModuleType, categories_table: ModuleType, counts: str, period: str) -> Select:
+    """Builds the query that counts the tasks or notes of each category created in each period
+
+    The rows are aggregated by the database, grouped by the category id and the period of the creation date, the
+    columns of the category and creation index, so the annotations are never read one by one
+
+    Parameters
+    ----------
+    table: ModuleType
+        Utility module of the annotations table (tasks or notes)
+
+    categories_table: ModuleType
+        Utility module of the categories table of the annotations
+
+    counts: str
+        Aggregate columns selected after the category name and the period
+
+    period: str
+        Length of the periods (day, week or month, one of PERIODS)
+
+    Returns
+    -------
+    select: Select
+        Query of the stats, ordered by category name and period
+    """
+    if period not in PERIODS:
+        raise ValueError(f"Unknown period: {period}")
+
+    period_column = PERIODS[period].format(column=f"{table.TABLE_NAME}.{table.COLUMN_CREATION}")
+
+    return (
+        Select(
+            f"{categories_table.TABLE_NAME}.{categories_table.COLUMN_NAME}, {period_column} AS period, {counts}",
+            table.TABLE_NAME,
+        )
+        .join(
+            categories_table.TABLE_NAME,
+            f"{table.TABLE_NAME}.{table.COLUMN_CATEGORY} = {categories_table.TABLE_NAME}.{categories_table.COLUMN_ID}",
+        )
+        .group_by(f"{table.TABLE_NAME}.{table.COLUMN_CATEGORY}", "period")
+        .order_by(f"{categories_table.TABLE_NAME}.{categories_table.COLUMN_NAME}", "period")
+    )
+
+
+@final
+class TaskRepository:
+    """Class to search and store tasks, as Task entities
+
+    Attributes
+    ----------
+    COLUMNS: Final[str]
+        Columns selected to build the Task entities, in the order read by Task.from_row
+
+    db: SQLiteConnection
+        Connection with the dabatase
+    """
+
+    COLUMNS: Final[str] = (
+        f"{tasks.TABLE_NAME}.{tasks.COLUMN_ID}, {tasks.TABLE_NAME}.{tasks.COLUMN_CONTENT}, "
+        f"{tasks.TABLE_NAME}.{tasks.COLUMN_STATUS}, {tasks_categories.TABLE_NAME}.{tasks_categories.COLUMN_NAME}, "
+        f"{tasks.TABLE_NAME}.{tasks.COLUMN_CREATION}"
+    )
+
+    db: SQLiteConnection
+
+    def __init__(self, db: SQLiteConnection) -> None:
+        """TaskRepository Constructor
+
+        Parameters
+        ----------
+        db: SQLiteConnection
+            Connection with the database
+        """
+        self.db = db
+
+    def search(self, **filters) -> Iterator[Task]:
+        """Searches tasks, ordered by category and id (or relevance, when text is searched without pages)
+
+        Parameters
+        ----------
+        filters
+            Filters of the search, see the parameters of _select_annotations
+
+        Returns
+        -------
+        tasks: Iterator[Task]
+            Tasks found, read from the database while they are iterated
+        """
+        trigram = _trigram_index(self.db, tasks, filters)
+        select = _select_annotations(tasks, tasks_categories, self.COLUMNS, trigram=trigram, **filters)
+
+        return self.db.exec_sql(select.sql(), select.values(), Task.from_row)
+
+    def stats(self, period: str = "month") -> Iterator[TaskStats]:
+        """Counts the tasks of each category created in each period, by status
+
+        Parameters
+        ----------
+        period: str
+            Length of the periods (day, week or month)
+
+        Returns
+        -------
+        stats: Iterator[TaskStats]
+            Stats of each category and period with tasks, ordered by category name and period
+        """
+        status = f"{tasks.TABLE_NAME}.{tasks.COLUMN_STATUS}"
+        select = _select_stats(
+            tasks, tasks_categories, f"SUM({status} = 0), SUM({status} = 1), SUM({status} = 2)", period
+        )
+
+        return self.db.exec_sql(select.sql(), select.values(), TaskStats.from_row)
+
+    def create(self, contents: list[str], category_id: int = 1, creation: Optional[date] = None) -> list[Task]:
+        """Stores tasks in a category, without committing them
+
+        Parameters
+        ----------
+        contents: list[str]
+            Content of each task
+
+        category_id: int
+            Id of the category of the tasks (Default 1, the default category)
+
+        creation: Optional[date]
+            Creation date of the tasks (Default today)
+
+        Returns
+        -------
+        tasks: list[Task]
+            Tasks created
+
+        Raises
+        ------
+        CategoryNotExistsError
+            When the category doesn't exist
+        """
+        creation = creation or date.today()
+        category_row = self.db.exec_sql(
+            f"SELECT {tasks_categories.COLUMN_NAME} FROM {tasks_categories.TABLE_NAME} "
+            f"WHERE {tasks_categories.COLUMN_ID} = ?",
+            (category_id,),
+        ).fetchone()
+        if category_row is None:
+            raise CategoryNotExistsError(f"Category with id {category_id} does not exists")
+        category = category_row[0]
+
+        sql = (
+            f"INSERT INTO {tasks.TABLE_NAME} ({tasks.COLUMN_CONTENT}, {tasks.COLUMN_CREATION}, "
+            f"{tasks.COLUMN_CATEGORY}) VALUES (?,?,?)"
+        )
+        created_tasks = []
+        for content in contents:
+            task_id = self.db.exec_sql(sql, (content, creation.isoformat(), category_id)).lastrowid
+            created_tasks.append(Task(task_id, content, 0, category, creation))
+
+        return created_tasks
+
+
+@final
+class NoteRepository:
+    """Class to search and store notes, as Note entities
+
+    Attributes
+    ----------
+    COLUMNS: Final[str]
+        Columns selected to build the Note entities, in the order read by Note.from_row
+
+    SUMMARY_COLUMNS: Final[str]
+        Columns selected to build the NoteSummary entities, all of them in the summary indexes of notes
+
+    db: SQLiteConnection
+        Connection with the dabatase
+    """
+
+    COLUMNS: Final[str] = (
+        f"{notes.TABLE_NAME}.{notes.COLUMN_ID}, {notes.TABLE_NAME}.{notes.COLUMN_TITLE}, "
+        f"{notes.TABLE_NAME}.{notes.COLUMN_CONTENT}, {notes_categories.TABLE_NAME}.{notes_categories.COLUMN_NAME}, "
+        f"{notes.TABLE_NAME}.{notes.COLUMN_README}, {notes.TABLE_NAME}.{notes.COLUMN_CREATION}"
+    )
+    SUMMARY_COLUMNS: Final[str] = (
+        f"{notes.TABLE_NAME}.{notes.COLUMN_ID}, {notes.TABLE_NAME}.{notes.COLUMN_TITLE}, "
+        f"{notes_categories.TABLE_NAME}.{notes_categories.COLUMN_NAME}, {notes.TABLE_NAME}.{notes.COLUMN_CREATION}"
+    )
+
+    db: SQLiteConnection
+
+    def __init__(self, db: SQLiteConnection) -> None:
+        """NoteRepository Constructor
+
+        Parameters
+        ----------
+        db: SQLiteConnection
+            Connection with the database
+        """
+        self.db = db
+
+    def search(self, **filters) -> Iterator[Note]:
+        """Searches notes, ordered by category and id (or relevance, when text is searched without pages)
+
+        Parameters
+        ----------
+        filters
+            Filters of the search, see the parameters of _select_annotations
+
+        Returns
+        -------
+        notes: Iterator[Note]
+            Notes found, read from the database while they are iterated
+        """
+        trigram = _trigram_index(self.db, notes, filters)
+        select = _select_annotations(notes, notes_categories, self.COLUMNS, trigram=trigram, **filters)
+
+        return self.db.exec_sql(select.sql(), select.values(), Note.from_row)
+
+    def search_summaries(self, **filters) -> Iterator[NoteSummary]:
+        """Searches notes as search does, without reading its content
+
+        Parameters
+        ----------
+        filters
+            Filters of the search, see the parameters of _select_annotations
+
+        Returns
+        -------
+        notes: Iterator[NoteSummary]
+            Summaries of the notes found, read from the database while they are iterated
+        """
+        trigram = _trigram_index(self.db, notes, filters)
+        select = _select_annotations(notes, notes_categories, self.SUMMARY_COLUMNS, trigram=trigram, **filters)
+
+        return self.db.exec_sql(select.sql(), select.values(), NoteSummary.from_row)
+
+    def get(self, note_id: int) -> Optional[Note]:
+        """Reads a note by its id
+
+        Parameters
+        ----------
+        note_id: int
+            Id of the note
+
+        Returns
+        -------
+        note: Optional[Note]
+            Note with the id, or None when it doesn't exist
+        """
+        select = Select(self.COLUMNS, notes.TABLE_NAME).join(
+            notes_categories.TABLE_NAME,
+            f"{notes.TABLE_NAME}.{notes.COLUMN_CATEGORY} = {notes_categories.TABLE_NAME}.{notes_categories.COLUMN_ID}",
+        )
+        select.where(f"{notes.TABLE_NAME}.{notes.COLUMN_ID} = ?", note_id)
+
+        return self.db.exec_sql(select.sql(), select.values(), Note.from_row).fetchone()
+
+    def stats(self, period: str = "month") -> Iterator[NoteStats]:
+        """Counts the notes of each category created in each period, by markdown flag
+
+        Parameters
+        ----------
+        period: str
+            Length of the periods (day, week or month)
+
+        Returns
+        -------
+        stats: Iterator[NoteStats]
+            Stats of each category and period with notes, ordered by category name and period
+        """
+        readme = f"{notes.TABLE_NAME}.{notes.COLUMN_README}"
+        select = _select_stats(notes, notes_categories, f"SUM({readme} IS NOT 1), SUM({readme} IS 1)", period)
+
+        return self.db.exec_sql(select.sql(), select.values(), NoteStats.from_row)
+
+    def create(
+        self,
+        title: str,
+        content: Optional[str] = None,
+        category_id: int = 1,
+        markdown: bool = False,
+        creation: Optional[date] = None,
+    ) -> Note:
+        """Stores a note, without committing it
+
+        Parameters
+        ----------
+        title: str
+            Title of the note (Max. 30 characters)
+
+        content: Optional[str]
+            Content of the note
+
+        category_id: int
+            Id of the category of the note (Default 1, the default category)
+
+        markdown: bool
+            Whether the content is written in markdown
+
+        creation: Optional[date]
+            Creation date of the note (Default today)
+
+        Returns
+        -------
+        note: Note
+            Note created
+
+        Raises
+        ------
+        CategoryNotExistsError
+            When the category doesn't exist
+        """
+        creation = creation or date.today()
+        category_row = self.db.exec_sql(
+            f"SELECT {notes_categories.COLUMN_NAME} FROM {notes_categories.TABLE_NAME} "
+            f"WHERE {notes_categories.COLUMN_ID} = ?",
+            (category_id,),
+        ).fetchone()
+        if category_row is None:
+            raise CategoryNotExistsError(f"Category with id {category_id} does not exists")
+        category = category_row[0]
+
+        sql = (
+            f"INSERT INTO {notes.TABLE_NAME} ({notes.COLUMN_TITLE}, {notes.COLUMN_CONTENT}, {notes.COLUMN_CATEGORY}, "
+            f"{notes.COLUMN_README}, {notes.COLUMN_CREATION}) VALUES (?,?,?,?,?)"
+        )
+        note_id = self.db.exec_sql(sql, (title, content, category_id, int(markdown), creation.isoformat())).lastrowid
+
+        return Note(note_id, title, content, category, markdown, creation)
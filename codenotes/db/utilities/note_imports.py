@@ -0,0 +1,11 @@
+""" Utility module with the statements and names related with the progress table of the imports of notes """
+from typing import Final, Text
+
+TABLE_NAME: Final[str] = "cn_note_imports"
+
+COLUMN_PATH: Final[str] = "cn_note_import_path"
+
+# Absolute path of each file already imported, so an interrupted import continues with the files left
+CREATE_TABLE: Final[Text] = (
+    f"CREATE TABLE IF NOT EXISTS {TABLE_NAME} ({COLUMN_PATH} TEXT PRIMARY KEY NOT NULL) WITHOUT ROWID;"
+)
@@ -19,3 +19,72 @@ CREATE_TABLE: Final[Text] = (
     f", {COLUMN_CREATION} DATE NOT NULL, FOREIGN KEY({COLUMN_CATEGORY}) "
     f"REFERENCES {categories.TABLE_NAME}({categories.COLUMN_ID}));"
 )
+
+# Columns used to sort the searches by each key of --sort, besides category
+SORT_COLUMNS: Final[dict[str, str]] = {"date": COLUMN_CREATION, "title": COLUMN_TITLE}
+
+# Indexes used by the searches filtered by category and/or creation date
+CREATE_INDEXES: Final[tuple[Text, ...]] = (
+    f"CREATE INDEX IF NOT EXISTS {TABLE_NAME}_category_creation ON {TABLE_NAME} "
+    f"({COLUMN_CATEGORY}, {COLUMN_CREATION});",
+    f"CREATE INDEX IF NOT EXISTS {TABLE_NAME}_creation ON {TABLE_NAME} ({COLUMN_CREATION});",
+)
+
+# Indexes with every column listed by the compact searches, so they don't read the rows of the notes, whose content
+# would be read too. They replace the indexes of CREATE_INDEXES, since they also serve the same searches
+CREATE_SUMMARY_INDEXES: Final[tuple[Text, ...]] = (
+    f"CREATE INDEX IF NOT EXISTS {TABLE_NAME}_category_creation_title ON {TABLE_NAME} "
+    f"({COLUMN_CATEGORY}, {COLUMN_CREATION}, {COLUMN_TITLE});",
+    f"CREATE INDEX IF NOT EXISTS {TABLE_NAME}_creation_category_title ON {TABLE_NAME} "
+    f"({COLUMN_CREATION}, {COLUMN_CATEGORY}, {COLUMN_TITLE});",
+)
+
+DROP_INDEXES: Final[tuple[Text, ...]] = (
+    f"DROP INDEX IF EXISTS {TABLE_NAME}_category_creation;",
+    f"DROP INDEX IF EXISTS {TABLE_NAME}_creation;",
+)
+
+FTS_TABLE_NAME: Final[str] = "cn_notes_fts"
+
+CREATE_FTS_TABLE: Final[Text] = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE_NAME} USING fts5({COLUMN_TITLE}, "
+    f"{COLUMN_CONTENT}, content='{TABLE_NAME}', content_rowid='{COLUMN_ID}');"
+)
+
+# Triggers that keep the full-text index in sync with the notes table
+CREATE_FTS_TRIGGERS: Final[tuple[Text, ...]] = (
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE_NAME}_insert AFTER INSERT ON {TABLE_NAME} BEGIN "
+    f"INSERT INTO {FTS_TABLE_NAME} (rowid, {COLUMN_TITLE}, {COLUMN_CONTENT}) VALUES "
+    f"(new.{COLUMN_ID}, new.{COLUMN_TITLE}, new.{COLUMN_CONTENT}); END;",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE_NAME}_delete AFTER DELETE ON {TABLE_NAME} BEGIN "
+    f"INSERT INTO {FTS_TABLE_NAME} ({FTS_TABLE_NAME}, rowid, {COLUMN_TITLE}, {COLUMN_CONTENT}) "
+    f"VALUES ('delete', old.{COLUMN_ID}, old.{COLUMN_TITLE}, old.{COLUMN_CONTENT}); END;",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE_NAME}_update AFTER UPDATE OF {COLUMN_TITLE}, "
+    f"{COLUMN_CONTENT} ON {TABLE_NAME} BEGIN INSERT INTO {FTS_TABLE_NAME} ({FTS_TABLE_NAME}, rowid, "
+    f"{COLUMN_TITLE}, {COLUMN_CONTENT}) VALUES ('delete', old.{COLUMN_ID}, old.{COLUMN_TITLE}, "
+    f"old.{COLUMN_CONTENT}); INSERT INTO {FTS_TABLE_NAME} (rowid, {COLUMN_TITLE}, {COLUMN_CONTENT}) "
+    f"VALUES (new.{COLUMN_ID}, new.{COLUMN_TITLE}, new.{COLUMN_CONTENT}); END;",
+)
+
+REBUILD_FTS_TABLE: Final[Text] = (
+    f"INSERT INTO {FTS_TABLE_NAME} ({FTS_TABLE_NAME}) VALUES ('rebuild');"
+)
+
+# Columns searched by text, besides the full-text index
+TEXT_COLUMNS: Final[tuple[str, ...]] = (COLUMN_TITLE, COLUMN_CONTENT)
+
+# Index of the trigrams of the title and content, used by the infix and GLOB searches. It needs SQLite 3.34 or newer,
+# so the databases created with an older version don't have it
+TRIGRAM_TABLE_NAME: Final[str] = "cn_notes_trigram"
+
+CREATE_TRIGRAM_TABLE: Final[Text] = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {TRIGRAM_TABLE_NAME} USING fts5({COLUMN_TITLE}, {COLUMN_CONTENT}, "
+    f"content='{TABLE_NAME}', content_rowid='{COLUMN_ID}', tokenize='trigram', detail='none');"
+)
+
+# Triggers that keep the trigram index in sync with the notes table
+CREATE_TRIGRAM_TRIGGERS: Final[tuple[Text, ...]] = tuple(
+    trigger.replace(FTS_TABLE_NAME, TRIGRAM_TABLE_NAME) for trigger in CREATE_FTS_TRIGGERS
+)
+
+REBUILD_TRIGRAM_TABLE: Final[Text] = REBUILD_FTS_TABLE.replace(FTS_TABLE_NAME, TRIGRAM_TABLE_NAME)
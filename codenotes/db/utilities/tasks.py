@@ -20,6 +20,60 @@ CREATE_TABLE: Final[Text] = (
     f"({categories.COLUMN_ID})); "
 )
 
+# Columns used to sort the searches by each key of --sort, besides category
+SORT_COLUMNS: Final[dict[str, str]] = {"date": COLUMN_CREATION, "status": COLUMN_STATUS}
+
+# Indexes used by the searches filtered by category and/or creation date
+CREATE_INDEXES: Final[tuple[Text, ...]] = (
+    f"CREATE INDEX IF NOT EXISTS {TABLE_NAME}_category_creation ON {TABLE_NAME} "
+    f"({COLUMN_CATEGORY}, {COLUMN_CREATION});",
+    f"CREATE INDEX IF NOT EXISTS {TABLE_NAME}_creation ON {TABLE_NAME} ({COLUMN_CREATION});",
+)
+
+FTS_TABLE_NAME: Final[str] = "cn_tasks_fts"
+
+CREATE_FTS_TABLE: Final[Text] = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE_NAME} USING fts5({COLUMN_CONTENT}, "
+    f"content='{TABLE_NAME}', content_rowid='{COLUMN_ID}');"
+)
+
+# Triggers that keep the full-text index in sync with the tasks table
+CREATE_FTS_TRIGGERS: Final[tuple[Text, ...]] = (
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE_NAME}_insert AFTER INSERT ON {TABLE_NAME} BEGIN "
+    f"INSERT INTO {FTS_TABLE_NAME} (rowid, {COLUMN_CONTENT}) VALUES (new.{COLUMN_ID}, "
+    f"new.{COLUMN_CONTENT}); END;",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE_NAME}_delete AFTER DELETE ON {TABLE_NAME} BEGIN "
+    f"INSERT INTO {FTS_TABLE_NAME} ({FTS_TABLE_NAME}, rowid, {COLUMN_CONTENT}) VALUES ('delete', "
+    f"old.{COLUMN_ID}, old.{COLUMN_CONTENT}); END;",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE_NAME}_update AFTER UPDATE OF {COLUMN_CONTENT} ON "
+    f"{TABLE_NAME} BEGIN INSERT INTO {FTS_TABLE_NAME} ({FTS_TABLE_NAME}, rowid, {COLUMN_CONTENT}) "
+    f"VALUES ('delete', old.{COLUMN_ID}, old.{COLUMN_CONTENT}); INSERT INTO {FTS_TABLE_NAME} "
+    f"(rowid, {COLUMN_CONTENT}) VALUES (new.{COLUMN_ID}, new.{COLUMN_CONTENT}); END;",
+)
+
+REBUILD_FTS_TABLE: Final[Text] = (
+    f"INSERT INTO {FTS_TABLE_NAME} ({FTS_TABLE_NAME}) VALUES ('rebuild');"
+)
+
+# Columns searched by text, besides the full-text index
+TEXT_COLUMNS: Final[tuple[str, ...]] = (COLUMN_CONTENT,)
+
+# Index of the trigrams of the content, used by the infix and GLOB searches. It needs SQLite 3.34 or newer, so the
+# databases created with an older version don't have it
+TRIGRAM_TABLE_NAME: Final[str] = "cn_tasks_trigram"
+
+CREATE_TRIGRAM_TABLE: Final[Text] = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {TRIGRAM_TABLE_NAME} USING fts5({COLUMN_CONTENT}, "
+    f"content='{TABLE_NAME}', content_rowid='{COLUMN_ID}', tokenize='trigram', detail='none');"
+)
+
+# Triggers that keep the trigram index in sync with the tasks table
+CREATE_TRIGRAM_TRIGGERS: Final[tuple[Text, ...]] = tuple(
+    trigger.replace(FTS_TABLE_NAME, TRIGRAM_TABLE_NAME) for trigger in CREATE_FTS_TRIGGERS
+)
+
+REBUILD_TRIGRAM_TABLE: Final[Text] = REBUILD_FTS_TABLE.replace(FTS_TABLE_NAME, TRIGRAM_TABLE_NAME)
+
 
 # from datetime import datetime
 # datetime.now().date()
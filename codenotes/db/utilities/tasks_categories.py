@@ -11,6 +11,15 @@ CREATE_TABLE: Final[Text] = (
     f"PRIMARY KEY AUTOINCREMENT NULL, {COLUMN_NAME} NVARCHAR(30) NOT NULL);"
 )
 
+CREATE_NAME_INDEX: Final[Text] = (
+    f"CREATE UNIQUE INDEX IF NOT EXISTS {TABLE_NAME}_name ON {TABLE_NAME} ({COLUMN_NAME});"
+)
+
+# Used instead when a database created with an older version already has duplicated names
+CREATE_NAME_INDEX_NOT_UNIQUE: Final[Text] = (
+    f"CREATE INDEX IF NOT EXISTS {TABLE_NAME}_name ON {TABLE_NAME} ({COLUMN_NAME});"
+)
+
 INSERT_DEFAULT_CATEGORY: Final[Text] = (
     f'INSERT INTO {TABLE_NAME} ({COLUMN_NAME}) SELECT "TODO Tasks" WHERE NOT '
     f"EXISTS(SELECT 1 FROM {TABLE_NAME} WHERE {COLUMN_ID} = 1); "
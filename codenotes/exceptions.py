@@ -8,3 +8,15 @@ class CategoryNotExistsError(Exception):
     """Exception raised after validation that a category doesn't exists"""
 
     pass
+
+
+class InvalidConfigError(Exception):
+    """Exception raised when an option of the configuration has an invalid value"""
+
+    pass
+
+
+class InvalidBackupError(Exception):
+    """Exception raised when a file restored isn't an export of codenotes, or was exported by a newer version"""
+
+    pass
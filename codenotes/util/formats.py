@@ -0,0 +1,71 @@
+""" Utility module to write query results in machine-readable formats """
+import sys
+from typing import Any, Iterable, Optional, Sequence, TextIO
+
+
+def write_rows(
+    rows: Iterable[Sequence[Any]],
+    columns: Sequence[str],
+    output_format: str,
+    file: Optional[TextIO] = None,
+) -> int:
+    """Writes rows as they are read, so the whole result is never kept in memory
+
+    Parameters
+    ----------
+    rows: Iterable[Sequence[Any]]
+        Rows to write, usually a cursor
+
+    columns: Sequence[str]
+        Name of each column of the rows, used as keys in json/jsonl and as header in csv/tsv
+
+    output_format: str
+        Format of the output (json, jsonl, csv or tsv)
+
+    file: Optional[TextIO]
+        File where the rows are written (Default standard output)
+
+    Returns
+    -------
+    count: int
+        Number of rows written
+    """
+    if file is None:
+        file = sys.stdout
+
+    count = 0
+
+    # The writers are imported when used, so the commands that import this module don't pay for them at startup
+    if output_format in ("csv", "tsv"):
+        import csv
+
+        writer = csv.writer(file, dialect="excel" if output_format == "csv" else "excel-tab", lineterminator="\n")
+        writer.writerow(columns)
+
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+
+    elif output_format == "jsonl":
+        import json
+
+        for row in rows:
+            file.write(json.dumps(dict(zip(columns, row)), ensure_ascii=False))
+            file.write("\n")
+            count += 1
+
+    elif output_format == "json":
+        import json
+
+        file.write("[")
+        for row in rows:
+            file.write(",\n" if count else "\n")
+            file.write(json.dumps(dict(zip(columns, row)), ensure_ascii=False))
+            count += 1
+        file.write("\n]\n" if count else "]\n")
+
+    else:
+        raise ValueError(f"Unknown output format: {output_format}")
+
+    file.flush()
+    return count
@@ -9,12 +9,19 @@ codenotes <command> <annotation> <text> <flags>
 [header]CORE COMMANDS[/header]
 add     Create new note or task with the content typed
 search  Search for notes or tasks with the parameters specified
+stats   Count the notes or tasks of each category by day, week or month
+backup  Copy the database into another file while it's used
+export  Write every annotation and category as compressed JSON Lines (- for the standard output)
+restore Restore an export into an empty database, or replace it with --force
+serve   Run in the background, so the next commands start faster
 
 [header]ANNOTATION[/header]
 note/task       Type of annotations
 
 [header]FLAGS[/header]
 --version, -v   Show codenotes version
+--db <path>     Database used (or :memory:)
+--store <name>  Named store used
 
 [header]EXAMPLES[/header]
 $ codenotes add task Finish coding the tests --new-categoery Reminders
@@ -72,7 +79,16 @@ Text that will be search if any annotations contains it.
 --yesterday, -y Search annotations created yesterday
 --week, -w Search annotations created in the week
 --month, -m Search annotations created in the month
+--limit, -l <number> Max number of annotations displayed
+--offset, -o <number> Number of annotations skipped
+--after, -a <id> Continue the search after the annotation with that id
+--sort <key> Sort the annotations of each category by date, status (tasks) or title (notes)
+--desc Reverse the order of the annotations
+--match <match> Match the text as words (default), any part of the text (infix) or a GLOB pattern (glob)
+--format, -f <format> Write the annotations found as json, jsonl, csv or tsv
+--compact Only list the id, title and date of the notes, read one with: codenotes note show <id>
 
 [header]USAGE[/header]
 $ codenotes search note --today
-$ codenotes search task Finish my project --month"""
+$ codenotes search task Finish my project --month
+$ codenotes search task ERR-0x1a --match infix --ever"""
@@ -1,22 +1,211 @@
-def add_conditions_sql(sql: str, condition: str, type_condition: str = None) -> str:
-    """Adds where conditions to sql
+""" Utility module to build the SQL statements of the searches
+
+The statements are built with Select, which keeps the values apart from the SQL text and passes them as parameters.
+So, the same search always produces the same text, which is reused from the statement cache of sqlite3, and the text
+typed by the user is never part of the SQL, no matter the quotes or other characters it has.
+"""
+from typing import Any, Optional, final
+
+
+@final
+class Select:
+    """Builder of SELECT statements with bound parameters
+
+    Only the names of the tables and columns, that come from the utility modules of the database, are written in the
+    SQL text. Every value is written as a placeholder (?) and returned apart by values(), in the same order.
+
+    Attributes
+    ----------
+    columns: str
+        Columns selected
+
+    table: str
+        Table where the rows are selected
+    """
+
+    columns: str
+    table: str
+
+    def __init__(self, columns: str, table: str) -> None:
+        """Select Constructor
+
+        Parameters
+        ----------
+        columns: str
+            Columns selected
+
+        table: str
+            Table where the rows are selected
+        """
+        self.columns = columns
+        self.table = table
+        self.__joins: list[str] = []
+        self.__conditions: list[str] = []
+        self.__groups: list[str] = []
+        self.__order: list[str] = []
+        self.__values: list[Any] = []
+        self.__limit_values: tuple[Any, ...] = ()
+
+    def join(self, table: str, condition: str) -> "Select":
+        """Adds an INNER JOIN with a table
+
+        Parameters
+        ----------
+        table: str
+            Table joined
+
+        condition: str
+            Condition of the join, without values
+
+        Returns
+        -------
+        select: Select
+            The same builder
+        """
+        self.__joins.append(f" INNER JOIN {table} ON {condition}")
+        return self
+
+    def where(self, condition: str, *values: Any) -> "Select":
+        """Adds a condition, joined with AND to the previous ones
+
+        Parameters
+        ----------
+        condition: str
+            Condition with a placeholder (?) for each value
+
+        values: Any
+            Values of the placeholders of the condition
+
+        Returns
+        -------
+        select: Select
+            The same builder
+        """
+        if condition.count("?") != len(values):
+            raise ValueError(f"The condition has {condition.count('?')} placeholders and {len(values)} values")
+
+        self.__conditions.append(condition)
+        self.__values.extend(values)
+        return self
+
+    def group_by(self, *columns: str) -> "Select":
+        """Adds columns, or expressions, to the GROUP BY clause
+
+        Parameters
+        ----------
+        columns: str
+            Columns the rows are grouped by
+
+        Returns
+        -------
+        select: Select
+            The same builder
+        """
+        self.__groups.extend(columns)
+        return self
+
+    def order_by(self, *columns: str) -> "Select":
+        """Adds columns to the ORDER BY clause
+
+        Parameters
+        ----------
+        columns: str
+            Columns (with ASC or DESC) the rows are ordered by
+
+        Returns
+        -------
+        select: Select
+            The same builder
+        """
+        self.__order.extend(columns)
+        return self
+
+    def limit(self, limit: Optional[int] = None, offset: Optional[int] = None) -> "Select":
+        """Limits the number of rows selected, when limit or offset is passed
+
+        Parameters
+        ----------
+        limit: Optional[int]
+            Max number of rows selected (Default no limit)
+
+        offset: Optional[int]
+            Number of rows skipped (Default 0)
+
+        Returns
+        -------
+        select: Select
+            The same builder
+        """
+        if limit is not None or offset is not None:
+            self.__limit_values = (limit if limit is not None else -1, offset or 0)
+        return self
+
+    def sql(self) -> str:
+        """Returns the text of the statement
+
+        Returns
+        -------
+        sql: str
+            SELECT statement, with placeholders instead of values
+        """
+        sql = f"SELECT {self.columns} FROM {self.table}" + "".join(self.__joins)
+
+        if self.__conditions:
+            sql += " WHERE " + " AND ".join(self.__conditions)
+        if self.__groups:
+            sql += " GROUP BY " + ", ".join(self.__groups)
+        if self.__order:
+            sql += " ORDER BY " + ", ".join(self.__order)
+        if self.__limit_values:
+            sql += " LIMIT ? OFFSET ?"
+        return sql
+
+    def values(self) -> tuple[Any, ...]:
+        """Returns the values of the placeholders of the statement
+
+        Returns
+        -------
+        values: tuple[Any, ...]
+            Values in the same order as its placeholders
+        """
+        return tuple(self.__values) + self.__limit_values
+
+
+def like_pattern(text: str) -> str:
+    """Converts a text into a LIKE pattern that matches the values that contain it
+
+    The wildcards of LIKE (% and _) in the text are escaped with a backslash, so the pattern must be used with
+    ESCAPE '\\'
+
+    Parameters
+    ----------
+    text : str
+        Text to search
+
+    Returns
+    -------
+    pattern : str
+        Pattern for LIKE ? ESCAPE '\\'
+    """
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def fts_match_text(text: str) -> str:
+    """Converts the text typed by the user into a FTS5 query
+
+    Every word is quoted, so characters with special meaning in FTS5 (", *, -, :, etc.) are searched literally,
+    and used as prefix, so the search matches words that start with what it's typed
 
     Parameters
     ----------
-    sql : str
-        SQL string that will be added the condition
-    condition : str
-        Condition added to SQL
-    type_condition : str
-        If 'WHERE' exists, will add the type of condition (AND/OR)
+    text : str
+        Text to search
 
     Returns
     -------
-    sql : str
-        Returns the same SQL passed with the condition
+    match_text : str
+        FTS5 query that matches the rows that contain all the words of the text
     """
-    if "where" in sql.lower():
-        sql = sql + f" {type_condition} {condition}"
-    else:
-        sql = sql + f" WHERE {condition}"
-    return sql
+    words = text.split()
+    return " ".join('"{}"*'.format(word.replace('"', '""')) for word in words)
@@ -1,3 +1,5 @@
 @echo off
 IF EXIST codenotes.log DEL /F codenotes.log
 IF EXIST codenotes\codenotes.db DEL /F codenotes\codenotes.db
+IF EXIST codenotes\codenotes.db-wal DEL /F codenotes\codenotes.db-wal
+IF EXIST codenotes\codenotes.db-shm DEL /F codenotes\codenotes.db-shm
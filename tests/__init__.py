@@ -0,0 +1,7 @@
+import os
+
+# Tests use a temporary database in memory, shared by all of them through the connection of the process
+os.environ["CODENOTES_DB"] = ":memory:"
+
+# Nor they write the notes rendered in the cache of the user
+os.environ["CODENOTES_RENDER_CACHE_SIZE"] = "0"
@@ -2,6 +2,12 @@ import unittest
 
 from codenotes import parse_args
 from codenotes.cli.category import CreateCategory, SearchCategory
+from codenotes.db.entities import Category
+
+
+def category_names(query: list[list[Category]]) -> list[list[str]]:
+    """Returns the name of the categories found of each type of annotation"""
+    return [[category.name for category in categories] for categories in query]
 
 
 class TestCreateCategory(unittest.TestCase):
@@ -37,70 +43,86 @@ class TestCreateCategory(unittest.TestCase):
 
 class TestSearchCategory(unittest.TestCase):
     def test_search_notes(self) -> None:
-        expected_categories = [[("General",)]]
+        expected_categories = [["General"]]
 
         args = parse_args(["category", "search", "--note"])
 
-        query = SearchCategory(args).sql_query()
+        query = category_names(SearchCategory(args).sql_query())
         self.assertListEqual(query, expected_categories)
 
-        expected_categories = [[("General",)]]
+        expected_categories = [["General"]]
 
         args = parse_args(["category", "search", "Gen", "--note"])
 
-        query = SearchCategory(args).sql_query()
+        query = category_names(SearchCategory(args).sql_query())
         self.assertListEqual(query, expected_categories)
 
     def test_search_tasks(self) -> None:
         expected_categories = [
             [
-                ("TODO Tasks",),
-                ("New category #2",),
-                ("New category #3",),
-                ("New category #1",),
+                "TODO Tasks",
+                "New category #2",
+                "New category #3",
+                "New category #1",
             ]
         ]
 
         args = parse_args(["category", "search", "--task"])
 
-        query = SearchCategory(args).sql_query()
+        query = category_names(SearchCategory(args).sql_query())
         self.assertListEqual(query, expected_categories)
 
         expected_categories = [
-            [("New category #2",), ("New category #3",), ("New category #1",)]
+            ["New category #2", "New category #3", "New category #1"]
         ]
 
         args = parse_args(["category", "search", "categ", "--task"])
 
-        query = SearchCategory(args).sql_query()
+        query = category_names(SearchCategory(args).sql_query())
         self.assertListEqual(query, expected_categories)
 
     def test_search_all(self) -> None:
         expected_categories = [
             [
-                ("TODO Tasks",),
-                ("New category #2",),
-                ("New category #3",),
-                ("New category #1",),
+                "TODO Tasks",
+                "New category #2",
+                "New category #3",
+                "New category #1",
             ],
-            [("General",)],
+            ["General"],
         ]
 
         args = parse_args(["category", "search", "--all"])
 
-        query = SearchCategory(args).sql_query()
+        query = category_names(SearchCategory(args).sql_query())
         self.assertListEqual(query, expected_categories)
 
         expected_categories = [
-            [("New category #2",), ("New category #3",), ("New category #1",)],
-            [("General",)],
+            ["New category #2", "New category #3", "New category #1"],
+            ["General"],
         ]
 
         args = parse_args(["category", "search", "ne", "--all"])
 
-        query = SearchCategory(args).sql_query()
+        query = category_names(SearchCategory(args).sql_query())
         self.assertListEqual(query, expected_categories)
 
+    def test_search_special_characters(self) -> None:
+        args = parse_args(["category", "search", "say", '"category\'s"', "--task"])
+
+        query = category_names(SearchCategory(args).sql_query())
+        self.assertListEqual(query, [[]])
+
+        args = parse_args(["category", "search", "%", "--task"])
+
+        query = category_names(SearchCategory(args).sql_query())
+        self.assertListEqual(query, [[]])
+
+        args = parse_args(["category", "search", "y_#1", "--task"])
+
+        query = category_names(SearchCategory(args).sql_query())
+        self.assertListEqual(query, [[]])
+
 
 if __name__ == "__main__":
     unittest.main()
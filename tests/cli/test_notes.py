@@ -1,11 +1,22 @@
+import os
+import shutil
+import tempfile
 import unittest
 from datetime import datetime
+from typing import Iterable
 
 from codenotes import parse_args
-from codenotes.cli.notes import CreateNote, SearchNote
+from codenotes.cli.notes import CreateNote, ImportNote, SearchNote, markdown_title, read_markdown_file
+from codenotes.db.connection import get_connection
+from codenotes.db.entities import Note
 from codenotes.exceptions import CategoryNotExistsError
 
 
+def note_values(notes: Iterable[Note]) -> list[tuple]:
+    """Returns the title, content, category, markdown flag and creation date of the notes"""
+    return [(note.title, note.content, note.category, note.markdown, note.creation) for note in notes]
+
+
 class TestCreateNote(unittest.TestCase):
     def setUp(self) -> None:
         self.expected_note_text = (
@@ -63,9 +74,74 @@ class TestCreateNote(unittest.TestCase):
         del self.expected_note_text
 
 
+class TestImportNote(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.directory, "Projects", "Codenotes"))
+
+        files = {
+            "inbox.md": "# Inbox\nFirst note",
+            "ignored.txt": "Not markdown",
+            os.path.join("Projects", "ideas.markdown"): "Without heading",
+            os.path.join("Projects", "Codenotes", "todo.md"): "\ufeff## Todo list\n- Tests",
+        }
+        for file_name, content in files.items():
+            with open(os.path.join(self.directory, file_name), "w", encoding="utf-8") as file:
+                file.write(content)
+
+    def test_markdown_title(self):
+        self.assertEqual(markdown_title("\n# Title\ncontent", "note.md"), "Title")
+        self.assertEqual(markdown_title("content", "/notes/file name.md"), "file name")
+        self.assertEqual(len(markdown_title("# " + "x" * 40, "note.md")), 30)
+
+    def test_read_large_file(self):
+        path = os.path.join(self.directory, "large.md")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("# Large\n" + "x" * 2 * 1024 * 1024)
+
+        _, title, content, _ = read_markdown_file(path)
+
+        self.assertEqual(title, "Large")
+        self.assertEqual(len(content), 8 + 2 * 1024 * 1024)
+
+    def test_import_and_resume(self):
+        args = parse_args(["note", "import", self.directory, "--category", "Inbox"])
+        import_note = ImportNote(args)
+
+        self.assertEqual(import_note.imported, 3)
+        imported_notes = {
+            title: category
+            for title, category in get_connection().exec_sql(
+                "SELECT cn_note_title, cn_notes_category_name FROM cn_notes INNER JOIN cn_notes_categories "
+                "ON cn_note_category = cn_notes_category_id WHERE cn_note_readme = 1"
+            )
+        }
+        self.assertDictEqual(
+            imported_notes, {"Inbox": "Inbox", "ideas": "Projects", "Todo list": "Projects/Codenotes"}
+        )
+
+        import_note = ImportNote(args)
+
+        self.assertEqual(import_note.imported, 0)
+        self.assertEqual(import_note.already_imported, 3)
+
+    def tearDown(self) -> None:
+        # Removes the notes imported, so the searches only find the ones created by the other tests
+        db = get_connection()
+        db.exec_sql("DELETE FROM cn_notes WHERE cn_note_readme = 1")
+        db.exec_sql("DELETE FROM cn_note_imports")
+        db.exec_sql(
+            "DELETE FROM cn_notes_categories "
+            "WHERE cn_notes_category_name IN ('Inbox', 'Projects', 'Projects/Codenotes')"
+        )
+        db.commit()
+
+        shutil.rmtree(self.directory)
+
+
 class TestSearchNote(unittest.TestCase):
     def setUp(self) -> None:
-        self.date = datetime.now().date().strftime("%Y-%m-%d")
+        self.date = datetime.now().date()
         self.default_note_text = (
             "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor "
             "incididunt ut labore et dolore magna aliqua."
@@ -79,16 +155,16 @@ class TestSearchNote(unittest.TestCase):
                 "Lorem ipsum dolor sit amet, co",
                 self.default_note_text,
                 self.default_category,
-                0,
+                False,
                 self.date,
             ),
-            ("Empty Note", None, self.default_category, 0, self.date),
+            ("Empty Note", None, self.default_category, False, self.date),
         ]
 
         args = parse_args(
             ["note", "search", "--category", self.default_category, "--ever"]
         )
-        query = SearchNote(args).sql_query()
+        query = note_values(SearchNote(args).sql_query())
 
         self.assertCountEqual(query, expected_notes)
 
@@ -102,28 +178,28 @@ class TestSearchNote(unittest.TestCase):
                 self.default_note_title,
                 self.default_note_text,
                 "CLI Category",
-                0,
+                False,
                 self.date,
             ),
             (
                 "Lorem ipsum dolor sit amet, co",
                 self.default_note_text,
                 self.default_category,
-                0,
+                False,
                 self.date,
             ),
-            ("Empty Note", None, self.default_category, 0, self.date),
+            ("Empty Note", None, self.default_category, False, self.date),
             (
                 "New Note in the same category",
                 "New Note in the same category",
                 "CLI Category",
-                0,
+                False,
                 self.date,
             ),
         ]
 
         args = parse_args(["note", "search", "--ever"])
-        query = SearchNote(args).sql_query()
+        query = note_values(SearchNote(args).sql_query())
 
         self.assertCountEqual(query, expected_notes)
 
@@ -133,51 +209,90 @@ class TestSearchNote(unittest.TestCase):
                 self.default_note_title,
                 self.default_note_text,
                 "CLI Category",
-                0,
+                False,
                 self.date,
             ),
             (
                 "Lorem ipsum dolor sit amet, co",
                 self.default_note_text,
                 self.default_category,
-                0,
+                False,
                 self.date,
             ),
-            ("Empty Note", None, self.default_category, 0, self.date),
+            ("Empty Note", None, self.default_category, False, self.date),
             (
                 "New Note in the same category",
                 "New Note in the same category",
                 "CLI Category",
-                0,
+                False,
                 self.date,
             ),
         ]
 
         args = parse_args(["note", "search", "--month"])
-        query = SearchNote(args).sql_query()
+        query = note_values(SearchNote(args).sql_query())
 
         self.assertCountEqual(query, expected_notes)
 
+    def test_search_sorted(self):
+        """Test that notes are sorted by title in each category, and paginated in that order"""
+        expected_titles = [
+            "Lorem ipsum Note",
+            "New Note in the same category",
+            "Empty Note",
+            "Lorem ipsum dolor sit amet, co",
+        ]
+
+        args = parse_args(["note", "search", "--ever", "--sort", "title"])
+        query = SearchNote(args).sql_query()
+
+        self.assertListEqual([note.title for note in query], expected_titles)
+
+        args = parse_args(["note", "search", "--ever", "--sort", "title", "--desc"])
+        query = SearchNote(args).sql_query()
+
+        self.assertListEqual([note.title for note in query], expected_titles[::-1])
+
+        args = parse_args(["note", "search", "--ever", "--sort", "title", "--limit", "2", "--after", "2"])
+        query = SearchNote(args).sql_query()
+
+        self.assertListEqual([note.title for note in query], expected_titles[2:])
+
+        args = parse_args(["note", "search", "--ever", "--sort", "title", "--desc", "--after", "4"])
+        query = SearchNote(args).sql_query()
+
+        self.assertListEqual([note.title for note in query], expected_titles[1::-1])
+
+    def test_search_compact(self):
+        """Test that the compact search finds the same notes, without its content"""
+        args = parse_args(["note", "search", "--ever", "--sort", "date"])
+        notes = [(note.id, note.title, note.category, note.creation) for note in SearchNote(args).sql_query()]
+
+        args = parse_args(["note", "search", "--ever", "--sort", "date", "--compact"])
+        query = SearchNote(args).sql_query()
+
+        self.assertListEqual([(note.id, note.title, note.category, note.creation) for note in query], notes)
+
     def test_search_text_date(self):
         expected_notes = [
             (
                 self.default_note_title,
                 self.default_note_text,
                 "CLI Category",
-                0,
+                False,
                 self.date,
             ),
             (
                 "Lorem ipsum dolor sit amet, co",
                 self.default_note_text,
                 self.default_category,
-                0,
+                False,
                 self.date,
             ),
         ]
 
         args = parse_args(["note", "search", "Lorem", "ipsum", "--today"])
-        query = SearchNote(args).sql_query()
+        query = note_values(SearchNote(args).sql_query())
 
         self.assertCountEqual(query, expected_notes)
 
@@ -188,20 +303,20 @@ class TestSearchNote(unittest.TestCase):
                 self.default_note_title,
                 self.default_note_text,
                 "CLI Category",
-                0,
+                False,
                 self.date,
             ),
             (
                 "Lorem ipsum dolor sit amet, co",
                 self.default_note_text,
                 self.default_category,
-                0,
+                False,
                 self.date,
             ),
         ]
 
         args = parse_args(["note", "search", "Lorem", "ipsum"])
-        query = SearchNote(args).sql_query()
+        query = note_values(SearchNote(args).sql_query())
 
         self.assertCountEqual(query, expected_notes)
 
@@ -211,28 +326,28 @@ class TestSearchNote(unittest.TestCase):
                 self.default_note_title,
                 self.default_note_text,
                 "CLI Category",
-                0,
+                False,
                 self.date,
             ),
             (
                 "Lorem ipsum dolor sit amet, co",
                 self.default_note_text,
                 self.default_category,
-                0,
+                False,
                 self.date,
             ),
-            ("Empty Note", None, self.default_category, 0, self.date),
+            ("Empty Note", None, self.default_category, False, self.date),
             (
                 "New Note in the same category",
                 "New Note in the same category",
                 "CLI Category",
-                0,
+                False,
                 self.date,
             ),
         ]
 
         args = parse_args(["note", "search", "--today"])
-        query = SearchNote(args).sql_query()
+        query = note_values(SearchNote(args).sql_query())
 
         self.assertCountEqual(query, expected_notes)
 
@@ -240,7 +355,7 @@ class TestSearchNote(unittest.TestCase):
         expected_notes = []
 
         args = parse_args(["note", "search", "--yesterday"])
-        query = SearchNote(args).sql_query()
+        query = note_values(SearchNote(args).sql_query())
 
         self.assertCountEqual(query, expected_notes)
 
@@ -0,0 +1,69 @@
+import os
+import re
+import tempfile
+import unittest
+from unittest import mock
+
+from rich.console import Console
+from rich.markdown import Markdown
+from rich.panel import Panel
+
+from codenotes.cli.render_cache import CachedMarkdown, RenderCache
+
+CONTENT = "# Title\n\n* First **item**\n* [Link](https://github.com/EGAMAGZ/codenotes)\n\n```python\nprint(1)\n```"
+
+
+def render(renderable, width: int = 60) -> str:
+    """Returns the text with styles of a renderable, as displayed in a terminal, without the random ids of the links"""
+    console = Console(width=width, force_terminal=True, color_system="truecolor", legacy_windows=False)
+    with console.capture() as capture:
+        console.print(Panel(renderable))
+    return re.sub(r"id=\d+;", "", capture.get())
+
+
+class TestRenderCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = RenderCache(1024 * 1024, self.directory.name)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_cached_markdown(self):
+        self.assertIsNone(self.cache.get(1, CONTENT, 56))
+        self.assertEqual(render(CachedMarkdown(1, CONTENT, self.cache)), render(Markdown(CONTENT)))
+        self.assertIsNotNone(self.cache.get(1, CONTENT, 56))
+
+        with mock.patch("rich.markdown.Markdown", side_effect=AssertionError("Markdown parsed again")):
+            self.assertEqual(render(CachedMarkdown(1, CONTENT, self.cache)), render(Markdown(CONTENT)))
+
+    def test_key(self):
+        render(CachedMarkdown(1, CONTENT, self.cache))
+
+        self.assertIsNone(self.cache.get(1, CONTENT + "\nEdited", 56))
+        self.assertIsNone(self.cache.get(2, CONTENT, 56))
+        self.assertIsNone(self.cache.get(1, CONTENT, 76))
+        self.assertEqual(render(CachedMarkdown(1, CONTENT, self.cache), 80), render(Markdown(CONTENT), 80))
+
+    def test_evict(self):
+        for note_id in range(1, 4):
+            render(CachedMarkdown(note_id, CONTENT, self.cache))
+            path = self.cache.path(note_id, CONTENT, 56)
+            os.utime(path, (note_id, note_id))
+
+        self.cache.get(1, CONTENT, 56)  # Used after the others
+        self.cache.max_size = os.path.getsize(path) * 2
+        self.cache.evict()
+
+        self.assertIsNotNone(self.cache.get(1, CONTENT, 56))
+        self.assertIsNone(self.cache.get(2, CONTENT, 56))
+        self.assertIsNotNone(self.cache.get(3, CONTENT, 56))
+
+    def test_disabled(self):
+        cache = RenderCache(0, self.directory.name)
+        self.assertEqual(render(CachedMarkdown(1, CONTENT, cache)), render(Markdown(CONTENT)))
+        self.assertListEqual(os.listdir(self.directory.name), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,20 @@
+import os
+import tempfile
 import unittest
 from datetime import datetime
+from typing import Iterable
 
 from codenotes import parse_args
-from codenotes.cli.tasks import CreateTask, SearchTask
+from codenotes.cli.tasks import CreateTask, ImportTask, SearchTask, guess_import_format
+from codenotes.db.entities import Task
 from codenotes.exceptions import CategoryNotExistsError
 
 
+def task_values(tasks: Iterable[Task]) -> list[tuple]:
+    """Returns the content, status, creation date and category of the tasks"""
+    return [(task.content, task.status, task.creation, task.category) for task in tasks]
+
+
 class TestCreateTask(unittest.TestCase):
     # ! format_task_text function is indirectly tested
     def test_add_bad_input_task(self):
@@ -52,9 +61,57 @@ class TestCreateTask(unittest.TestCase):
         self.assertEqual(add_task.task, "New task #1")
 
 
+class TestImportTask(unittest.TestCase):
+    def test_guess_format(self):
+        self.assertEqual(guess_import_format("tasks.csv"), "csv")
+        self.assertEqual(guess_import_format("tasks.JSONL"), "jsonl")
+        self.assertEqual(guess_import_format("tasks.txt"), "lines")
+        self.assertEqual(guess_import_format(None), "lines")
+
+    def test_import_invalid_rows(self):
+        """Test that rows without content or with an invalid status are skipped"""
+        with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False) as file:
+            file.write("content,category,status\n,Empty,0\nBad status,Work,9\n")
+
+        try:
+            args = parse_args(["task", "import", file.name])
+            import_task = ImportTask(args)
+        finally:
+            os.remove(file.name)
+
+        self.assertEqual(import_task.import_format, "csv")
+        self.assertEqual(import_task.imported, 0)
+        self.assertEqual(import_task.skipped, 2)
+
+    def test_import_category_too_long(self):
+        """Test that the import fails before reading the file when its category name is too long"""
+        args = parse_args(["task", "import", "missing.txt", "--category", "Category name over thirty characters"])
+
+        with self.assertRaises(SystemExit) as context:
+            ImportTask(args)
+
+        self.assertEqual(context.exception.code, 1)
+
+    def test_import_invalid_json_values(self):
+        """Test that JSON rows whose content or category aren't strings are skipped"""
+        with tempfile.NamedTemporaryFile("w", suffix=".jsonl", delete=False) as file:
+            file.write('{"content": "Number category", "category": 5}\n{"content": 5}\n')
+            file.write('{"content": "List category", "category": ["Work"]}\n')
+
+        try:
+            args = parse_args(["task", "import", file.name])
+            import_task = ImportTask(args)
+        finally:
+            os.remove(file.name)
+
+        self.assertEqual(import_task.import_format, "jsonl")
+        self.assertEqual(import_task.imported, 0)
+        self.assertEqual(import_task.skipped, 3)
+
+
 class TestSearchTask(unittest.TestCase):
     def setUp(self) -> None:
-        self.date = datetime.now().date().strftime("%Y-%m-%d")
+        self.date = datetime.now().date()
         self.default_category_name = "TODO Tasks"
 
     def test_search_by_category(self):
@@ -64,7 +121,7 @@ class TestSearchTask(unittest.TestCase):
         ]
 
         args = parse_args(["task", "search", "--category", "CLI", "Category", "--ever"])
-        query = SearchTask(args).sql_query()
+        query = task_values(SearchTask(args).sql_query())
 
         self.assertCountEqual(query, expected_tasks)
 
@@ -82,7 +139,7 @@ class TestSearchTask(unittest.TestCase):
             ("CLI task", 0, self.date, "CLI Category"),
             ("Task in same category", 0, self.date, "CLI Category"),
         ]
-        query = SearchTask(args).sql_query()
+        query = task_values(SearchTask(args).sql_query())
 
         self.assertCountEqual(query, expected_tasks)
 
@@ -101,16 +158,38 @@ class TestSearchTask(unittest.TestCase):
         ]
 
         args = parse_args(["task", "search", "--month"])
-        query = SearchTask(args).sql_query()
+        query = task_values(SearchTask(args).sql_query())
 
         self.assertCountEqual(query, expected_tasks)
 
+    def test_search_paginated(self):
+        """Test that tasks are ordered by category and paginated with limit, offset and after"""
+        expected_tasks = [
+            ("Task in same category", 0, self.date, "CLI Category"),
+            ("New task #2", 0, self.date, self.default_category_name),
+        ]
+
+        args = parse_args(["task", "search", "--ever", "--limit", "2", "--offset", "1"])
+        query = task_values(SearchTask(args).sql_query())
+
+        self.assertListEqual(query, expected_tasks)
+
+        expected_tasks = [
+            ("New task #3", 0, self.date, self.default_category_name),
+            ("New task #1", 0, self.date, self.default_category_name),
+        ]
+
+        args = parse_args(["task", "search", "--ever", "--limit", "2", "--after", "1"])
+        query = task_values(SearchTask(args).sql_query())
+
+        self.assertListEqual(query, expected_tasks)
+
     def test_search_text_date(self):
         """Test that search only one task by keywords and date in common"""
 
         expected_tasks = [("Different task", 0, self.date, self.default_category_name)]
         args = parse_args(["task", "search", "Different", "--today"])
-        query = SearchTask(args).sql_query()
+        query = task_values(SearchTask(args).sql_query())
 
         self.assertCountEqual(query, expected_tasks)
 
@@ -122,7 +201,23 @@ class TestSearchTask(unittest.TestCase):
             ("New task #3", 0, self.date, self.default_category_name),
         ]
         args = parse_args(["task", "search", "New", "task"])
-        query = SearchTask(args).sql_query()
+        query = task_values(SearchTask(args).sql_query())
+
+        self.assertCountEqual(query, expected_tasks)
+
+    def test_search_text_infix(self):
+        """Test that search the tasks that contain a part of a word, or match a GLOB pattern"""
+        expected_tasks = [
+            ("New task #2", 0, self.date, self.default_category_name),
+            ("New task #3", 0, self.date, self.default_category_name),
+        ]
+        args = parse_args(["task", "search", "sk #", "--match", "infix", "--ever"])
+        query = task_values(SearchTask(args).sql_query())
+
+        self.assertCountEqual(query, [("New task #1", 0, self.date, self.default_category_name), *expected_tasks])
+
+        args = parse_args(["task", "search", "New*#[23]", "--match", "glob", "--ever"])
+        query = task_values(SearchTask(args).sql_query())
 
         self.assertCountEqual(query, expected_tasks)
 
@@ -138,7 +233,7 @@ class TestSearchTask(unittest.TestCase):
         ]
 
         args = parse_args(["task", "search", "--today"])
-        query = SearchTask(args).sql_query()
+        query = task_values(SearchTask(args).sql_query())
 
         self.assertCountEqual(query, expected_tasks)
 
@@ -146,7 +241,7 @@ class TestSearchTask(unittest.TestCase):
         expected_tasks = []
 
         args = parse_args(["task", "search", "--yesterday"])
-        query = SearchTask(args).sql_query()
+        query = task_values(SearchTask(args).sql_query())
 
         self.assertCountEqual(query, expected_tasks)
 
@@ -0,0 +1,109 @@
+import gzip
+import io
+import json
+import os
+import tempfile
+import unittest
+
+import codenotes.db.utilities.tasks as tasks
+from codenotes.db.backup import backup_database, export_database, restore_database
+from codenotes.db.connection import SQLiteConnection
+from codenotes.db.repository import NoteRepository, TaskRepository
+from codenotes.exceptions import InvalidBackupError
+
+
+class TestBackup(unittest.TestCase):
+    def setUp(self) -> None:
+        self.db = SQLiteConnection(":memory:")
+        TaskRepository(self.db).create(["Write the docs", "Release the project"], 1)
+        NoteRepository(self.db).create("Ideas", "Search notes by their title", 1, True)
+        self.db.commit()
+
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.db.close()
+        self.directory.cleanup()
+
+    def test_backup(self):
+        path = os.path.join(self.directory.name, "backup.db")
+        steps = []
+
+        backup_database(self.db, path, pages=1, progress=lambda copied, total: steps.append((copied, total)))
+
+        copy = SQLiteConnection(path)
+        self.assertListEqual(
+            [task.content for task in TaskRepository(copy).search()], ["Write the docs", "Release the project"]
+        )
+        copy.close()
+
+        self.assertGreater(len(steps), 1)
+        self.assertEqual(steps[-1][0], steps[-1][1])
+        self.assertFalse(os.path.exists(f"{path}.tmp"))
+
+    def test_export_restore(self):
+        export = io.BytesIO()
+        self.assertEqual(export_database(self.db, export), 5)  # Two default categories, two tasks and a note
+
+        restored = SQLiteConnection(":memory:")
+        export.seek(0)
+        self.assertEqual(restore_database(restored, export), 5)
+
+        self.assertListEqual(list(TaskRepository(restored).search()), list(TaskRepository(self.db).search()))
+        self.assertListEqual(list(NoteRepository(restored).search()), list(NoteRepository(self.db).search()))
+        self.assertEqual([note.title for note in NoteRepository(restored).search(text="title")], ["Ideas"])
+        restored.close()
+
+    def test_restore_not_empty(self):
+        export = io.BytesIO()
+        export_database(self.db, export)
+
+        export.seek(0)
+        with self.assertRaises(InvalidBackupError):
+            restore_database(self.db, export)
+
+        export.seek(0)
+        self.assertEqual(restore_database(self.db, export, replace=True), 5)
+        self.assertEqual(len(list(TaskRepository(self.db).search())), 2)
+
+    def test_restore_invalid(self):
+        with self.assertRaises(InvalidBackupError):
+            restore_database(self.db, io.BytesIO(b"Not an export"))
+
+        newer = io.BytesIO(gzip.compress(b'{"codenotes": "export", "schema": 1000}\n'))
+        with self.assertRaises(InvalidBackupError):
+            restore_database(self.db, newer, replace=True)
+
+        damaged = io.BytesIO(gzip.compress(b'{"codenotes": "export", "schema": 1}\n{"table": "sqlite_master"}\n'))
+        with self.assertRaises(InvalidBackupError):
+            restore_database(self.db, damaged, replace=True)
+
+        self.assertEqual(len(list(TaskRepository(self.db).search())), 2)  # Rolled back
+
+    def damaged_export(self, change) -> io.BytesIO:
+        """Returns an export of the database where the first task row is changed"""
+        export = io.BytesIO()
+        export_database(self.db, export)
+
+        lines = gzip.decompress(export.getvalue()).decode("utf-8").splitlines()
+        tables = [row.get("table") if isinstance(row, dict) else None for row in map(json.loads, lines)]
+        table_line = tables.index(tasks.TABLE_NAME)
+        lines[table_line + 1] = json.dumps(change(json.loads(lines[table_line + 1])))
+
+        return io.BytesIO(gzip.compress("\n".join(lines).encode("utf-8")))
+
+    def test_restore_truncated_row(self):
+        with self.assertRaises(InvalidBackupError):
+            restore_database(self.db, self.damaged_export(lambda row: row[:-1]), replace=True)
+
+        self.assertEqual(len(list(TaskRepository(self.db).search())), 2)
+
+    def test_restore_constraint_violated(self):
+        with self.assertRaises(InvalidBackupError):
+            restore_database(self.db, self.damaged_export(lambda row: [None] * len(row)), replace=True)
+
+        self.assertEqual(len(list(TaskRepository(self.db).search())), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
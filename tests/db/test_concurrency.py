@@ -0,0 +1,68 @@
+import os
+import tempfile
+import threading
+import unittest
+
+import codenotes.db.utilities.tasks as tasks
+from codenotes.db.connection import SQLiteConnection
+
+
+class TestConcurrency(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.database_path = os.path.join(self.directory.name, "codenotes.db")
+        SQLiteConnection(self.database_path).close()  # Creates the database
+
+    def test_readers_and_writer(self):
+        """Test that readers and a writer, each one with its own connection, work without lock errors"""
+        errors = []
+        writing = threading.Event()
+        writing.set()
+
+        def writer() -> None:
+            db = SQLiteConnection(self.database_path)
+            try:
+                sql = (
+                    f"INSERT INTO {tasks.TABLE_NAME} ({tasks.COLUMN_CONTENT}, {tasks.COLUMN_CREATION}, "
+                    f"{tasks.COLUMN_CATEGORY}) VALUES (?, date('now'), 1)"
+                )
+                for i in range(200):
+                    db.exec_sql(sql, (f"Task #{i}",))
+                    db.commit()
+            except Exception as error:
+                errors.append(error)
+            finally:
+                writing.clear()
+                db.close()
+
+        def reader() -> None:
+            db = SQLiteConnection(self.database_path)
+            try:
+                while writing.is_set():
+                    db.exec_sql(f"SELECT COUNT(*) FROM {tasks.TABLE_NAME}").fetchone()
+            except Exception as error:
+                errors.append(error)
+            finally:
+                db.close()
+
+        threads = [threading.Thread(target=reader) for _ in range(3)]
+        threads.append(threading.Thread(target=writer))
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertListEqual(errors, [])
+
+        db = SQLiteConnection(self.database_path)
+        self.assertEqual(db.exec_sql("PRAGMA journal_mode").fetchone()[0], "wal")
+        self.assertEqual(db.exec_sql(f"SELECT COUNT(*) FROM {tasks.TABLE_NAME}").fetchone()[0], 200)
+        db.close()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from codenotes.db.connection import (SQLiteConnection, _close_at_exit, close_connection, get_connection,
+                                     set_database_path, shared_connection)
+from codenotes.db.repository import TaskRepository
+
+
+class TestSharedConnection(unittest.TestCase):
+    def test_same_connection(self):
+        self.assertIs(get_connection(), get_connection())
+
+    def test_context_manager_closes(self):
+        close_connection()
+
+        with shared_connection() as db:
+            self.assertIs(db, get_connection())
+
+        self.assertIsNot(get_connection(), db)
+
+    def test_nested_context_manager(self):
+        """Test that the context manager doesn't close a connection opened before"""
+        db = get_connection()
+
+        with shared_connection() as shared_db:
+            self.assertIs(shared_db, db)
+
+        self.assertIs(get_connection(), db)
+
+
+class TestSharedConnectionChanges(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.database_path = os.path.join(directory.name, "codenotes.db")
+
+        close_connection()
+        set_database_path(self.database_path)
+        self.addCleanup(set_database_path, None)
+        self.addCleanup(close_connection)
+
+    def tasks_count(self) -> int:
+        db = SQLiteConnection(self.database_path)
+        self.addCleanup(db.close)
+        return len(list(TaskRepository(db).search()))
+
+    def test_committed(self):
+        with shared_connection() as db:
+            TaskRepository(db).create(["Saved"], 1)
+
+        self.assertEqual(self.tasks_count(), 1)
+
+    def test_rolled_back_after_exception(self):
+        with self.assertRaises(ValueError):
+            with shared_connection() as db:
+                TaskRepository(db).create(["Half written"], 1)
+                raise ValueError("Failed halfway")
+
+        self.assertEqual(self.tasks_count(), 0)
+
+    def test_rolled_back_at_exit_after_exception(self):
+        TaskRepository(get_connection()).create(["Half written"], 1)
+
+        with mock.patch("sys.last_value", ValueError("Not handled"), create=True):
+            _close_at_exit()
+
+        self.assertEqual(self.tasks_count(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import copy
+import pickle
+import unittest
+from dataclasses import FrozenInstanceError
+from datetime import date
+
+from codenotes.db.connection import SQLiteConnection
+from codenotes.db.entities import Category, Note, NoteStats, NoteSummary, Task, TaskStats
+
+
+class TestEntities(unittest.TestCase):
+    def test_slotted_and_frozen(self):
+        task = Task(1, "Task", 0, "TODO Tasks", date(2021, 7, 1))
+
+        self.assertFalse(hasattr(task, "__dict__"))
+        with self.assertRaises(FrozenInstanceError):
+            task.status = 2
+
+        self.assertEqual(task, Task(1, "Task", 0, "TODO Tasks", date(2021, 7, 1)))
+        self.assertEqual(len({task, Task(1, "Task", 0, "TODO Tasks", date(2021, 7, 1))}), 1)
+
+    def test_copy_and_pickle(self):
+        entities = [
+            Category(1, "General"),
+            Task(1, "Task", 0, "TODO Tasks", date(2021, 7, 1)),
+            Note(1, "Note", None, "General", True, date(2021, 7, 1)),
+            NoteSummary(1, "Note", "General", date(2021, 7, 1)),
+            TaskStats("TODO Tasks", date(2021, 7, 1), 1, 2, 3),
+            NoteStats("General", date(2021, 7, 1), 1, 2),
+        ]
+
+        for entity in entities:
+            with self.subTest(entity=type(entity).__name__):
+                self.assertEqual(copy.copy(entity), entity)
+                self.assertEqual(copy.deepcopy(entity), entity)
+                self.assertEqual(pickle.loads(pickle.dumps(entity)), entity)
+
+    def test_row_factory(self):
+        db = SQLiteConnection(":memory:")
+
+        query = db.exec_sql("SELECT 1, 'Note', NULL, 'General', 1, '2021-07-01'", row_factory=Note.from_row)
+        self.assertEqual(query.fetchone(), Note(1, "Note", None, "General", True, date(2021, 7, 1)))
+
+        query = db.exec_sql("SELECT ?, ?", (2, "Work"), Category.from_row)
+        self.assertListEqual(list(query), [Category(2, "Work")])
+
+        db.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
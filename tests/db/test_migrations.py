@@ -0,0 +1,58 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import codenotes.db.utilities.tasks as tasks
+from codenotes.db.connection import SQLiteConnection
+from codenotes.db.migrations import SCHEMA_VERSION, migrate, schema_version, trigram_indexes_missing
+from codenotes.db.repository import TaskRepository
+
+
+class TestMigrations(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.database_path = os.path.join(self.directory.name, "codenotes.db")
+        SQLiteConnection(self.database_path).close()  # Creates the database
+
+        self.db = SQLiteConnection(self.database_path)
+
+    def test_up_to_date(self):
+        self.assertEqual(schema_version(self.db), SCHEMA_VERSION)
+
+    def test_migrate_up_to_date_database(self):
+        """Test that an up to date database isn't written"""
+        migrate(self.db)
+
+        self.assertFalse(self.db.connection.in_transaction)
+        self.assertEqual(self.db.connection.total_changes, 0)
+
+    def test_trigram_indexes_after_upgrade(self):
+        """Test that the trigram indexes are created when the database was migrated with a SQLite without them"""
+        database_path = os.path.join(self.directory.name, "old.db")
+        table_sql = "SELECT count(*) FROM sqlite_master WHERE name = ?"
+
+        with mock.patch("sqlite3.sqlite_version_info", (3, 31, 1)):
+            db = SQLiteConnection(database_path)
+            TaskRepository(db).create(["Refactoring"], 1)
+            db.commit()
+
+            self.assertEqual(schema_version(db), SCHEMA_VERSION)
+            self.assertEqual(db.exec_sql(table_sql, (tasks.TRIGRAM_TABLE_NAME,)).fetchone()[0], 0)
+            db.close()
+
+        db = SQLiteConnection(database_path)
+        self.addCleanup(db.close)
+
+        self.assertFalse(trigram_indexes_missing(db))
+        query = db.exec_sql(f"SELECT rowid FROM {tasks.TRIGRAM_TABLE_NAME}({'act'!r})")
+        self.assertEqual(len(query.fetchall()), 1)  # Filled with the tasks stored before
+
+    def tearDown(self) -> None:
+        self.db.close()
+        self.directory.cleanup()
+        del self.db
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,219 @@
+import os
+import tempfile
+import unittest
+from datetime import date
+
+import codenotes.db.utilities.tasks_categories as categories
+from codenotes.db.connection import SQLiteConnection, close_connection, get_connection
+from codenotes.db.entities import NoteStats, NoteSummary, TaskStats
+from codenotes.db.repository import CategoryRepository, NoteRepository, TaskRepository, get_category_repository
+from codenotes.exceptions import CategoryNotExistsError
+
+
+class TestCategoryRepository(unittest.TestCase):
+    def setUp(self) -> None:
+        self.db = SQLiteConnection(":memory:")
+        self.repository = CategoryRepository(categories.TABLE_NAME, self.db)
+
+        self.statements = []
+        self.db.connection.set_trace_callback(self.statements.append)
+
+    def tearDown(self) -> None:
+        self.db.close()
+
+    def test_categories_read_once(self):
+        self.assertEqual(self.repository.get_id("TODO Tasks"), 1)
+        self.assertTrue(self.repository.exists("TODO Tasks"))
+        self.assertEqual(self.repository.resolve(["TODO Tasks"]), {"TODO Tasks": 1})
+
+        self.assertEqual(len(self.statements), 1)
+
+    def test_add(self):
+        category_id = self.repository.add("Category's name")
+        self.statements.clear()
+
+        self.assertEqual(self.repository.get_id("Category's name"), category_id)
+        self.assertListEqual(self.statements, [])
+
+    def test_add_many(self):
+        ids = self.repository.add_many(["TODO Tasks", "First", "Second", "First"])
+
+        self.assertEqual(set(ids), {"First", "Second"})
+        self.assertEqual(self.repository.resolve(["First", "Missing"]), {"First": ids["First"]})
+        self.assertEqual(self.repository.add_many(["First", "TODO Tasks"]), {})
+
+    def test_add_many_in_bulk(self):
+        names = [f"Category {number}" for number in range(1200)]
+        self.repository.ids  # Reads the categories
+        self.statements.clear()
+
+        ids = self.repository.add_many(names)
+
+        self.assertEqual(len(ids), 1200)
+        self.assertEqual(len(set(ids.values())), 1200)
+        # Existence checked and ids read in 3 chunks each, and one executemany (traced once per name)
+        self.assertEqual(sum(statement.startswith("SELECT") for statement in self.statements), 6)
+        self.assertEqual(sum(statement.startswith("INSERT") for statement in self.statements), 1200)
+
+    def test_created_by_other_connection(self):
+        database_path = os.path.join(tempfile.mkdtemp(), "codenotes.db")
+        db = SQLiteConnection(database_path)
+        other_db = SQLiteConnection(database_path)
+
+        repository = CategoryRepository(categories.TABLE_NAME, db)
+        self.assertFalse(repository.exists("Other"))
+
+        CategoryRepository(categories.TABLE_NAME, other_db).add("Other")
+        other_db.commit()
+
+        self.assertTrue(repository.exists("Other"))
+
+        db.close()
+        other_db.close()
+
+
+class TestStats(unittest.TestCase):
+    def setUp(self) -> None:
+        self.db = SQLiteConnection(":memory:")
+
+        work_id = CategoryRepository(categories.TABLE_NAME, self.db).add("Work")
+        tasks = TaskRepository(self.db)
+        tasks.create(["First", "Second"], creation=date(2021, 7, 5))  # Monday
+        tasks.create(["Third"], creation=date(2021, 7, 11))  # Sunday of the same week
+        tasks.create(["Fourth"], work_id, creation=date(2021, 8, 2))
+        self.db.exec_sql("UPDATE cn_tasks SET cn_task_status = 2 WHERE cn_task_content = 'Second'")
+
+        notes = NoteRepository(self.db)
+        notes.create("Plain", creation=date(2021, 7, 5))
+        notes.create("Markdown", markdown=True, creation=date(2021, 7, 6))
+
+    def tearDown(self) -> None:
+        self.db.close()
+
+    def test_tasks_by_week(self):
+        self.assertListEqual(
+            list(TaskRepository(self.db).stats("week")),
+            [TaskStats("TODO Tasks", date(2021, 7, 5), 2, 0, 1), TaskStats("Work", date(2021, 8, 2), 1, 0, 0)],
+        )
+
+    def test_notes_by_day_and_month(self):
+        self.assertListEqual(
+            list(NoteRepository(self.db).stats("day")),
+            [NoteStats("General", date(2021, 7, 5), 1, 0), NoteStats("General", date(2021, 7, 6), 0, 1)],
+        )
+        self.assertListEqual(
+            list(NoteRepository(self.db).stats("month")), [NoteStats("General", date(2021, 7, 1), 1, 1)]
+        )
+
+    def test_unknown_period(self):
+        with self.assertRaises(ValueError):
+            TaskRepository(self.db).stats("year")
+
+
+class TestNoteRepository(unittest.TestCase):
+    def setUp(self) -> None:
+        self.db = SQLiteConnection(":memory:")
+        self.repository = NoteRepository(self.db)
+
+        self.note = self.repository.create("Long note", "Content " * 10_000, markdown=True, creation=date(2021, 7, 5))
+        self.repository.create("Short note", creation=date(2021, 7, 6))
+
+        self.statements = []
+        self.db.connection.set_trace_callback(self.statements.append)
+
+    def tearDown(self) -> None:
+        self.db.close()
+
+    def test_get(self):
+        self.assertEqual(self.repository.get(self.note.id), self.note)
+        self.assertIsNone(self.repository.get(1000))
+
+    def test_create_unknown_category(self):
+        with self.assertRaises(CategoryNotExistsError):
+            self.repository.create("Lost note", category_id=1000)
+        with self.assertRaises(CategoryNotExistsError):
+            TaskRepository(self.db).create(["Lost task"], category_id=1000)
+
+    def test_search_summaries(self):
+        filters = {"since": date(2021, 7, 1), "until": date(2021, 7, 31), "sort": "title"}
+        summaries = list(self.repository.search_summaries(**filters))
+
+        self.assertListEqual(
+            summaries,
+            [
+                NoteSummary(note.id, note.title, note.category, note.creation)
+                for note in self.repository.search(**filters)
+            ],
+        )
+
+        # The notes aren't read, only the index with its title
+        plan = self.db.exec_sql(f"EXPLAIN QUERY PLAN {self.statements[0]}").fetchall()
+        self.assertIn("USING COVERING INDEX", " ".join(row[3] for row in plan if "cn_notes " in row[3]))
+
+
+class TestSubstringSearch(unittest.TestCase):
+    def setUp(self) -> None:
+        self.db = SQLiteConnection(":memory:")
+
+        TaskRepository(self.db).create(["Fix ERR-0x1A2B in the parser", "Release 50% of the features", "Write docs"])
+        NoteRepository(self.db).create("Paths", "The config is read from src/codenotes/config.py")
+        NoteRepository(self.db).create("Errors_log", "Nothing yet")
+
+        self.statements = []
+        self.db.connection.set_trace_callback(self.statements.append)
+
+    def tearDown(self) -> None:
+        self.db.close()
+
+    def search(self) -> tuple[list[str], list[str], list[str], list[str]]:
+        """Searches tasks and notes by infix and by GLOB pattern"""
+        task_repository, note_repository = TaskRepository(self.db), NoteRepository(self.db)
+
+        return (
+            [task.content for task in task_repository.search(text="0x1a2", match="infix")],
+            [task.content for task in task_repository.search(text="0%", match="infix")],
+            [note.title for note in note_repository.search(text="*src/*.py", match="glob")],
+            [note.title for note in note_repository.search(text="s_l", match="infix")],
+        )
+
+    def test_trigram_index(self):
+        expected = (["Fix ERR-0x1A2B in the parser"], ["Release 50% of the features"], ["Paths"], ["Errors_log"])
+        self.assertTupleEqual(self.search(), expected)
+        searches = [statement for statement in self.statements if " INNER JOIN " in statement]
+        self.assertEqual(len(searches), 4)
+        self.assertTrue(all("_trigram WHERE" in statement for statement in searches))
+
+    def test_without_trigram_index(self):
+        expected = self.search()
+
+        for table in ("cn_tasks_trigram", "cn_notes_trigram"):
+            self.db.exec_sql(f"DROP TABLE {table}")
+        self.statements.clear()
+
+        self.assertTupleEqual(self.search(), expected)
+        self.assertFalse(any("_trigram WHERE" in statement for statement in self.statements))
+
+    def test_glob_case_sensitive(self):
+        self.assertListEqual(list(TaskRepository(self.db).search(text="*err-*", match="glob")), [])
+
+    def test_unknown_match(self):
+        with self.assertRaises(ValueError):
+            list(TaskRepository(self.db).search(text="docs", match="regexp"))
+
+
+class TestSharedCategoryRepository(unittest.TestCase):
+    def test_same_repository(self):
+        repository = get_category_repository(categories.TABLE_NAME)
+
+        self.assertIs(get_category_repository(categories.TABLE_NAME), repository)
+        self.assertIs(repository.db, get_connection())
+
+    def test_new_connection(self):
+        repository = get_category_repository(categories.TABLE_NAME)
+        close_connection()
+
+        self.assertIsNot(get_category_repository(categories.TABLE_NAME), repository)
+
+
+if __name__ == "__main__":
+    unittest.main()
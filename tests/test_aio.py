@@ -0,0 +1,117 @@
+import asyncio
+import os
+import sqlite3
+import tempfile
+import unittest
+from datetime import date
+from unittest import mock
+
+from codenotes.aio import Codenotes
+from codenotes.db.entities import Category, Note, Task
+from codenotes.exceptions import CategoryNotExistsError
+
+
+class TestCodenotes(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.database_path = os.path.join(directory.name, "codenotes.db")
+
+    def run_async(self, coroutine_function):
+        async def run():
+            async with Codenotes(self.database_path) as codenotes:
+                return await coroutine_function(codenotes)
+
+        return asyncio.run(run())
+
+    def test_create_and_search_tasks(self):
+        async def create_and_search(codenotes: Codenotes):
+            task = await codenotes.create_task("Write the docs", category="Docs")
+            await codenotes.create_task("Review it's fine")
+
+            return task, await codenotes.search_tasks("docs"), await codenotes.search_tasks(category="Docs")
+
+        task, found_by_text, found_by_category = self.run_async(create_and_search)
+
+        self.assertIsInstance(task, Task)
+        self.assertEqual(task.category, "Docs")
+        self.assertEqual(task.status, 0)
+        self.assertEqual(task.creation, date.today())
+        self.assertListEqual(found_by_text, [task])
+        self.assertListEqual(found_by_category, [task])
+
+    def test_category_stripped(self):
+        async def create_and_search(codenotes: Codenotes):
+            task = await codenotes.create_task("Write the docs", category=" Docs ")
+            note = await codenotes.create_note("Docs", category=" Docs ")
+
+            return task, note, await codenotes.list_categories("task"), await codenotes.list_categories("note")
+
+        task, note, task_categories, note_categories = self.run_async(create_and_search)
+
+        self.assertEqual(task.category, "Docs")
+        self.assertEqual(note.category, "Docs")
+        self.assertListEqual([category.name for category in task_categories], ["TODO Tasks", "Docs"])
+        self.assertListEqual([category.name for category in note_categories], ["General", "Docs"])
+
+    def test_concurrent_callers(self):
+        async def create_concurrently(codenotes: Codenotes):
+            await asyncio.gather(*(codenotes.create_task(f"Task {i}", category="Concurrent") for i in range(40)))
+            return await codenotes.search_tasks(category="Concurrent")
+
+        found = self.run_async(create_concurrently)
+
+        self.assertEqual(len(found), 40)
+        self.assertEqual(len({task.id for task in found}), 40)
+
+    def test_notes(self):
+        async def create_and_search(codenotes: Codenotes):
+            note = await codenotes.create_note("Title", "# Content", category="Markdown", markdown=True)
+            return note, await codenotes.search_notes(since=date.today(), until=date.today())
+
+        note, found = self.run_async(create_and_search)
+
+        self.assertIsInstance(note, Note)
+        self.assertTrue(note.markdown)
+        self.assertListEqual(found, [note])
+
+    def test_categories(self):
+        async def create_and_list(codenotes: Codenotes):
+            category = await codenotes.create_category("Ideas", annotation="note")
+            same_category = await codenotes.create_category("Ideas", annotation="note")
+
+            return category, same_category, await codenotes.list_categories("note")
+
+        category, same_category, categories = self.run_async(create_and_list)
+
+        self.assertEqual(category, same_category)
+        self.assertListEqual(categories, [Category(1, "General"), category])
+
+    def test_rollback(self):
+        async def fail_and_create(codenotes: Codenotes):
+            with mock.patch("codenotes.aio.TaskRepository.create", side_effect=sqlite3.OperationalError("Failed")):
+                with self.assertRaises(sqlite3.OperationalError):
+                    await codenotes.create_task("Task", category="Rolled back")
+
+            task = await codenotes.create_task("Task", category="Rolled back")
+            return task, await codenotes.list_categories(), await codenotes.search_tasks(category="Rolled back")
+
+        async def run():
+            async with Codenotes(self.database_path, max_workers=1) as codenotes:  # The same thread
+                return await fail_and_create(codenotes)
+
+        task, categories, found = asyncio.run(run())
+
+        self.assertIn("Rolled back", [category.name for category in categories])
+        self.assertListEqual(found, [task])
+
+    def test_category_not_exists(self):
+        with self.assertRaises(CategoryNotExistsError):
+            self.run_async(lambda codenotes: codenotes.search_tasks(category="Missing"))
+
+    def test_memory_database(self):
+        self.assertEqual(Codenotes(":memory:", max_workers=8).max_workers, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import os
+import unittest
+from configparser import ConfigParser
+from unittest import mock
+
+from codenotes.config import DEFAULT_PRAGMAS, MEMORY_DATABASE, database_path, database_pragmas, render_cache_size
+from codenotes.exceptions import InvalidConfigError
+
+
+class TestDatabasePragmas(unittest.TestCase):
+    def setUp(self) -> None:
+        self.config_patch = mock.patch("codenotes.config._config", ConfigParser())  # Without configuration file
+        self.config_patch.start()
+
+    def test_defaults(self):
+        self.assertDictEqual(database_pragmas(), DEFAULT_PRAGMAS)
+
+    def test_environment_variable(self):
+        with mock.patch.dict(os.environ, {"CODENOTES_SYNCHRONOUS": "FULL"}):
+            self.assertEqual(database_pragmas()["synchronous"], "FULL")
+
+    def test_invalid_value(self):
+        with mock.patch.dict(os.environ, {"CODENOTES_CACHE_SIZE": "1; DROP TABLE cn_tasks"}):
+            with self.assertRaises(InvalidConfigError):
+                database_pragmas()
+
+    def test_render_cache_size(self):
+        with mock.patch.dict(os.environ, {"CODENOTES_RENDER_CACHE_SIZE": "1024"}):
+            self.assertEqual(render_cache_size(), 1024)
+
+        with mock.patch.dict(os.environ, {"CODENOTES_RENDER_CACHE_SIZE": "-1"}):
+            with self.assertRaises(InvalidConfigError):
+                render_cache_size()
+
+    def tearDown(self) -> None:
+        self.config_patch.stop()
+
+
+class TestDatabasePath(unittest.TestCase):
+    def setUp(self) -> None:
+        self.config_patch = mock.patch("codenotes.config._config", ConfigParser())  # Without configuration file
+        self.config_patch.start()
+
+    def test_path(self):
+        self.assertEqual(database_path("/tmp/notes.db"), "/tmp/notes.db")
+        self.assertEqual(database_path(MEMORY_DATABASE), MEMORY_DATABASE)
+
+    def test_environment_variable(self):
+        with mock.patch.dict(os.environ, {"CODENOTES_DB": "/tmp/env.db"}):
+            self.assertEqual(database_path(), "/tmp/env.db")
+
+    def test_default(self):
+        with mock.patch.dict(os.environ, {"XDG_DATA_HOME": "/tmp/data"}):
+            del os.environ["CODENOTES_DB"]
+
+            with mock.patch("codenotes.config.LEGACY_DATABASE_PATH", "/nonexistent/codenotes.db"):
+                self.assertEqual(database_path(), "/tmp/data/codenotes/codenotes.db")
+
+    def test_store(self):
+        with mock.patch.dict(os.environ, {"XDG_DATA_HOME": "/tmp/data"}):
+            self.assertEqual(database_path(store="work"), "/tmp/data/codenotes/work.db")
+
+        with self.assertRaises(InvalidConfigError):
+            database_path(store="../work")
+
+    def tearDown(self) -> None:
+        self.config_patch.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+import io
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import codenotes.db.utilities.tasks_categories as tasks_categories
+from codenotes.cli.serve import Serve
+from codenotes.config import MEMORY_DATABASE
+from codenotes.daemon import forwardable, owned_socket, run_client
+from codenotes.db.connection import get_connection
+from codenotes.db.repository import CategoryRepository
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestForwardable(unittest.TestCase):
+    def test_commands_forwarded(self):
+        self.assertTrue(forwardable(["task", "search", "--today"]))
+        self.assertTrue(forwardable(["note", "create", "Text", "--category", "Notes"]))
+
+    def test_commands_run_locally(self):
+        self.assertFalse(forwardable([]))
+        self.assertFalse(forwardable(["--version"]))
+        self.assertFalse(forwardable(["serve"]))
+        self.assertFalse(forwardable(["task", "create", "Text", "--preview"]))
+        self.assertFalse(forwardable(["task", "import", "tasks.csv"]))
+        self.assertFalse(forwardable(["--db", "other.db", "task", "search", "--today"]))
+
+
+class TestRunRequest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.serve = Serve.__new__(Serve)  # Without listening on a socket
+        self.serve.db = get_connection()
+        self.serve.database_path = MEMORY_DATABASE
+
+    def run_request(self, *argv: str) -> str:
+        response = io.BytesIO()
+        self.serve.run_request({"argv": list(argv), "database": MEMORY_DATABASE}, response)
+        return response.getvalue().decode("utf-8")
+
+    def test_rollback(self):
+        argv = ("category", "create", "Rolled", "back", "--task")
+
+        with mock.patch("codenotes.cli.PrintFormatted.print_category_creation", side_effect=BrokenPipeError):
+            self.run_request(*argv)  # The client closed the connection before the commit
+        output = self.run_request(*argv)
+
+        self.assertNotIn("already exists", output)
+        self.assertTrue(CategoryRepository(tasks_categories.TABLE_NAME, self.serve.db).exists("Rolled back"))
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix sockets are not supported")
+class TestOwnedSocket(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+
+        self.socket_path = os.path.join(directory, "codenotes.sock")
+        self.server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.server.bind(self.socket_path)
+        self.addCleanup(self.server.close)
+
+        self.file_path = os.path.join(directory, "codenotes.db")
+        open(self.file_path, "w").close()
+
+    def test_owned_socket(self):
+        self.assertTrue(owned_socket(self.socket_path))
+
+    def test_not_owned(self):
+        self.assertFalse(owned_socket(self.file_path))
+        self.assertFalse(owned_socket(self.socket_path + ".missing"))
+
+        with mock.patch("os.getuid", return_value=os.getuid() + 1):  # Created by another user
+            self.assertFalse(owned_socket(self.socket_path))
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix sockets are not supported")
+class TestDaemon(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+
+        self.socket_path = os.path.join(directory, "codenotes.sock")
+        self.environment = {
+            **os.environ,
+            "CODENOTES_DB": os.path.join(directory, "codenotes.db"),
+            "CODENOTES_SOCKET": self.socket_path,
+            "PYTHONPATH": ROOT_DIR,
+        }
+
+        self.daemon = subprocess.Popen(
+            [sys.executable, "-m", "codenotes", "serve"],
+            env=self.environment,
+            stdin=subprocess.PIPE,  # Never written, a prompt that read it would wait forever
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        self.addCleanup(self.daemon.stdin.close)
+        self.addCleanup(self.stop_daemon)
+
+        for _ in range(100):
+            if os.path.exists(self.socket_path):
+                break
+            time.sleep(0.05)
+        else:
+            self.fail("The daemon didn't create the socket")
+
+    def stop_daemon(self) -> None:
+        self.daemon.terminate()
+        self.daemon.wait(5)
+
+    def run_codenotes(self, *args: str) -> str:
+        return subprocess.run(
+            [sys.executable, "-m", "codenotes", *args],
+            env=self.environment,
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=10,
+        ).stdout
+
+    def run_client(self, *args: str) -> tuple[bool, str]:
+        """Runs a command with the client, returning if the daemon ran it and the output received"""
+        output = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+
+        with mock.patch.dict(os.environ, self.environment), mock.patch("sys.stdout", output):
+            done = run_client(list(args))
+
+        return done, output.buffer.getvalue().decode("utf-8")
+
+    def test_command_run_by_daemon(self):
+        self.run_codenotes("task", "create", "Task", "from", "the", "client")
+        done, output = self.run_client("task", "search", "--ever", "-f", "jsonl")
+
+        self.assertTrue(done)
+        self.assertIn('"content": "Task from the client"', output)
+        self.assertIsNone(self.daemon.poll())
+
+    def test_category_created_by_daemon(self):
+        done, output = self.run_client("task", "create", "Task", "--category", "Daemon")
+
+        self.assertTrue(done)
+        self.assertIn("Daemon", output)
+        self.assertIn('"category": "Daemon"', self.run_codenotes("task", "search", "--ever", "-f", "jsonl"))
+
+    def test_command_run_locally(self):
+        self.assertFalse(self.run_client("task", "create", "Task", "--preview")[0])
+
+    def test_prompt_without_input(self):
+        done, output = self.run_client("task", "create", "Task", "--category", "Category name over thirty characters")
+
+        self.assertTrue(done)
+        self.assertIn("No input to answer the prompt", output)
+        self.assertNotIn("Task", self.run_codenotes("task", "search", "--ever", "-f", "jsonl"))
+        self.assertIsNone(self.daemon.poll())
+
+    def test_socket_removed(self):
+        self.stop_daemon()
+
+        self.assertFalse(os.path.exists(self.socket_path))
+
+
+if __name__ == "__main__":
+    unittest.main()
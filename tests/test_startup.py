@@ -0,0 +1,63 @@
+import os
+import subprocess
+import sys
+import unittest
+
+# Cumulative import time (in microseconds) allowed for codenotes, it can be changed through an environment variable for
+# slow machines
+IMPORT_TIME_BUDGET = int(os.environ.get("CODENOTES_IMPORT_TIME_BUDGET", 75_000))
+
+# Modules that must only be imported when a command is dispatched, or sent to the daemon (see codenotes.daemon)
+LAZY_MODULES = ("rich", "sqlite3", "codenotes.cli", "codenotes.db", "codenotes.config", "tempfile", "socket",
+                "json", "csv")
+
+
+def import_times(*args: str) -> dict[str, int]:
+    """Runs codenotes with -X importtime and returns the cumulative import time of each module imported
+
+    Parameters
+    ----------
+    args: str
+        Arguments passed to the interpreter after -X importtime
+
+    Returns
+    -------
+    times: dict[str, int]
+        Cumulative import time in microseconds of each module
+    """
+    root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        cwd=root_dir,
+    )
+
+    times = {}
+    for line in process.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, module = line.split("|")
+            if cumulative.strip().isdigit():
+                times[module.strip()] = int(cumulative)
+
+    return times
+
+
+class TestStartup(unittest.TestCase):
+    def test_import_budget(self):
+        times = import_times("-c", "import codenotes")
+
+        self.assertLess(times["codenotes"], IMPORT_TIME_BUDGET)
+
+    def test_version_is_lazy(self):
+        """Test that --version doesn't import rich, sqlite nor the subcommand modules"""
+        times = import_times("-m", "codenotes", "--version")
+
+        for module in times:
+            self.assertFalse(
+                module.startswith(LAZY_MODULES), f"{module} imported by --version"
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import io
+import json
+import unittest
+
+from codenotes.util.formats import write_rows
+
+COLUMNS = ("id", "content")
+ROWS = [(1, "First task"), (2, 'Task with "quotes", and commas')]
+
+
+class TestWriteRows(unittest.TestCase):
+    def test_json(self):
+        output = io.StringIO()
+        count = write_rows(iter(ROWS), COLUMNS, "json", output)
+
+        self.assertEqual(count, 2)
+        self.assertListEqual(
+            json.loads(output.getvalue()),
+            [{"id": 1, "content": "First task"}, {"id": 2, "content": 'Task with "quotes", and commas'}],
+        )
+
+    def test_json_empty(self):
+        output = io.StringIO()
+        write_rows(iter([]), COLUMNS, "json", output)
+
+        self.assertListEqual(json.loads(output.getvalue()), [])
+
+    def test_jsonl(self):
+        output = io.StringIO()
+        write_rows(iter(ROWS), COLUMNS, "jsonl", output)
+
+        lines = output.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertDictEqual(json.loads(lines[1]), {"id": 2, "content": 'Task with "quotes", and commas'})
+
+    def test_csv(self):
+        output = io.StringIO()
+        write_rows(iter(ROWS), COLUMNS, "csv", output)
+
+        self.assertEqual(
+            output.getvalue(), 'id,content\n1,First task\n2,"Task with ""quotes"", and commas"\n'
+        )
+
+    def test_tsv(self):
+        output = io.StringIO()
+        write_rows(iter(ROWS[:1]), COLUMNS, "tsv", output)
+
+        self.assertEqual(output.getvalue(), "id\tcontent\n1\tFirst task\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+
+from codenotes.util.sql import Select, fts_match_text, like_pattern
+
+
+class TestFtsMatchText(unittest.TestCase):
+    def test_words(self):
+        self.assertEqual(fts_match_text("New task"), '"New"* "task"*')
+
+    def test_special_characters(self):
+        self.assertEqual(fts_match_text('say "hi" -x'), '"say"* """hi"""* "-x"*')
+
+    def test_empty(self):
+        self.assertEqual(fts_match_text("  "), "")
+
+
+class TestSelect(unittest.TestCase):
+    def test_constant_sql(self):
+        def build(text: str) -> Select:
+            return (
+                Select("id, name", "table_a")
+                .join("table_b", "table_a.id = table_b.id")
+                .where("name = ?", text)
+                .where("id >= ? AND id <= ?", 1, 10)
+                .order_by("name", "id")
+                .limit(5)
+            )
+
+        select = build("it's")
+
+        self.assertEqual(
+            select.sql(),
+            "SELECT id, name FROM table_a INNER JOIN table_b ON table_a.id = table_b.id "
+            "WHERE name = ? AND id >= ? AND id <= ? ORDER BY name, id LIMIT ? OFFSET ?",
+        )
+        self.assertEqual(select.values(), ("it's", 1, 10, 5, 0))
+        self.assertEqual(build('"quoted"').sql(), select.sql())
+
+    def test_without_clauses(self):
+        select = Select("id", "table_a").limit()
+
+        self.assertEqual(select.sql(), "SELECT id FROM table_a")
+        self.assertEqual(select.values(), ())
+
+    def test_group_by(self):
+        select = Select("name, COUNT(*)", "table_a").where("id > ?", 1).group_by("name").order_by("name")
+
+        self.assertEqual(
+            select.sql(), "SELECT name, COUNT(*) FROM table_a WHERE id > ? GROUP BY name ORDER BY name"
+        )
+
+    def test_placeholders_mismatch(self):
+        with self.assertRaises(ValueError):
+            Select("id", "table_a").where("id = ?")
+
+
+class TestLikePattern(unittest.TestCase):
+    def test_wildcards_escaped(self):
+        self.assertEqual(like_pattern("50%_off\\"), "%50\\%\\_off\\\\%")
+
+
+if __name__ == "__main__":
+    unittest.main()